@@ -2,6 +2,7 @@
 
 import asyncio
 import json
+from dataclasses import asdict
 from typing import Dict, List, Set
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
@@ -58,7 +59,7 @@ class CollaborativeSession:
         message = {
             "type": "schedule_update",
             "data": {
-                "assignments": [assignment.__dict__ for assignment in self.current_schedule],
+                "assignments": [asdict(assignment) for assignment in self.current_schedule],
                 "users": list(self.user_presences.keys())
             }
         }
@@ -105,7 +106,7 @@ class CollaborativeSession:
             await self.broadcast({
                 "type": "schedule_solved",
                 "user_id": user_id,
-                "assignments": [a.__dict__ for a in result.assignments],
+                "assignments": [asdict(a) for a in result.assignments],
                 "status": result.status
             })
         except Exception as e:
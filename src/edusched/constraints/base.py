@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from edusched.domain.assignment import Assignment
@@ -39,7 +39,20 @@ class ConstraintContext:
 
 
 class Constraint(ABC):
-    """Base class for all constraints."""
+    """Base class for all constraints.
+
+    Attributes:
+        depends_on_time: False if ``check`` depends only on the assignment's
+            request and assigned resources, not on its times or the rest of
+            the solution. Solvers may then reuse one result for every slot
+            tried with the same resources.
+        depends_on_resources: False if ``check`` never reads the assignment's
+            assigned resources. Solvers may then check a slot before choosing
+            resources for it.
+    """
+
+    depends_on_time: bool = True
+    depends_on_resources: bool = True
 
     @abstractmethod
     def check(
@@ -60,6 +73,66 @@ class Constraint(ABC):
             Violation object if constraint is violated, None otherwise
         """
 
+    def check_batch(
+        self,
+        assignments: List["Assignment"],
+        solution: List["Assignment"],
+        context: ConstraintContext,
+    ) -> List[Tuple["Assignment", Violation]]:
+        """
+        Check several assignments against this constraint in one call.
+
+        The default calls ``check`` for each assignment. Constraints that scan
+        the solution can override this to build their lookup structures once
+        per batch instead of once per assignment.
+
+        Args:
+            assignments: The assignments to check
+            solution: Current solution (all assignments so far)
+            context: Context with problem data
+
+        Returns:
+            (assignment, violation) pairs for the assignments that violate it
+        """
+        violations = []
+        for assignment in assignments:
+            violation = self.check(assignment, solution, context)
+            if violation:
+                violations.append((assignment, violation))
+        return violations
+
+    def applies_to(self, request_id: str) -> bool:
+        """
+        Tell whether assignments of a request can violate this constraint.
+
+        Solvers may skip the constraint for assignments of requests it does
+        not apply to. The default returns True.
+
+        Args:
+            request_id: ID of the request being scheduled
+
+        Returns:
+            False if ``check`` always passes for assignments of the request
+        """
+        return True
+
+    def cache_key(self, assignment: "Assignment") -> Optional[Hashable]:
+        """
+        Return the part of an assignment this constraint's verdict depends on.
+
+        Solvers may reuse the verdict of an earlier check for assignments with
+        an equal key, for as long as the problem and context stay the same.
+        The default returns None, meaning the verdict also depends on the rest
+        of the solution and must not be reused.
+
+        Args:
+            assignment: The assignment to be checked
+
+        Returns:
+            Hashable key, or None if the verdict cannot be reused
+        """
+        return None
+
     @abstractmethod
     def explain(self, violation: Violation) -> str:
         """
@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 class CapacityConstraint(Constraint):
     """Ensures assigned classroom can accommodate the class enrollment."""
 
+    depends_on_time = False
+
     def __init__(self, request_id: str, buffer_percent: float = 0.1):
         """
         Initialize capacity constraint.
@@ -91,6 +93,10 @@ class CapacityConstraint(Constraint):
 
         return None
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
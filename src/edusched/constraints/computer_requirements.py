@@ -11,6 +11,8 @@ if TYPE_CHECKING:
 class ComputerRequirements(Constraint):
     """Ensures session requirements for computer facilities are met."""
 
+    depends_on_time = False
+
     def __init__(self, request_id: str) -> None:
         self.request_id = request_id
 
@@ -128,6 +130,10 @@ class ComputerRequirements(Constraint):
 
         return None
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
@@ -141,6 +147,8 @@ class ComputerRequirements(Constraint):
 class AnyComputerAvailable(Constraint):
     """Constraint that ensures at least one room with computers is available in the solution."""
 
+    depends_on_time = False
+
     def __init__(self, request_id: str, min_computers: int = 1) -> None:
         self.request_id = request_id
         self.min_computers = min_computers
@@ -171,6 +179,10 @@ class AnyComputerAvailable(Constraint):
             message=f"No room with at least {self.min_computers} computers assigned",
         )
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
@@ -184,6 +196,8 @@ class AnyComputerAvailable(Constraint):
 class NoComputerRoom(Constraint):
     """Ensures session is scheduled in a room without computers."""
 
+    depends_on_time = False
+
     def __init__(self, request_id: str) -> None:
         self.request_id = request_id
 
@@ -212,6 +226,10 @@ class NoComputerRoom(Constraint):
 
         return None
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
@@ -54,6 +54,10 @@ class DaySpecificResourceRequirement(Constraint):
 
         return None
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
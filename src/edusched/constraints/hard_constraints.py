@@ -1,11 +1,16 @@
 """Hard constraint implementations."""
 
-from typing import TYPE_CHECKING, List, Optional
+from bisect import bisect_left
+from itertools import accumulate
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from edusched.constraints.base import Constraint, ConstraintContext, Violation
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from edusched.domain.assignment import Assignment
+    from edusched.domain.session_request import SessionRequest
 
 
 class NoOverlap(Constraint):
@@ -37,15 +42,53 @@ class NoOverlap(Constraint):
                         assignment.start_time < existing.end_time
                         and assignment.end_time > existing.start_time
                     ):
-                        return Violation(
-                            constraint_type=self.constraint_type,
-                            affected_request_id=assignment.request_id,
-                            affected_resource_id=self.resource_id,
-                            message=f"Resource {self.resource_id} is double-booked",
-                        )
+                        return self._double_booking(assignment)
 
         return None
 
+    def check_batch(
+        self,
+        assignments: List["Assignment"],
+        solution: List["Assignment"],
+        context: ConstraintContext,
+    ) -> List[Tuple["Assignment", Violation]]:
+        """Check several assignments against one sorted index of the resource's bookings."""
+        booked = sorted(
+            (existing.start_time, existing.end_time)
+            for existing in solution
+            if self._uses_resource(existing)
+        )
+        if not booked:
+            return []
+        starts = [start for start, _ in booked]
+        # latest_end[k] is the latest end among the first k + 1 bookings by start
+        latest_end = list(accumulate((end for _, end in booked), max))
+
+        violations = []
+        for assignment in assignments:
+            if not self._uses_resource(assignment):
+                continue
+            # Bookings starting before the assignment ends overlap it if any ends after it starts
+            count = bisect_left(starts, assignment.end_time)
+            if count and latest_end[count - 1] > assignment.start_time:
+                violations.append((assignment, self._double_booking(assignment)))
+        return violations
+
+    def _uses_resource(self, assignment: "Assignment") -> bool:
+        """Check if the assignment books this constraint's resource."""
+        return any(
+            self.resource_id in resource_ids for resource_ids in assignment.assigned_resources.values()
+        )
+
+    def _double_booking(self, assignment: "Assignment") -> Violation:
+        """Build the violation reported for a double-booked assignment."""
+        return Violation(
+            constraint_type=self.constraint_type,
+            affected_request_id=assignment.request_id,
+            affected_resource_id=self.resource_id,
+            message=f"Resource {self.resource_id} is double-booked",
+        )
+
     def explain(self, violation: Violation) -> str:
         """Explain the overlap violation."""
         return f"Resource '{violation.affected_resource_id}' is assigned to overlapping time slots"
@@ -59,6 +102,8 @@ class NoOverlap(Constraint):
 class BlackoutDates(Constraint):
     """Respects calendar blackout periods."""
 
+    depends_on_resources = False
+
     def __init__(self, calendar_id: str) -> None:
         self.calendar_id = calendar_id
 
@@ -82,6 +127,10 @@ class BlackoutDates(Constraint):
 
         return None
 
+    def cache_key(self, assignment: "Assignment") -> Tuple["datetime", "datetime"]:
+        """The verdict depends only on the assignment's times."""
+        return (assignment.start_time, assignment.end_time)
+
     def explain(self, violation: Violation) -> str:
         """Explain the blackout violation."""
         return "Assignment falls within a blackout period"
@@ -145,6 +194,8 @@ class MaxPerDay(Constraint):
 class MinGapBetweenOccurrences(Constraint):
     """Enforces spacing between session occurrences."""
 
+    depends_on_resources = False
+
     def __init__(self, request_id: str, min_gap: "timedelta") -> None:  # noqa: F821
         self.request_id = request_id
         self.min_gap = min_gap
@@ -182,6 +233,21 @@ class MinGapBetweenOccurrences(Constraint):
 
         return None
 
+    def check_batch(
+        self,
+        assignments: List["Assignment"],
+        solution: List["Assignment"],
+        context: ConstraintContext,
+    ) -> List[Tuple["Assignment", Violation]]:
+        """Check this request's assignments against its own occurrences only."""
+        occurrences = [existing for existing in solution if existing.request_id == self.request_id]
+        own = [assignment for assignment in assignments if assignment.request_id == self.request_id]
+        return super().check_batch(own, occurrences, context)
+
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Explain the gap violation."""
         return "Minimum gap between occurrences not maintained"
@@ -195,6 +261,8 @@ class MinGapBetweenOccurrences(Constraint):
 class WithinDateRange(Constraint):
     """Enforces session date boundaries."""
 
+    depends_on_resources = False
+
     def __init__(self, request_id: str) -> None:
         self.request_id = request_id
 
@@ -216,14 +284,42 @@ class WithinDateRange(Constraint):
             assignment.start_time < request.earliest_date
             or assignment.end_time > request.latest_date
         ):
-            return Violation(
-                constraint_type=self.constraint_type,
-                affected_request_id=self.request_id,
-                message=f"Assignment outside date range [{request.earliest_date}, {request.latest_date}]",
-            )
+            return self._out_of_range(request)
 
         return None
 
+    def check_batch(
+        self,
+        assignments: List["Assignment"],
+        solution: List["Assignment"],
+        context: ConstraintContext,
+    ) -> List[Tuple["Assignment", Violation]]:
+        """Check several assignments against the request's date range, looked up once."""
+        request = context.request_lookup.get(self.request_id)
+        if not request:
+            return []
+
+        request_id = self.request_id
+        earliest, latest = request.earliest_date, request.latest_date
+        return [
+            (assignment, self._out_of_range(request))
+            for assignment in assignments
+            if assignment.request_id == request_id
+            and (assignment.start_time < earliest or assignment.end_time > latest)
+        ]
+
+    def _out_of_range(self, request: "SessionRequest") -> Violation:
+        """Build the violation for an assignment outside the request's dates."""
+        return Violation(
+            constraint_type=self.constraint_type,
+            affected_request_id=self.request_id,
+            message=f"Assignment outside date range [{request.earliest_date}, {request.latest_date}]",
+        )
+
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Explain the date range violation."""
         return "Assignment falls outside the specified date range"
@@ -237,6 +333,8 @@ class WithinDateRange(Constraint):
 class AttributeMatch(Constraint):
     """Ensures resource attributes satisfy requirements."""
 
+    depends_on_time = False
+
     def __init__(self, request_id: str) -> None:
         self.request_id = request_id
 
@@ -271,6 +369,10 @@ class AttributeMatch(Constraint):
 
         return None
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Explain the attribute mismatch."""
         return "Resource does not satisfy required attributes"
@@ -167,6 +167,10 @@ class ProximityConstraint(Constraint):
 
         return None
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
@@ -257,6 +261,10 @@ class MultiRoomCoordination(Constraint):
                     rooms.extend(room_ids)
         return rooms
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
@@ -83,6 +83,10 @@ class SchedulingPatternConstraint(Constraint):
         }
         return patterns.get(pattern, [0, 1, 2, 3, 4])  # Default to Mon-Fri
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
@@ -96,6 +100,8 @@ class SchedulingPatternConstraint(Constraint):
 class HolidayAvoidanceConstraint(Constraint):
     """Ensures assignments are not scheduled during holidays."""
 
+    depends_on_resources = False
+
     def __init__(self, request_id: str):
         """
         Initialize holiday avoidance constraint.
@@ -166,6 +172,10 @@ class HolidayAvoidanceConstraint(Constraint):
 
         return holidays
 
+    def applies_to(self, request_id: str) -> bool:
+        """Only assignments of this constraint's request can violate it."""
+        return request_id == self.request_id
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
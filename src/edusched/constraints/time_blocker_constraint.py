@@ -12,6 +12,8 @@ if TYPE_CHECKING:
 class TimeBlockerConstraint(Constraint):
     """Prevents scheduling during blocked time periods."""
 
+    depends_on_resources = False
+
     def __init__(self, time_blocker: "TimeBlocker"):
         """
         Initialize time blocker constraint.
@@ -60,6 +62,10 @@ class TimeBlockerConstraint(Constraint):
 
         return None
 
+    def cache_key(self, assignment: "Assignment") -> tuple:
+        """The verdict depends only on the assignment's times."""
+        return (assignment.start_time, assignment.end_time)
+
     def explain(self, violation: Violation) -> str:
         """Generate human-readable explanation."""
         return violation.message
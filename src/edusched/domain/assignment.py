@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from edusched.utils.compat import SLOTTED_DATACLASS
 
-@dataclass
+
+@dataclass(**SLOTTED_DATACLASS)
 class Assignment:
     """Represents the placement of a SessionRequest occurrence into a specific timeslot."""
 
@@ -30,6 +30,22 @@ class ProblemIndices:
     qualified_resources: Dict[str, List[str]]
     time_occupancy_maps: Dict[str, Set[Tuple]]
     locked_intervals: Dict[str, Set[Tuple]]
+    # request id -> position in Problem.requests (counting repeated ids once)
+    request_index: Dict[str, int] = field(default_factory=dict)
+
+    def scheduled_mask(self, assignments: List["Assignment"]) -> bytearray:
+        """
+        Mark the requests that have at least one assignment.
+
+        Returns:
+            One byte per request, at its ``request_index`` position, 1 where scheduled
+        """
+        mask = bytearray(len(self.request_index))
+        for assignment in assignments:
+            position = self.request_index.get(assignment.request_id)
+            if position is not None:
+                mask[position] = 1
+        return mask
 
 
 @dataclass
@@ -114,6 +130,9 @@ class Problem:
         resource_lookup = {r.id: r for r in self.resources}
         calendar_lookup = {c.id: c for c in self.calendars}
         request_lookup = {r.id: r for r in self.requests}
+        request_index: Dict[str, int] = {}
+        for request in self.requests:
+            request_index.setdefault(request.id, len(request_index))
         building_lookup = {b.id: b for b in self.buildings}
         department_lookup = {d.id: d for d in self.departments}
         teacher_lookup = {t.id: t for t in self.teachers}
@@ -169,4 +188,5 @@ class Problem:
             qualified_resources=qualified_resources,
             time_occupancy_maps=time_occupancy_maps,
             locked_intervals=locked_intervals,
+            request_index=request_index,
         )
@@ -1,6 +1,6 @@
 """Objective system for EduSched."""
 
-from edusched.objectives.base import Objective
+from edusched.objectives.base import ColumnarAssignments, Objective, weighted_score
 from edusched.objectives.objectives import (
     BalanceInstructorLoad,
     MinimizeEveningSessions,
@@ -9,6 +9,8 @@ from edusched.objectives.objectives import (
 
 __all__ = [
     "Objective",
+    "ColumnarAssignments",
+    "weighted_score",
     "SpreadEvenlyAcrossTerm",
     "MinimizeEveningSessions",
     "BalanceInstructorLoad",
@@ -1,12 +1,40 @@
 """Base objective interface."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 if TYPE_CHECKING:
     from edusched.domain.assignment import Assignment
 
 
+@dataclass(frozen=True)
+class ColumnarAssignments:
+    """Column-oriented view of a solution, built once and shared by several objectives."""
+
+    start_times: List[datetime]
+    end_times: List[datetime]
+    start_dates: List[date]
+    request_ids: List[str]
+    assigned_resources: List[Dict[str, List[str]]]
+
+    @classmethod
+    def from_assignments(cls, solution: List["Assignment"]) -> "ColumnarAssignments":
+        """Extract the columns from a list of assignments in a single pass."""
+        start_times = [a.start_time for a in solution]
+        return cls(
+            start_times=start_times,
+            end_times=[a.end_time for a in solution],
+            start_dates=[start.date() for start in start_times],
+            request_ids=[a.request_id for a in solution],
+            assigned_resources=[a.assigned_resources for a in solution],
+        )
+
+    def __len__(self) -> int:
+        return len(self.start_times)
+
+
 class Objective(ABC):
     """Base class for all objectives."""
 
@@ -30,6 +58,22 @@ class Objective(ABC):
             Normalized score between 0 and 1
         """
 
+    def score_columns(self, columns: ColumnarAssignments) -> Optional[float]:
+        """
+        Calculate the score from a columnar view of the solution.
+
+        Objectives that can work from the shared columns override this to avoid
+        re-walking the assignment objects. The default returns None, telling the
+        caller to fall back to ``score``.
+
+        Args:
+            columns: Columnar view of the current solution
+
+        Returns:
+            Normalized score between 0 and 1, or None if not supported
+        """
+        return None
+
     @property
     @abstractmethod
     def objective_type(self) -> str:
@@ -39,3 +83,40 @@ class Objective(ABC):
         Returns:
             Objective type identifier
         """
+
+
+def weighted_score(
+    objectives: List[Objective],
+    solution: List["Assignment"],
+    columns: Optional[ColumnarAssignments] = None,
+) -> Optional[float]:
+    """
+    Combine the objectives' scores into their weighted mean.
+
+    The solution's columns are extracted once, or taken from ``columns``, and
+    shared by every objective that supports ``score_columns``; the others
+    score the assignments.
+
+    Args:
+        objectives: Objectives to score, each with its weight
+        solution: List of assignments in the current solution
+        columns: Columnar view of ``solution``, if already built
+
+    Returns:
+        Weighted mean score, or None if there are no objectives or their
+        weights sum to zero
+    """
+    total_weight = sum(objective.weight for objective in objectives)
+    if not objectives or total_weight <= 0:
+        return None
+
+    if columns is None:
+        columns = ColumnarAssignments.from_assignments(solution)
+
+    total_score = 0.0
+    for objective in objectives:
+        score = objective.score_columns(columns)
+        if score is None:
+            score = objective.score(solution)
+        total_score += score * objective.weight
+    return total_score / total_weight
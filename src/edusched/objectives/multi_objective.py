@@ -1,7 +1,8 @@
 """Multi-objective optimization framework for EduSched."""
 
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
+import heapq
 import math
 
 if TYPE_CHECKING:
@@ -23,14 +24,18 @@ class MultiObjectiveOptimizer:
         if not solutions:
             return []
         
-        # Calculate scores for each solution
-        solution_scores = []
-        for i, solution in enumerate(solutions):
-            scores = []
-            for objective, weight in self.objectives:
-                score = objective.score(solution)
-                scores.append(score * weight)
-            solution_scores.append((i, scores))
+        return self._pareto_indices(self._weighted_scores(solutions))
+    
+    def _weighted_scores(self, solutions: List[List["Assignment"]]) -> List[List[float]]:
+        """Score every solution against every objective, applying weights."""
+        return [
+            [objective.score(solution) * weight for objective, weight in self.objectives]
+            for solution in solutions
+        ]
+    
+    def _pareto_indices(self, weighted_scores: List[List[float]]) -> List[int]:
+        """Find the non-dominated rows of a precomputed weighted score matrix."""
+        solution_scores = list(enumerate(weighted_scores))
         
         # Find Pareto frontier
         pareto_indices = []
@@ -129,21 +134,65 @@ class ObjectiveComparisonTool:
     
     @staticmethod
     def compare_solutions(solution1: List["Assignment"], solution2: List["Assignment"], 
-                         objectives: List[Tuple["Objective", float]]) -> Dict[str, float]:
-        """Compare two solutions across multiple objectives."""
+                         objectives: List[Tuple["Objective", float]],
+                         score_cache: Optional[Dict[Tuple[int, Hashable], float]] = None,
+                         solution_keys: Optional[Tuple[Hashable, Hashable]] = None) -> Dict[str, float]:
+        """Compare two solutions across multiple objectives.
+        
+        Args:
+            solution1: First solution
+            solution2: Second solution
+            objectives: (objective, weight) pairs to compare on
+            score_cache: Optional mapping of ``(id(objective), solution key)`` to
+                raw (unweighted) scores. Cached scores are reused and missing ones
+                are stored, so repeated comparisons skip ``objective.score`` calls.
+            solution_keys: Hashable keys identifying the two solutions' contents in
+                ``score_cache``, such as a version or content hash. Defaults to
+                ``id()`` of each solution list.
+
+        An entry is only valid while its objective stays alive and its solution
+        is unchanged. Without ``solution_keys``, a cache must not outlive the
+        solution lists or see them modified in place, since ``id()`` values are
+        reused after garbage collection.
+        """
         comparison = {}
+        if score_cache is not None and solution_keys is None:
+            solution_keys = (id(solution1), id(solution2))
         
         for i, (objective, weight) in enumerate(objectives):
-            score1 = objective.score(solution1) * weight
-            score2 = objective.score(solution2) * weight
-            comparison[f"objective_{i}_diff"] = score1 - score2  # Positive if solution1 is better
+            if score_cache is None:
+                score1 = objective.score(solution1)
+                score2 = objective.score(solution2)
+            else:
+                key1, key2 = solution_keys
+                score1 = ObjectiveComparisonTool._cached_score(objective, solution1, key1, score_cache)
+                score2 = ObjectiveComparisonTool._cached_score(objective, solution2, key2, score_cache)
+            comparison[f"objective_{i}_diff"] = score1 * weight - score2 * weight  # Positive if solution1 is better
         
         return comparison
     
+    @staticmethod
+    def _cached_score(objective, solution: List["Assignment"], solution_key: Hashable,
+                      score_cache: Dict[Tuple[int, Hashable], float]) -> float:
+        """Look up an objective score in the cache, computing it on a miss."""
+        key = (id(objective), solution_key)
+        score = score_cache.get(key)
+        if score is None:
+            score = objective.score(solution)
+            score_cache[key] = score
+        return score
+    
     @staticmethod
     def calculate_solution_rankings(solutions: List[List["Assignment"]], 
-                                  objectives: List[Tuple["Objective", float]]) -> List[Tuple[int, float]]:
-        """Rank solutions based on multiple criteria."""
+                                  objectives: List[Tuple["Objective", float]],
+                                  top_k: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Rank solutions based on multiple criteria.
+        
+        Args:
+            solutions: Candidate solutions
+            objectives: (objective, weight) pairs used for the composite score
+            top_k: If given, only the ``top_k`` best-ranked solutions are returned
+        """
         rankings = []
         
         for i, solution in enumerate(solutions):
@@ -159,9 +208,11 @@ class ObjectiveComparisonTool:
             composite_score = total_score / total_weight if total_weight > 0 else 0.0
             rankings.append((i, composite_score))
         
-        # Sort by score (lower is better)
+        # Sort by score (lower is better); a heap avoids a full sort for small k
+        if top_k is not None and top_k < len(rankings) // 2:
+            return heapq.nsmallest(top_k, rankings, key=lambda x: x[1])
         rankings.sort(key=lambda x: x[1])
-        return rankings
+        return rankings if top_k is None else rankings[:top_k]
 
 
 class EnhancedObjectiveScorer:
@@ -191,10 +242,21 @@ class EnhancedObjectiveScorer:
             return []
         
         if method == "pareto":
-            pareto_indices = self.optimizer.calculate_pareto_frontier(solutions)
+            weighted_scores = self.optimizer._weighted_scores(solutions)
+            pareto_indices = self.optimizer._pareto_indices(weighted_scores)
             if pareto_indices:
-                # Return the first solution in the Pareto frontier
-                return solutions[pareto_indices[0]]
+                if not self.optimizer.objectives:
+                    return solutions[pareto_indices[0]]
+                # Pick the Pareto solution closest to the ideal point of the frontier,
+                # reusing the scores already computed for the dominance check
+                pareto_scores = [weighted_scores[i] for i in pareto_indices]
+                ideal_point = [max(column) for column in zip(*pareto_scores)]
+                asf = AchievementScalarizingFunction(ideal_point)
+                best_position = min(
+                    range(len(pareto_indices)),
+                    key=lambda k: asf.calculate(pareto_scores[k]),
+                )
+                return solutions[pareto_indices[best_position]]
         elif method == "weighted_sum":
             best_idx = 0
             best_score = float('inf')
@@ -1,11 +1,14 @@
 """Objective implementations."""
 
-from datetime import time
-from typing import TYPE_CHECKING, List
+from collections import Counter
+from datetime import date, time
+from typing import TYPE_CHECKING, Dict, List
 
-from edusched.objectives.base import Objective
+from edusched.objectives.base import ColumnarAssignments, Objective
 
 if TYPE_CHECKING:
+    from datetime import datetime
+
     from edusched.domain.assignment import Assignment
 
 
@@ -17,13 +20,19 @@ class SpreadEvenlyAcrossTerm(Objective):
         if not solution:
             return 1.0
 
-        # Count sessions per day
-        from collections import defaultdict
+        return self._score_days([assignment.start_time.date() for assignment in solution])
+
+    def score_columns(self, columns: ColumnarAssignments) -> float:
+        """Calculate score from the shared start-date column."""
+        if not len(columns):
+            return 1.0
 
-        daily_counts = defaultdict(int)
-        for assignment in solution:
-            day = assignment.start_time.date()
-            daily_counts[day] += 1
+        return self._score_days(columns.start_dates)
+
+    def _score_days(self, days: List[date]) -> float:
+        """Score the distribution of session start dates."""
+        # Count sessions per day
+        daily_counts = Counter(days)
 
         if not daily_counts:
             return 1.0
@@ -35,7 +44,7 @@ class SpreadEvenlyAcrossTerm(Objective):
 
         # Normalize: lower variance = higher score
         # Assume max variance is when all sessions are on one day
-        max_variance = (len(solution) ** 2) / len(daily_counts)
+        max_variance = (len(days) ** 2) / len(daily_counts)
         if max_variance == 0:
             return 1.0
 
@@ -60,14 +69,25 @@ class MinimizeEveningSessions(Objective):
         if not solution:
             return 1.0
 
+        return self._score_start_times([assignment.start_time for assignment in solution])
+
+    def score_columns(self, columns: ColumnarAssignments) -> float:
+        """Calculate score from the shared start-time column."""
+        if not len(columns):
+            return 1.0
+
+        return self._score_start_times(columns.start_times)
+
+    def _score_start_times(self, start_times: List["datetime"]) -> float:
+        """Score the share of sessions starting at or after the evening threshold."""
         # Count evening sessions
         evening_count = 0
-        for assignment in solution:
-            if assignment.start_time.time() >= self.evening_threshold:
+        for start_time in start_times:
+            if start_time.time() >= self.evening_threshold:
                 evening_count += 1
 
         # Normalize: more evening sessions = lower score
-        max_evening_penalty = len(solution)
+        max_evening_penalty = len(start_times)
         if max_evening_penalty == 0:
             return 1.0
 
@@ -88,14 +108,25 @@ class BalanceInstructorLoad(Objective):
         if not solution:
             return 1.0
 
-        # Count sessions per instructor
-        from collections import defaultdict
+        return self._score_resources(
+            [assignment.assigned_resources for assignment in solution]
+        )
 
-        instructor_loads = defaultdict(int)
-        for assignment in solution:
+    def score_columns(self, columns: ColumnarAssignments) -> float:
+        """Calculate score from the shared assigned-resources column."""
+        if not len(columns):
+            return 1.0
+
+        return self._score_resources(columns.assigned_resources)
+
+    def _score_resources(self, assigned_resources: List[Dict[str, List[str]]]) -> float:
+        """Score instructor load balance from each session's assigned resources."""
+        # Count sessions per instructor
+        instructor_loads: Dict[str, int] = Counter()
+        for resources in assigned_resources:
             # Assume instructor is in resource type "instructor"
-            if "instructor" in assignment.assigned_resources:
-                for instructor_id in assignment.assigned_resources["instructor"]:
+            if "instructor" in resources:
+                for instructor_id in resources["instructor"]:
                     instructor_loads[instructor_id] += 1
 
         if not instructor_loads:
@@ -107,7 +138,7 @@ class BalanceInstructorLoad(Objective):
         variance = sum((load - mean) ** 2 for load in loads) / len(loads)
 
         # Normalize: lower variance = higher score
-        max_variance = (len(solution) ** 2) / len(instructor_loads)
+        max_variance = (len(assigned_resources) ** 2) / len(instructor_loads)
         if max_variance == 0:
             return 1.0
 
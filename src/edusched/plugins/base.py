@@ -1,11 +1,13 @@
 """Plugin system for EduSched extensions."""
 
 import importlib
+import importlib.util
 import os
 import sys
 from importlib import metadata
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Type
 from dataclasses import dataclass
 
 
@@ -61,6 +63,12 @@ class ObjectivePlugin(PluginInterface):
         pass
 
 
+# Package name plugin files loaded from a directory are registered under
+_PLUGIN_NAMESPACE = 'edusched_plugins'
+
+_EMPTY_VIEW: Mapping[str, PluginInterface] = MappingProxyType({})
+
+
 class PluginRegistry:
     """Registry for managing EduSched plugins."""
     
@@ -69,6 +77,14 @@ class PluginRegistry:
         self.solver_plugins: Dict[str, SolverPlugin] = {}
         self.objective_plugins: Dict[str, ObjectivePlugin] = {}
         self.all_plugins: Dict[str, PluginInterface] = {}
+
+        # Read-only live views handed out by the getters below
+        self._all_view: Mapping[str, PluginInterface] = MappingProxyType(self.all_plugins)
+        self._views_by_type: Dict[str, Mapping[str, PluginInterface]] = {
+            'constraint': MappingProxyType(self.constraint_plugins),
+            'solver': MappingProxyType(self.solver_plugins),
+            'objective': MappingProxyType(self.objective_plugins),
+        }
     
     def register_plugin(self, plugin: PluginInterface) -> bool:
         """Register a plugin."""
@@ -102,20 +118,19 @@ class PluginRegistry:
         """Get an objective plugin by name."""
         return self.objective_plugins.get(name)
     
-    def get_all_plugins(self) -> Dict[str, PluginInterface]:
-        """Get all registered plugins."""
-        return self.all_plugins.copy()
+    def get_all_plugins(self) -> Mapping[str, PluginInterface]:
+        """Get all registered plugins.
+
+        Returns a read-only live view; use ``register_plugin`` to modify it.
+        """
+        return self._all_view
     
-    def get_plugins_by_type(self, plugin_type: str) -> Dict[str, PluginInterface]:
-        """Get plugins of a specific type."""
-        if plugin_type == 'constraint':
-            return self.constraint_plugins.copy()
-        elif plugin_type == 'solver':
-            return self.solver_plugins.copy()
-        elif plugin_type == 'objective':
-            return self.objective_plugins.copy()
-        else:
-            return {}
+    def get_plugins_by_type(self, plugin_type: str) -> Mapping[str, PluginInterface]:
+        """Get plugins of a specific type.
+
+        Returns a read-only live view, or an empty mapping for unknown types.
+        """
+        return self._views_by_type.get(plugin_type, _EMPTY_VIEW)
 
 
 class PluginLoader:
@@ -128,10 +143,7 @@ class PluginLoader:
         """Load a plugin from a Python module."""
         try:
             module = importlib.import_module(module_name)
-            if hasattr(module, 'get_plugin'):
-                plugin = module.get_plugin()
-                if isinstance(plugin, PluginInterface):
-                    return self.registry.register_plugin(plugin)
+            return self._register_from_module(module)
         except ImportError:
             pass
         except Exception:
@@ -139,22 +151,78 @@ class PluginLoader:
         
         return False
     
+    def _register_from_module(self, module: Any) -> bool:
+        """Register the plugin exposed by a module's ``get_plugin`` hook."""
+        if hasattr(module, 'get_plugin'):
+            plugin = module.get_plugin()
+            if isinstance(plugin, PluginInterface):
+                return self.registry.register_plugin(plugin)
+        return False
+
+    @staticmethod
+    def _exec_plugin_file(stem: str, path: str) -> Optional[Any]:
+        """Execute a plugin file from its path as ``edusched_plugins.<stem>``.
+
+        The namespaced name keeps plugin files from shadowing installed modules.
+        A name already taken by another file is left alone and the file skipped.
+        """
+        module_name = f"{_PLUGIN_NAMESPACE}.{stem}"
+        existing = sys.modules.get(module_name)
+        if existing is not None:
+            if getattr(existing, '__file__', None) == path:
+                return existing
+            return None
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None or spec.loader is None:
+                return None
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            try:
+                spec.loader.exec_module(module)
+            except BaseException:
+                if sys.modules.get(module_name) is module:
+                    del sys.modules[module_name]
+                raise
+            return module
+        except Exception:
+            return None
+
     def load_from_directory(self, directory: str) -> int:
-        """Load plugins from a directory."""
+        """Load plugins from a directory.
+
+        Plugin files run in filename order as ``edusched_plugins.<stem>``, with
+        the directory on ``sys.path`` so they can import sibling modules.
+        """
         count = 0
-        if not os.path.exists(directory):
+        if not os.path.isdir(directory):
+            return count
+        
+        with os.scandir(directory) as entries:
+            plugin_files = sorted(
+                (entry.name[:-3], entry.path)
+                for entry in entries
+                if entry.name.endswith('.py')
+                and not entry.name.startswith('__')
+                and entry.is_file()
+            )
+        if not plugin_files:
             return count
         
         # Add directory to Python path temporarily
         original_path = sys.path[:]
         sys.path.insert(0, directory)
-        
+
         try:
-            for filename in os.listdir(directory):
-                if filename.endswith('.py') and not filename.startswith('__'):
-                    module_name = filename[:-3]  # Remove .py extension
-                    if self.load_from_module(module_name):
+            for stem, path in plugin_files:
+                module = self._exec_plugin_file(stem, path)
+                if module is None:
+                    continue
+                try:
+                    if self._register_from_module(module):
                         count += 1
+                except Exception:
+                    continue
         finally:
             # Restore original path
             sys.path[:] = original_path
@@ -195,6 +263,12 @@ class PluginManager:
         self.registry = PluginRegistry()
         self.loader = PluginLoader(self.registry)
         self.enabled_plugins: Dict[str, PluginInterface] = {}
+        # Enabled plugins bucketed by plugin type, kept in sync with enabled_plugins
+        self._enabled_by_type: Dict[str, Dict[str, PluginInterface]] = {
+            'constraint': {},
+            'solver': {},
+            'objective': {},
+        }
     
     def load_builtin_plugins(self):
         """Load built-in plugins (if any)."""
@@ -210,63 +284,71 @@ class PluginManager:
     def register_plugin(self, plugin: PluginInterface) -> bool:
         """Register a plugin directly."""
         if self.registry.register_plugin(plugin):
-            self.enabled_plugins[plugin.get_metadata().name] = plugin
+            self._mark_enabled(plugin.get_metadata().name, plugin)
             return True
         return False
     
+    def _mark_enabled(self, name: str, plugin: PluginInterface):
+        """Record a plugin as enabled, both globally and in its type bucket."""
+        self._mark_disabled(name)
+        self.enabled_plugins[name] = plugin
+        bucket = self._enabled_by_type.get(plugin.get_metadata().plugin_type)
+        if bucket is not None:
+            bucket[name] = plugin
+
+    def _mark_disabled(self, name: str) -> bool:
+        """Drop a plugin from the enabled set and its type bucket."""
+        plugin = self.enabled_plugins.pop(name, None)
+        if plugin is None:
+            return False
+        for bucket in self._enabled_by_type.values():
+            bucket.pop(name, None)
+        return True
+
     def get_available_constraints(self) -> Dict[str, Type]:
         """Get all available constraint classes from plugins."""
         constraints = {}
-        for name, plugin in self.registry.constraint_plugins.items():
-            if name in self.enabled_plugins:  # Only return enabled plugins
-                try:
-                    constraint_class = plugin.get_constraint_class()
-                    constraints[name] = constraint_class
-                except Exception:
-                    # Skip plugins that fail to provide their class
-                    continue
+        for name, plugin in self._enabled_by_type['constraint'].items():
+            try:
+                constraints[name] = plugin.get_constraint_class()
+            except Exception:
+                # Skip plugins that fail to provide their class
+                continue
         return constraints
     
     def get_available_solvers(self) -> Dict[str, Type]:
         """Get all available solver classes from plugins."""
         solvers = {}
-        for name, plugin in self.registry.solver_plugins.items():
-            if name in self.enabled_plugins:  # Only return enabled plugins
-                try:
-                    solver_class = plugin.get_solver_class()
-                    solvers[name] = solver_class
-                except Exception:
-                    # Skip plugins that fail to provide their class
-                    continue
+        for name, plugin in self._enabled_by_type['solver'].items():
+            try:
+                solvers[name] = plugin.get_solver_class()
+            except Exception:
+                # Skip plugins that fail to provide their class
+                continue
         return solvers
     
     def get_available_objectives(self) -> Dict[str, Type]:
         """Get all available objective classes from plugins."""
         objectives = {}
-        for name, plugin in self.registry.objective_plugins.items():
-            if name in self.enabled_plugins:  # Only return enabled plugins
-                try:
-                    objective_class = plugin.get_objective_class()
-                    objectives[name] = objective_class
-                except Exception:
-                    # Skip plugins that fail to provide their class
-                    continue
+        for name, plugin in self._enabled_by_type['objective'].items():
+            try:
+                objectives[name] = plugin.get_objective_class()
+            except Exception:
+                # Skip plugins that fail to provide their class
+                continue
         return objectives
     
     def enable_plugin(self, name: str) -> bool:
         """Enable a plugin by name."""
         plugin = self.registry.all_plugins.get(name)
         if plugin:
-            self.enabled_plugins[name] = plugin
+            self._mark_enabled(name, plugin)
             return True
         return False
     
     def disable_plugin(self, name: str) -> bool:
         """Disable a plugin by name."""
-        if name in self.enabled_plugins:
-            del self.enabled_plugins[name]
-            return True
-        return False
+        return self._mark_disabled(name)
     
     def is_plugin_enabled(self, name: str) -> bool:
         """Check if a plugin is enabled."""
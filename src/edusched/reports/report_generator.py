@@ -1,14 +1,28 @@
 """Reporting and analytics for EduSched."""
 
+import heapq
 import json
-from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from collections import defaultdict
+from datetime import date, datetime
+from typing import IO, Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from enum import Enum
+from itertools import chain
 
 from edusched.domain.assignment import Assignment
 from edusched.domain.problem import Problem
 from edusched.domain.result import Result
+from edusched.objectives.base import ColumnarAssignments
+from edusched.utils.compat import SLOTTED_DATACLASS
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 
 class ReportType(Enum):
@@ -20,7 +34,7 @@ class ReportType(Enum):
     SUMMARY = "summary"
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class ResourceUtilizationReport:
     """Report on resource utilization."""
     resource_id: str
@@ -30,10 +44,10 @@ class ResourceUtilizationReport:
     capacity: Optional[int] = None
     average_occupancy: float = 0.0
     peak_usage: float = 0.0
-    usage_by_day: Dict[str, float] = None  # hours per day
+    usage_by_day: Dict[str, float] = field(default_factory=dict)  # hours per day
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class ConflictReport:
     """Report on scheduling conflicts."""
     conflict_type: str
@@ -44,7 +58,7 @@ class ConflictReport:
     count: int = 1
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class ScheduleAnalysisReport:
     """Analysis of the schedule quality."""
     total_assignments: int
@@ -56,7 +70,7 @@ class ScheduleAnalysisReport:
     resource_balance_score: float  # how evenly resources are used
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class OptimizationMetricsReport:
     """Metrics related to optimization objectives."""
     objective_satisfaction: Dict[str, float]  # objective name -> satisfaction score
@@ -65,7 +79,7 @@ class OptimizationMetricsReport:
     improvement_over_baseline: float
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class SummaryReport:
     """Overall summary of the scheduling result."""
     report_date: datetime
@@ -79,7 +93,7 @@ class SummaryReport:
     overall_score: float
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class ComprehensiveReport:
     """A comprehensive report containing all types of analytics."""
     report_id: str
@@ -97,17 +111,73 @@ class ComprehensiveReport:
             "report_id": self.report_id,
             "generation_time": self.generation_time.isoformat(),
             "problem_summary": self.problem_summary,
-            "resource_utilization": [asdict(r) for r in self.resource_utilization],
-            "schedule_analysis": asdict(self.schedule_analysis),
-            "conflict_report": [asdict(c) for c in self.conflict_report],
-            "optimization_metrics": asdict(self.optimization_metrics),
-            "summary": asdict(self.summary)
+            "resource_utilization": [_report_to_dict(r) for r in self.resource_utilization],
+            "schedule_analysis": _report_to_dict(self.schedule_analysis),
+            "conflict_report": [_report_to_dict(c) for c in self.conflict_report],
+            "optimization_metrics": _report_to_dict(self.optimization_metrics),
+            "summary": _report_to_dict(self.summary)
         }
         return result
     
     def to_json(self) -> str:
         """Convert the report to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        if ORJSON_AVAILABLE:
+            return self.to_json_bytes().decode()
+        return json.dumps(self.to_dict(), indent=2, default=_json_default)
+    
+    def to_json_bytes(self) -> bytes:
+        """Convert the report to UTF-8 encoded JSON.
+        
+        Uses orjson when installed, which serializes the dataclasses and
+        datetimes directly instead of going through ``to_dict``.
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self, default=_json_default, option=orjson.OPT_INDENT_2)
+        return self.to_json().encode()
+
+
+@lru_cache(maxsize=None)
+def _field_names(report_cls: type) -> Tuple[str, ...]:
+    """Field names of a report dataclass, computed once per class."""
+    return tuple(f.name for f in fields(report_cls))
+
+
+def _report_to_dict(report: Any) -> Dict[str, Any]:
+    """Shallow dict of a flat report dataclass.
+    
+    The report sections only hold scalars, lists and dicts of scalars, so this
+    gives the same result as ``dataclasses.asdict`` without its recursive copy.
+    """
+    return {name: getattr(report, name) for name in _field_names(type(report))}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values the JSON encoders do not handle natively."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return _report_to_dict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _encode_json(value: Any) -> bytes:
+    """Encode a single value as indented UTF-8 JSON."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, default=_json_default).encode()
+
+
+def _write_json_list(stream: IO[bytes], items: Iterable[Any]) -> None:
+    """Write a report section list item by item, nested under a top-level key."""
+    stream.write(b"[")
+    first = True
+    for item in items:
+        stream.write(b"\n    " if first else b",\n    ")
+        stream.write(_encode_json(item).replace(b"\n", b"\n    "))
+        first = False
+    stream.write(b"]" if first else b"\n  ]")
 
 
 class ReportGenerator:
@@ -118,14 +188,22 @@ class ReportGenerator:
     
     def generate_comprehensive_report(self, problem: Problem, result: Result) -> ComprehensiveReport:
         """Generate a comprehensive report from problem and result."""
-        report_id = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        report_id = f"report_{now.strftime('%Y%m%d_%H%M%S')}"
+        
+        # Shared resource -> assignments index used by several sections
+        resource_index = self._build_resource_index(result)
         
         # Generate individual reports
-        resource_utilization = self._generate_resource_utilization_report(problem, result)
+        resource_utilization = self._generate_resource_utilization_report(
+            problem, result, resource_index
+        )
         schedule_analysis = self._generate_schedule_analysis_report(problem, result)
-        conflict_report = self._generate_conflict_report(problem, result)
+        conflict_report = self._generate_conflict_report(problem, result, resource_index)
         optimization_metrics = self._generate_optimization_metrics_report(problem, result)
-        summary = self._generate_summary_report(problem, result)
+        summary = self._generate_summary_report(
+            problem, result, conflict_report, resource_index, now=now
+        )
         
         # Create problem summary
         problem_summary = {
@@ -138,7 +216,7 @@ class ReportGenerator:
         
         return ComprehensiveReport(
             report_id=report_id,
-            generation_time=datetime.now(),
+            generation_time=now,
             problem_summary=problem_summary,
             resource_utilization=resource_utilization,
             schedule_analysis=schedule_analysis,
@@ -147,9 +225,35 @@ class ReportGenerator:
             summary=summary
         )
     
-    def _generate_resource_utilization_report(self, problem: Problem, result: Result) -> List[ResourceUtilizationReport]:
+    def _build_resource_index(self, result: Result) -> Dict[str, List[Assignment]]:
+        """Map each resource ID to the assignments that use it, in assignment order.
+        
+        An assignment listing the same resource under several roles appears once.
+        """
+        resource_index: Dict[str, List[Assignment]] = defaultdict(list)
+        for assignment in result.assignments:
+            for resource_id in dict.fromkeys(chain.from_iterable(assignment.assigned_resources.values())):
+                resource_index[resource_id].append(assignment)
+        return dict(resource_index)
+    
+    def _generate_resource_utilization_report(
+        self,
+        problem: Problem,
+        result: Result,
+        resource_index: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> List[ResourceUtilizationReport]:
         """Generate resource utilization report."""
-        utilization_reports = []
+        return list(self._iter_resource_utilization_report(problem, result, resource_index))
+    
+    def _iter_resource_utilization_report(
+        self,
+        problem: Problem,
+        result: Result,
+        resource_index: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> Iterator[ResourceUtilizationReport]:
+        """Yield resource utilization entries one resource at a time."""
+        if resource_index is None:
+            resource_index = self._build_resource_index(result)
         
         # Calculate total available time per resource (simplified)
         # In a real implementation, this would consider calendar availability
@@ -158,27 +262,26 @@ class ReportGenerator:
             total_time = 0.0
             days_used = set()
             
-            for assignment in result.assignments:
-                if resource.id in [rid for rids in assignment.assigned_resources.values() for rid in rids]:
-                    duration_hours = (assignment.end_time - assignment.start_time).total_seconds() / 3600
-                    total_time += duration_hours
-                    days_used.add(assignment.start_time.date().isoformat())
+            for assignment in resource_index.get(resource.id, ()):
+                duration_hours = (assignment.end_time - assignment.start_time).total_seconds() / 3600
+                total_time += duration_hours
+                days_used.add(assignment.start_time.toordinal())
             
             # Calculate utilization percentage (simplified)
             # In a real implementation, this would consider the actual available time
             utilization_percentage = min((total_time / 40.0) * 100, 100) if total_time > 0 else 0  # Assuming 40h work week
             
-            report = ResourceUtilizationReport(
+            yield ResourceUtilizationReport(
                 resource_id=resource.id,
                 resource_type=resource.resource_type,
                 total_time_allocated=total_time,
                 utilization_percentage=utilization_percentage,
                 capacity=resource.capacity,
-                usage_by_day={day: total_time/len(days_used) if days_used else 0 for day in days_used}
+                usage_by_day={
+                    date.fromordinal(day).isoformat(): total_time / len(days_used)
+                    for day in sorted(days_used)
+                }
             )
-            utilization_reports.append(report)
-        
-        return utilization_reports
     
     def _generate_schedule_analysis_report(self, problem: Problem, result: Result) -> ScheduleAnalysisReport:
         """Generate schedule analysis report."""
@@ -198,7 +301,7 @@ class ReportGenerator:
             average_duration = 0.0
         
         # Simplified metrics
-        schedule_density = total_assignments / max(len(set(a.start_time.date() for a in result.assignments)), 1)
+        schedule_density = total_assignments / max(len({a.start_time.toordinal() for a in result.assignments}), 1)
         time_utilization = scheduled_percentage / 100  # Simplified
         resource_balance_score = 0.8  # Placeholder - in real implementation this would be calculated
         
@@ -212,25 +315,47 @@ class ReportGenerator:
             resource_balance_score=resource_balance_score
         )
     
-    def _generate_conflict_report(self, problem: Problem, result: Result) -> List[ConflictReport]:
+    def _generate_conflict_report(
+        self,
+        problem: Problem,
+        result: Result,
+        resource_index: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> List[ConflictReport]:
         """Generate conflict report."""
-        conflicts = []
+        return list(self._iter_conflict_report(problem, result, resource_index))
+    
+    def _iter_conflict_report(
+        self,
+        problem: Problem,
+        result: Result,
+        resource_index: Optional[Dict[str, List[Assignment]]] = None,
+    ) -> Iterator[ConflictReport]:
+        """Yield resource double-bookings as they are found.
         
-        # Check for basic resource conflicts (double bookings)
-        resource_assignments = {}
-        for assignment in result.assignments:
-            for resource_ids in assignment.assigned_resources.values():
-                for resource_id in resource_ids:
-                    if resource_id not in resource_assignments:
-                        resource_assignments[resource_id] = []
-                    resource_assignments[resource_id].append(assignment)
+        Each pair of requests is reported once per resource. Further overlaps
+        between the same pair (e.g. later occurrences of the same sessions) are
+        folded into the ``count`` of the report already yielded for it.
+        """
+        if resource_index is None:
+            resource_index = self._build_resource_index(result)
         
-        for resource_id, assignments in resource_assignments.items():
-            # Check for overlapping assignments
-            for i, assign1 in enumerate(assignments):
-                for j, assign2 in enumerate(assignments[i+1:], i+1):
-                    if (assign1.start_time < assign2.end_time and 
-                        assign1.end_time > assign2.start_time):
+        # Check for basic resource conflicts (double bookings)
+        for resource_id, bookings in resource_index.items():
+            seen: Dict[FrozenSet[str], ConflictReport] = {}
+            # Sweep the bookings in start order, keeping a heap of the ones still running
+            assignments = sorted(bookings, key=lambda a: a.start_time)
+            active = []  # (end_time, index) of bookings that have not ended yet
+            for idx, assign2 in enumerate(assignments):
+                while active and active[0][0] <= assign2.start_time:
+                    heapq.heappop(active)
+                for _, other_idx in sorted(active, key=lambda entry: entry[1]):
+                    assign1 = assignments[other_idx]
+                    if assign1.start_time < assign2.end_time:
+                        key = frozenset((assign1.request_id, assign2.request_id))
+                        existing = seen.get(key)
+                        if existing is not None:
+                            existing.count += 1
+                            continue
                         conflict = ConflictReport(
                             conflict_type="resource_overlap",
                             affected_resources=[resource_id],
@@ -239,16 +364,24 @@ class ReportGenerator:
                             description=f"Resource {resource_id} double-booked between "
                                       f"{assign1.start_time} and {assign2.start_time}"
                         )
-                        conflicts.append(conflict)
-        
-        return conflicts
+                        seen[key] = conflict
+                        yield conflict
+                heapq.heappush(active, (assign2.end_time, idx))
     
     def _generate_optimization_metrics_report(self, problem: Problem, result: Result) -> OptimizationMetricsReport:
         """Generate optimization metrics report."""
         # Calculate objective satisfaction
         objective_satisfaction = {}
+        # Extract the assignment columns once and share them across objectives
+        columns = (
+            ColumnarAssignments.from_assignments(result.assignments)
+            if problem.objectives
+            else None
+        )
         for obj in problem.objectives:
-            satisfaction = obj.score(result.assignments)
+            satisfaction = obj.score_columns(columns)
+            if satisfaction is None:
+                satisfaction = obj.score(result.assignments)
             objective_satisfaction[obj.__class__.__name__] = satisfaction
         
         # Count constraint violations
@@ -262,24 +395,43 @@ class ReportGenerator:
             improvement_over_baseline=0.0  # Placeholder
         )
     
-    def _generate_summary_report(self, problem: Problem, result: Result) -> SummaryReport:
-        """Generate summary report."""
+    def _generate_summary_report(
+        self,
+        problem: Problem,
+        result: Result,
+        conflict_report: Optional[List[ConflictReport]] = None,
+        resource_index: Optional[Dict[str, List[Assignment]]] = None,
+        now: Optional[datetime] = None,
+    ) -> SummaryReport:
+        """Generate summary report.
+        
+        Args:
+            problem: The scheduling problem
+            result: The scheduling result
+            conflict_report: Conflicts already generated for this result; computed
+                here only when not supplied
+            resource_index: Resource to assignments index from ``_build_resource_index``
+            now: Report timestamp; defaults to the current time
+        """
         # Calculate resource utilization
         if problem.resources and result.assignments:
-            resource_util = len(set(
-                rid for a in result.assignments 
-                for rids in a.assigned_resources.values() 
-                for rid in rids
-            )) / len(problem.resources) * 100
+            if resource_index is not None:
+                used_resource_count = len(resource_index)
+            else:
+                used_resource_count = len(set(chain.from_iterable(
+                    chain.from_iterable(a.assigned_resources.values() for a in result.assignments)
+                )))
+            resource_util = used_resource_count / len(problem.resources) * 100
         else:
             resource_util = 0.0
         
         # Count conflicts (simplified)
-        conflicts = self._generate_conflict_report(problem, result)
-        conflict_count = len(conflicts)
+        if conflict_report is None:
+            conflict_report = self._generate_conflict_report(problem, result, resource_index)
+        conflict_count = sum(conflict.count for conflict in conflict_report)
         
         return SummaryReport(
-            report_date=datetime.now(),
+            report_date=now if now is not None else datetime.now(),
             solver_used=result.backend_used,
             solve_time_seconds=result.solve_time_seconds,
             result_status=result.status,
@@ -295,41 +447,57 @@ class ReportExporter:
     """Exports reports in various formats."""
     
     def export_json(self, report: ComprehensiveReport, filename: str):
-        """Export report as JSON."""
-        with open(filename, 'w') as f:
-            f.write(report.to_json())
+        """Export report as JSON.
+        
+        Sections are encoded and written one entry at a time, so the full JSON
+        document is never held in memory.
+        """
+        with open(filename, 'wb') as f:
+            f.write(b"{")
+            for position, name in enumerate(_field_names(type(report))):
+                f.write(b'\n  "' if position == 0 else b',\n  "')
+                f.write(name.encode() + b'": ')
+                value = getattr(report, name)
+                if isinstance(value, list):
+                    _write_json_list(f, value)
+                else:
+                    f.write(_encode_json(value).replace(b"\n", b"\n  "))
+            f.write(b"\n}")
     
     def export_text(self, report: ComprehensiveReport, filename: str):
         """Export report as text."""
-        lines = [
-            f"EduSched Report: {report.report_id}",
-            f"Generated: {report.generation_time}",
-            "",
-            "Problem Summary:",
-            f"  Total Requests: {report.problem_summary['total_requests']}",
-            f"  Total Resources: {report.problem_summary['total_resources']}",
-            f"  Total Constraints: {report.problem_summary['total_constraints']}",
-            "",
-            "Schedule Summary:",
-            f"  Scheduled: {report.summary.scheduled_requests}/{report.summary.total_requests} ({report.summary.scheduled_requests/report.summary.total_requests*100:.1f}%)",
-            f"  Solve Time: {report.summary.solve_time_seconds:.2f}s",
-            f"  Solver: {report.summary.solver_used}",
-            f"  Status: {report.summary.result_status}",
-            "",
-            "Resource Utilization:",
-        ]
+        summary = report.summary
+        problem_summary = report.problem_summary
+        out = bytearray()
+        out += (
+            f"EduSched Report: {report.report_id}\n"
+            f"Generated: {report.generation_time}\n"
+            "\n"
+            "Problem Summary:\n"
+            f"  Total Requests: {problem_summary['total_requests']}\n"
+            f"  Total Resources: {problem_summary['total_resources']}\n"
+            f"  Total Constraints: {problem_summary['total_constraints']}\n"
+            "\n"
+            "Schedule Summary:\n"
+            f"  Scheduled: {summary.scheduled_requests}/{summary.total_requests} ({summary.scheduled_requests/summary.total_requests*100:.1f}%)\n"
+            f"  Solve Time: {summary.solve_time_seconds:.2f}s\n"
+            f"  Solver: {summary.solver_used}\n"
+            f"  Status: {summary.result_status}\n"
+            "\n"
+            "Resource Utilization:"
+        ).encode()
         
         for util in report.resource_utilization[:5]:  # Show first 5 resources
-            lines.append(f"  {util.resource_id} ({util.resource_type}): {util.utilization_percentage:.1f}% utilization")
+            out += f"\n  {util.resource_id} ({util.resource_type}): {util.utilization_percentage:.1f}% utilization".encode()
         
         if len(report.conflict_report) > 0:
-            lines.append(f"\nConflicts Found: {len(report.conflict_report)}")
+            out += f"\n\nConflicts Found: {len(report.conflict_report)}".encode()
             for conflict in report.conflict_report[:3]:  # Show first 3 conflicts
-                lines.append(f"  {conflict.conflict_type}: {conflict.description}")
+                out += f"\n  {conflict.conflict_type}: {conflict.description}".encode()
         else:
-            lines.append("\nConflicts Found: None")
+            out += b"\n\nConflicts Found: None"
         
-        lines.append(f"\nOverall Score: {report.summary.overall_score:.2f}")
+        out += f"\n\nOverall Score: {summary.overall_score:.2f}".encode()
         
-        with open(filename, 'w') as f:
-            f.write('\n'.join(lines))
\ No newline at end of file
+        with open(filename, 'wb') as f:
+            f.write(out)
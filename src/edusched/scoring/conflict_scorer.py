@@ -1,10 +1,24 @@
 """Conflict scoring and priority system for scheduling constraints."""
 
+import re
+from collections import Counter
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 from edusched.constraints.base import Violation
+from edusched.utils.compat import SLOTTED_DATACLASS
+
+# Entity ID patterns recognised in violation messages, merged into one scan
+_AFFECTED_ID_RE = re.compile(
+    r"\b[A-Z]{2,4}\d{2,4}\b"  # Course IDs like CS401
+    r"|\bprof_[a-z_]+"  # Teacher IDs
+    r"|\bRoom\d+[A-Z]*"  # Room IDs
+    r"|\b\d{5,10}\b"  # Student IDs
+)
+
+_EXCEEDS_RE = re.compile("exceeds", re.IGNORECASE)
 
 
 class ConstraintPriority(Enum):
@@ -32,7 +46,22 @@ class ConflictType(Enum):
     PREFERENCE_VIOLATION = "preference_violation"
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _priority_for_constraint_type(constraint_type: str) -> ConstraintPriority:
+    """Map a lowercased constraint type to its priority level."""
+    if "critical" in constraint_type or "double_book" in constraint_type:
+        return ConstraintPriority.CRITICAL
+    elif "capacity" in constraint_type or "prerequisite" in constraint_type:
+        return ConstraintPriority.HIGH
+    elif "pattern" in constraint_type or "holiday" in constraint_type:
+        return ConstraintPriority.MEDIUM
+    elif "preference" in constraint_type or "soft" in constraint_type:
+        return ConstraintPriority.LOW
+    else:
+        return ConstraintPriority.MEDIUM
+
+
+@dataclass(**SLOTTED_DATACLASS)
 class ConflictScore:
     """Represents a scored conflict with weight and impact."""
 
@@ -91,15 +120,29 @@ class ConflictScorer:
 
         return total_score, detailed_scores
 
+    def _total_score(self, violations: List[Violation]) -> float:
+        """Compute the total weighted score of ``score_conflicts`` without per-violation details."""
+        total_score = 0
+        for violation in violations:
+            constraint_type = violation.constraint_type.lower()
+            priority = self._get_constraint_priority(violation, constraint_type)
+            impact_score = self._calculate_impact_score(violation, None, constraint_type)
+            total_score += priority.value * impact_score
+        return total_score
+
     def _score_single_violation(self, violation: Violation, context=None) -> ConflictScore:
         """Score a single violation."""
+        # Lowercase once and share with the helpers below
+        constraint_type = violation.constraint_type.lower()
+
         # Determine constraint type and priority
-        priority = self._get_constraint_priority(violation)
-        impact_score = self._calculate_impact_score(violation)
+        priority = self._get_constraint_priority(violation, constraint_type)
 
         # Extract affected parties from message
         affected_parties = self._extract_affected_parties(violation)
 
+        impact_score = self._calculate_impact_score(violation, affected_parties, constraint_type)
+
         # Generate suggested resolution
         suggested_resolution = self._suggest_resolution(violation)
 
@@ -111,40 +154,49 @@ class ConflictScorer:
             suggested_resolution=suggested_resolution,
         )
 
-    def _get_constraint_priority(self, violation: Violation) -> ConstraintPriority:
-        """Get the priority level for a constraint violation."""
+    def _get_constraint_priority(
+        self, violation: Violation, constraint_type: Optional[str] = None
+    ) -> ConstraintPriority:
+        """Get the priority level for a constraint violation.
+
+        ``constraint_type`` may carry the already-lowercased constraint type.
+        """
+        if constraint_type is None:
+            constraint_type = violation.constraint_type.lower()
+
         # Extract priority from constraint type
-        constraint_type = violation.constraint_type.lower()
+        return _priority_for_constraint_type(constraint_type)
 
-        if "critical" in constraint_type or "double_book" in constraint_type:
-            return ConstraintPriority.CRITICAL
-        elif "capacity" in constraint_type or "prerequisite" in constraint_type:
-            return ConstraintPriority.HIGH
-        elif "pattern" in constraint_type or "holiday" in constraint_type:
-            return ConstraintPriority.MEDIUM
-        elif "preference" in constraint_type or "soft" in constraint_type:
-            return ConstraintPriority.LOW
-        else:
-            return ConstraintPriority.MEDIUM
-
-    def _calculate_impact_score(self, violation: Violation) -> float:
-        """Calculate impact score based on violation details."""
+    def _calculate_impact_score(
+        self,
+        violation: Violation,
+        affected_parties: Optional[List[str]] = None,
+        constraint_type: Optional[str] = None,
+    ) -> float:
+        """Calculate impact score based on violation details.
+
+        ``affected_parties`` and the lowercased ``constraint_type`` may be passed
+        in when the caller already has them.
+        """
         # Base score from conflict type
-        constraint_type = violation.constraint_type.lower()
+        if constraint_type is None:
+            constraint_type = violation.constraint_type.lower()
 
         # Identify conflict type
         conflict_type = self._identify_conflict_type(constraint_type, violation.message)
         base_score = self.impact_scores.get(conflict_type, 0.5)
 
         # Adjust based on number of affected entities
-        affected_count = len(self._extract_affected_parties(violation))
+        if affected_parties is None:
+            affected_parties = self._extract_affected_parties(violation)
+        affected_count = len(affected_parties)
         if affected_count > 1:
             # Multiple entities affected increases impact
             adjustment = min(0.3, 0.1 * (affected_count - 1))
             base_score = min(1.0, base_score + adjustment)
 
         # Adjust based on severity indicators in message
-        if "exceeds" in violation.message.lower():
+        if _EXCEEDS_RE.search(violation.message):
             base_score = min(1.0, base_score + 0.2)
 
         return base_score
@@ -178,22 +230,8 @@ class ConflictScorer:
 
     def _extract_affected_parties(self, violation: Violation) -> List[str]:
         """Extract IDs of affected entities from violation message."""
-        affected = []
-
         # Look for IDs in the message
-        import re
-
-        # Extract various ID patterns
-        id_patterns = [
-            r"\b[A-Z]{2,4}\d{2,4}\b",  # Course IDs like CS401
-            r"\bprof_[a-z_]+",  # Teacher IDs
-            r"\bRoom\d+[A-Z]*",  # Room IDs
-            r"\b\d{5,10}\b",  # Student IDs
-        ]
-
-        for pattern in id_patterns:
-            matches = re.findall(pattern, violation.message)
-            affected.extend(matches)
+        affected = _AFFECTED_ID_RE.findall(violation.message)
 
         # Also include the request_id
         if violation.affected_request_id:
@@ -204,7 +242,6 @@ class ConflictScorer:
 
     def _suggest_resolution(self, violation: Violation) -> Optional[str]:
         """Suggest a resolution for the violation."""
-        violation.constraint_type.lower()
         message = violation.message.lower()
 
         if "double" in message and ("room" in message or "teacher" in message):
@@ -249,38 +286,28 @@ class ConflictScorer:
 
     def get_conflict_summary(self, detailed_scores: List[ConflictScore]) -> Dict[str, any]:
         """Generate a summary of conflicts."""
+        priority_counts = Counter(score.priority for score in detailed_scores)
+        critical = priority_counts[ConstraintPriority.CRITICAL]
+        high = priority_counts[ConstraintPriority.HIGH]
+        medium = priority_counts[ConstraintPriority.MEDIUM]
+
         summary = {
             "total_violations": len(detailed_scores),
-            "critical_violations": 0,
-            "high_violations": 0,
-            "medium_violations": 0,
-            "low_violations": 0,
+            "critical_violations": critical,
+            "high_violations": high,
+            "medium_violations": medium,
+            "low_violations": len(detailed_scores) - critical - high - medium,
             "most_common_types": {},
-            "total_impacted_parties": set(),
-            "resolutions": [],
-        }
-
-        for score in detailed_scores:
-            # Count by priority
-            if score.priority == ConstraintPriority.CRITICAL:
-                summary["critical_violations"] += 1
-            elif score.priority == ConstraintPriority.HIGH:
-                summary["high_violations"] += 1
-            elif score.priority == ConstraintPriority.MEDIUM:
-                summary["medium_violations"] += 1
-            else:
-                summary["low_violations"] += 1
-
-            # Track affected parties
-            summary["total_impacted_parties"].update(score.affected_parties)
-
+            "total_impacted_parties": len(
+                set().union(*(score.affected_parties for score in detailed_scores))
+            ),
             # Collect resolutions
-            if score.suggested_resolution:
-                summary["resolutions"].append(
-                    {"conflict": score.violation.message, "resolution": score.suggested_resolution}
-                )
-
-        summary["total_impacted_parties"] = len(summary["total_impacted_parties"])
+            "resolutions": [
+                {"conflict": score.violation.message, "resolution": score.suggested_resolution}
+                for score in detailed_scores
+                if score.suggested_resolution
+            ],
+        }
 
         return summary
 
@@ -300,7 +327,7 @@ class ConflictScorer:
         if total_assignments == 0:
             return 1.0
 
-        total_score, _ = self.score_conflicts(violations)
+        total_score = self._total_score(violations)
 
         # Normalize by number of assignments
         normalized_score = total_score / total_assignments
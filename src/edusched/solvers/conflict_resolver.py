@@ -4,12 +4,18 @@ Provides priority-based conflict resolution, constraint ranking,
 suggestion generation, and automated conflict mitigation strategies.
 """
 
+import bisect
+import copy
+import heapq
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from edusched.constraints.base import Constraint, Violation
+from edusched.utils.compat import SLOTTED_DATACLASS
+from edusched.utils.scheduling_utils import to_microseconds
 
 
 class ConflictType(Enum):
@@ -39,7 +45,19 @@ class ResolutionStrategy(Enum):
     ADJUST_DURATION = "adjust_duration"  # Change session duration
 
 
-@dataclass
+# One bit per strategy so suggested strategies can be tested with a single AND
+_STRATEGY_BIT = {strategy: 1 << i for i, strategy in enumerate(ResolutionStrategy)}
+
+
+def _strategy_mask(strategies: Iterable[ResolutionStrategy]) -> int:
+    """Encode strategies as a bitmask over _STRATEGY_BIT."""
+    mask = 0
+    for strategy in strategies:
+        mask |= _STRATEGY_BIT[strategy]
+    return mask
+
+
+@dataclass(**SLOTTED_DATACLASS)
 class Conflict:
     """Represents a scheduling conflict."""
 
@@ -63,12 +81,12 @@ class Conflict:
     alternative_assignments: List[Dict[str, Any]] = field(default_factory=list)
 
     # Metadata
-    detection_time: datetime = field(default_factory=datetime.now)
+    detection_time: Optional[datetime] = None  # Set when the detector records it
     resolver: Optional[str] = None  # What/who detected the conflict
     context: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class ConstraintRanking:
     """Ranking configuration for constraints."""
 
@@ -81,7 +99,7 @@ class ConstraintRanking:
     relax_penalty: float = 0.0
 
 
-@dataclass
+@dataclass(**SLOTTED_DATACLASS)
 class ResolutionResult:
     """Result of conflict resolution attempt."""
 
@@ -90,14 +108,289 @@ class ResolutionResult:
     remaining_conflicts: List[str] = field(default_factory=list)
     resolution_strategy: Optional[ResolutionStrategy] = None
     resolution_details: Dict[str, Any] = field(default_factory=dict)
-    new_conflicts: List[Conflict] = field(default_factory=list)
+    new_conflicts: Sequence[Conflict] = field(default_factory=list)
     quality_impact: float = 0.0  # -1 to 1, negative = lower quality
 
 
+# Sentinel for constraint check results missing from the cache
+_MISSING = object()
+
+
+def _span_us(assignment: Any) -> Tuple[int, int]:
+    """Return an assignment's (start, end) as integer microseconds since the epoch."""
+    start_time = assignment.start_time
+    return to_microseconds(start_time), to_microseconds(start_time + assignment.duration)
+
+
+def _overlap_pairs(starts: Sequence[int], ends: Sequence[int]) -> List[Tuple[int, int]]:
+    """
+    Sweep-line kernel behind ``ConflictDetector._pairwise_overlaps``.
+
+    Works on plain integer spans only, so the hot loop touches no assignment
+    objects. Buckets usually arrive in schedule order with every session
+    finished before the next one starts, so a linear pre-pass returns early
+    for those and skips the sort for any bucket already in start order.
+
+    Args:
+        starts: Start of each interval
+        ends: End of each interval
+
+    Returns:
+        Sorted ``(i, j)`` index pairs of overlapping intervals with ``i < j``
+    """
+    in_order = True
+    disjoint = True
+    previous = reach = starts[0] if starts else 0
+    for start, end in zip(starts, ends):
+        if start < previous:
+            in_order = disjoint = False
+            break
+        if start < reach:
+            disjoint = False
+        previous = start
+        if end > reach:
+            reach = end
+    if disjoint:
+        return []
+
+    heappush = heapq.heappush
+    heappop = heapq.heappop
+    pairs = []
+    active: List[Tuple[int, int]] = []  # (end, index) of intervals still running
+    if in_order:
+        ordered = zip(starts, range(len(starts)))
+    else:
+        # Sorting (start, index) tuples avoids a key function call per element
+        ordered = sorted(zip(starts, range(len(starts))))
+    for start, idx in ordered:
+        while active and active[0][0] <= start:
+            heappop(active)
+        if active:
+            end = ends[idx]
+            for _, other in active:
+                # starts[other] <= start, so only the reverse bound needs checking
+                if starts[other] < end:
+                    pairs.append((other, idx) if other < idx else (idx, other))
+        heappush(active, (ends[idx], idx))
+
+    pairs.sort()
+    return pairs
+
+
+class _IntervalIndex:
+    """Assignments sharing one resource, teacher or student, ordered by start time.
+
+    Spans are integer microseconds, as returned by ``_span_us``.
+    """
+
+    def __init__(self):
+        self._starts: List[int] = []
+        self._entries: List[Tuple[int, int, Any]] = []
+        self._max_length = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, start: int, end: int, item: Any) -> None:
+        """Insert an item spanning ``[start, end)``."""
+        pos = bisect.bisect_right(self._starts, start)
+        self._starts.insert(pos, start)
+        self._entries.insert(pos, (start, end, item))
+        if end - start > self._max_length:
+            self._max_length = end - start
+
+    def remove(self, start: int, item: Any) -> bool:
+        """Remove an item previously added with ``start``."""
+        pos = bisect.bisect_left(self._starts, start)
+        while pos < len(self._starts) and self._starts[pos] == start:
+            if self._entries[pos][2] is item:
+                del self._starts[pos]
+                del self._entries[pos]
+                return True
+            pos += 1
+        return False
+
+    def overlapping(self, start: int, end: int) -> Iterator[Any]:
+        """Yield the items whose span overlaps ``[start, end)``."""
+        # Nothing starting at or before start - max_length can still be running
+        lo = bisect.bisect_right(self._starts, start - self._max_length)
+        hi = bisect.bisect_left(self._starts, end)
+        for _entry_start, entry_end, item in self._entries[lo:hi]:
+            if entry_end > start:
+                yield item
+
+
+class ConflictBatch(Sequence[Conflict]):
+    """
+    Detection results stored column-wise and built into Conflict objects on access.
+
+    Overlap detectors can report a large number of pairs, most of which are
+    only counted or sorted. The batch stores the few fields that vary per
+    overlap in parallel lists and only creates the ``Conflict`` (with its
+    many default lists) when an entry is read. Prebuilt conflicts from other
+    detectors are stored as they are.
+    """
+
+    def __init__(self, conflicts: Iterable[Conflict] = ()):
+        self.kinds: List[Optional[str]] = []  # overlap kind, None for prebuilt conflicts
+        self.severities: List[float] = []
+        self.entity_ids: List[Optional[str]] = []
+        self.positions: List[Optional[Tuple[int, int]]] = []
+        self.assignment_ids: List[Optional[Tuple[str, str]]] = []
+        self.detection_time: Optional[datetime] = None
+        self._conflicts: List[Optional[Conflict]] = []
+        self.extend(conflicts)
+
+    def __len__(self) -> int:
+        return len(self._conflicts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.materialize(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("ConflictBatch index out of range")
+        return self.materialize(index)
+
+    def add_overlap(
+        self,
+        kind: str,
+        entity_id: str,
+        i: int,
+        j: int,
+        assignment_a: Any,
+        assignment_b: Any,
+    ) -> None:
+        """Record an overlap between positions ``i`` and ``j`` of an entity's bucket."""
+        self.kinds.append(kind)
+        self.severities.append(_OVERLAP_SEVERITY[kind])
+        self.entity_ids.append(entity_id)
+        self.positions.append((i, j))
+        self.assignment_ids.append((assignment_a.id, assignment_b.id))
+        self._conflicts.append(None)
+
+    def add(self, conflict: Conflict) -> None:
+        """Store an already built conflict."""
+        self.kinds.append(None)
+        self.severities.append(conflict.severity)
+        self.entity_ids.append(None)
+        self.positions.append(None)
+        self.assignment_ids.append(None)
+        self._conflicts.append(conflict)
+
+    def extend(self, conflicts: Iterable[Conflict]) -> None:
+        """Append conflicts, copying another batch's columns without building them."""
+        if isinstance(conflicts, ConflictBatch):
+            self.kinds.extend(conflicts.kinds)
+            self.severities.extend(conflicts.severities)
+            self.entity_ids.extend(conflicts.entity_ids)
+            self.positions.extend(conflicts.positions)
+            self.assignment_ids.extend(conflicts.assignment_ids)
+            self._conflicts.extend(conflicts._conflicts)
+        else:
+            for conflict in conflicts:
+                self.add(conflict)
+
+    def materialize(self, index: int) -> Conflict:
+        """Build (once) and return the conflict at ``index``."""
+        conflict = self._conflicts[index]
+        if conflict is None:
+            i, j = self.positions[index]
+            conflict = _build_overlap_conflict(
+                self.kinds[index], self.entity_ids[index], i, j, self.assignment_ids[index]
+            )
+            if self.detection_time is not None:
+                conflict.detection_time = self.detection_time
+            self._conflicts[index] = conflict
+        return conflict
+
+    def conflict_id(self, index: int) -> str:
+        """Return the id of the conflict at ``index`` without building the conflict."""
+        conflict = self._conflicts[index]
+        if conflict is not None:
+            return conflict.conflict_id
+        i, j = self.positions[index]
+        return _overlap_conflict_id(self.kinds[index], self.entity_ids[index], i, j)
+
+    def conflict_ids(self) -> List[str]:
+        """Return every conflict id in order, building ids but not conflicts."""
+        return [self.conflict_id(index) for index in range(len(self))]
+
+    def order_by_severity(self) -> List[int]:
+        """Indices ordered by severity, highest first, keeping detection order for ties."""
+        return sorted(range(len(self)), key=self.severities.__getitem__, reverse=True)
+
+
+_OVERLAP_SEVERITY = {"resource": 0.9, "teacher": 0.8, "student": 0.6}
+# Pattern detectors that only compare assignments sharing a bucket
+_OVERLAP_CONFLICT_TYPES = frozenset(
+    {
+        ConflictType.RESOURCE_DOUBLE_BOOKING,
+        ConflictType.TEACHER_OVERLOAD,
+        ConflictType.STUDENT_CONFLICT,
+    }
+)
+_OVERLAP_ID_PREFIX = {
+    "resource": "resource_conflict",
+    "teacher": "teacher_overload",
+    "student": "student_conflict",
+}
+
+
+def _overlap_conflict_id(kind: str, entity_id: str, i: int, j: int) -> str:
+    """Format the id of an overlap conflict; only done when the id is read."""
+    return f"{_OVERLAP_ID_PREFIX[kind]}_{entity_id}_{i}_{j}"
+
+
+def _build_overlap_conflict(
+    kind: str, entity_id: str, i: int, j: int, assignment_ids: Tuple[str, str]
+) -> Conflict:
+    """Build the Conflict for an overlap recorded in a ConflictBatch."""
+    if kind == "resource":
+        return Conflict(
+            conflict_id=_overlap_conflict_id(kind, entity_id, i, j),
+            conflict_type=ConflictType.RESOURCE_DOUBLE_BOOKING,
+            severity=0.9,  # High severity
+            description=f"Resource {entity_id} double-booked",
+            assignment_ids=list(assignment_ids),
+            resource_ids=[entity_id],
+            suggested_strategies=[
+                ResolutionStrategy.RESCHEDULE,
+                ResolutionStrategy.REASSIGN,
+            ],
+        )
+    if kind == "teacher":
+        return Conflict(
+            conflict_id=_overlap_conflict_id(kind, entity_id, i, j),
+            conflict_type=ConflictType.TEACHER_OVERLOAD,
+            severity=0.8,
+            description=f"Teacher {entity_id} has overlapping assignments",
+            assignment_ids=list(assignment_ids),
+            teacher_ids=[entity_id],
+            suggested_strategies=[
+                ResolutionStrategy.RESCHEDULE,
+                ResolutionStrategy.ADJUST_DURATION,
+            ],
+        )
+    return Conflict(
+        conflict_id=_overlap_conflict_id(kind, entity_id, i, j),
+        conflict_type=ConflictType.STUDENT_CONFLICT,
+        severity=0.6,  # Medium severity
+        description=f"Student {entity_id} has overlapping classes",
+        assignment_ids=list(assignment_ids),
+        student_ids=[entity_id],
+        suggested_strategies=[
+            ResolutionStrategy.RESCHEDULE,
+        ],
+    )
+
+
 class ConflictDetector:
     """Detects various types of scheduling conflicts."""
 
-    def __init__(self):
+    def __init__(self, record_detection_time: bool = False):
+        self.record_detection_time = record_detection_time
         self.conflict_patterns = {
             ConflictType.RESOURCE_DOUBLE_BOOKING: self._detect_resource_conflicts,
             ConflictType.TEACHER_OVERLOAD: self._detect_teacher_overload,
@@ -105,33 +398,130 @@ class ConflictDetector:
             ConflictType.TIME_SLOT_UNAVAILABLE: self._detect_time_slot_conflicts,
             ConflictType.STUDENT_CONFLICT: self._detect_student_conflicts,
         }
+        # (start, end) microseconds per assignment, keyed by id(), while a detection pass runs
+        self._intervals: Optional[Dict[int, Tuple[int, int]]] = None
+        # id(list) -> (assignments, requests) looked up once for the lists of the current pass
+        self._pass_requests: Dict[int, Tuple[List[Any], List[Any]]] = {}
+        # Persistent per-resource/teacher/student interval indices, see _build_indices
+        self._indices: Dict[Tuple[str, str], _IntervalIndex] = {}
+        self._index_keys: Dict[int, Tuple[Tuple[int, int], List[Tuple[str, str]]]] = {}
+        # Results of checks by constraints that define cache_key, per assignment id
+        # and (constraint, key), kept across detection passes
+        self._check_cache: Dict[str, Dict[Tuple[Any, Any], Optional[Violation]]] = {}
 
     def detect_all_conflicts(
         self,
         assignments: List[Any],
         context: Any,
-    ) -> List[Conflict]:
+    ) -> ConflictBatch:
         """Detect all conflicts in the schedule."""
-        conflicts = []
-
-        # Run all detection patterns
-        for _conflict_type, detector in self.conflict_patterns.items():
-            detected = detector(assignments, context)
-            conflicts.extend(detected)
+        conflicts = ConflictBatch()
+
+        # Compute every assignment's time span and request once for all the detectors
+        self._intervals = self._build_interval_table(assignments)
+        requests = self._lookup_requests(assignments, context)
+        self._pass_requests = {id(assignments): (assignments, requests)}
+
+        # Assignments alone in their partition share no resource, teacher or
+        # student with anything, so the overlap detectors can skip them
+        partitions = self._partition(assignments, context, requests)
+        if len(partitions) == len(assignments):
+            clustered = []
+        else:
+            positions = {id(a): k for k, a in enumerate(assignments)}
+            members = sorted(
+                positions[id(a)] for group in partitions if len(group) > 1 for a in group
+            )
+            clustered = [assignments[k] for k in members]
+            self._pass_requests[id(clustered)] = (clustered, [requests[k] for k in members])
+
+        try:
+            # Run all detection patterns
+            for conflict_type, detector in self.conflict_patterns.items():
+                if conflict_type in _OVERLAP_CONFLICT_TYPES:
+                    detected = detector(clustered, context)
+                else:
+                    detected = detector(assignments, context)
+                conflicts.extend(detected)
+        finally:
+            self._intervals = None
+            self._pass_requests = {}
 
         # Detect constraint violations
         constraint_conflicts = self._detect_constraint_violations(assignments, context)
         conflicts.extend(constraint_conflicts)
 
+        self._stamp_detection_time(conflicts)
+        return conflicts
+
+    def detect_around(
+        self,
+        changed_assignment_ids: Iterable[str],
+        assignments: List[Any],
+        context: Any,
+    ) -> ConflictBatch:
+        """
+        Detect conflicts involving the buckets touched by changed assignments.
+
+        Only the resources, teachers and students of the changed assignments
+        are re-checked for overlaps, and only the changed assignments go
+        through the per-assignment detectors. Buckets keep schedule order, so
+        conflict ids match the ones ``detect_all_conflicts`` would produce.
+
+        Args:
+            changed_assignment_ids: Ids of assignments added, moved or in a
+                conflict that was just resolved
+            assignments: Current assignments
+            context: Scheduling context
+
+        Returns:
+            Conflicts in the affected part of the schedule
+        """
+        changed_ids = set(changed_assignment_ids)
+        changed = [a for a in assignments if a.id in changed_ids]
+        if not changed:
+            return ConflictBatch()
+
+        buckets: Dict[Tuple[str, str], List[Any]] = {
+            key: [] for a in changed for key in self._bucket_keys(a, context)
+        }
+        for assignment, request in zip(assignments, self._lookup_requests(assignments, context)):
+            for key in self._bucket_keys(assignment, context, request):
+                bucket = buckets.get(key)
+                if bucket is not None:
+                    bucket.append(assignment)
+
+        overlaps = {kind: ConflictBatch() for kind in _OVERLAP_SEVERITY}
+        for (kind, entity_id), bucket in buckets.items():
+            self._add_bucket_overlaps(overlaps[kind], kind, entity_id, bucket)
+
+        # Same order as detect_all_conflicts
+        conflicts = overlaps["resource"]
+        conflicts.extend(overlaps["teacher"])
+        conflicts.extend(self._detect_capacity_issues(changed, context))
+        conflicts.extend(self._detect_time_slot_conflicts(changed, context))
+        conflicts.extend(overlaps["student"])
+        conflicts.extend(self._detect_constraint_violations(assignments, context, changed))
+
+        self._stamp_detection_time(conflicts)
         return conflicts
 
+    def _stamp_detection_time(self, conflicts: ConflictBatch) -> None:
+        """Give every conflict from one pass the same detection time, if enabled."""
+        if self.record_detection_time:
+            now = datetime.now()
+            conflicts.detection_time = now
+            for conflict in conflicts._conflicts:
+                if conflict is not None:
+                    conflict.detection_time = now
+
     def _detect_resource_conflicts(
         self,
         assignments: List[Any],
         context: Any,
-    ) -> List[Conflict]:
+    ) -> ConflictBatch:
         """Detect resource double-booking conflicts."""
-        conflicts = []
+        conflicts = ConflictBatch()
         resource_usage = {}
 
         # Build resource usage map
@@ -144,37 +534,28 @@ class ConflictDetector:
 
         # Check for conflicts
         for resource_id, usage in resource_usage.items():
-            for i in range(len(usage)):
-                for j in range(i + 1, len(usage)):
-                    if self._assignments_overlap(usage[i], usage[j]):
-                        conflict = Conflict(
-                            conflict_id=f"resource_conflict_{resource_id}_{i}_{j}",
-                            conflict_type=ConflictType.RESOURCE_DOUBLE_BOOKING,
-                            severity=0.9,  # High severity
-                            description=f"Resource {resource_id} double-booked",
-                            assignment_ids=[usage[i].id, usage[j].id],
-                            resource_ids=[resource_id],
-                            suggested_strategies=[
-                                ResolutionStrategy.RESCHEDULE,
-                                ResolutionStrategy.REASSIGN,
-                            ],
-                        )
-                        conflicts.append(conflict)
+            self._add_bucket_overlaps(conflicts, "resource", resource_id, usage)
 
         return conflicts
 
+    def _add_bucket_overlaps(
+        self, batch: ConflictBatch, kind: str, entity_id: str, bucket: List[Any]
+    ) -> None:
+        """Record every overlapping pair within one resource, teacher or student bucket."""
+        for i, j in self._pairwise_overlaps(bucket):
+            batch.add_overlap(kind, entity_id, i, j, bucket[i], bucket[j])
+
     def _detect_teacher_overload(
         self,
         assignments: List[Any],
         context: Any,
-    ) -> List[Conflict]:
+    ) -> ConflictBatch:
         """Detect teacher overload conflicts."""
-        conflicts = []
+        conflicts = ConflictBatch()
         teacher_assignments = {}
 
         # Group by teacher
-        for assignment in assignments:
-            request = context.request_lookup.get(assignment.request_id)
+        for assignment, request in zip(assignments, self._requests_for(assignments, context)):
             if request and request.teacher_id:
                 teacher_id = request.teacher_id
                 if teacher_id not in teacher_assignments:
@@ -183,22 +564,7 @@ class ConflictDetector:
 
         # Check for overlaps
         for teacher_id, assignments_list in teacher_assignments.items():
-            for i in range(len(assignments_list)):
-                for j in range(i + 1, len(assignments_list)):
-                    if self._assignments_overlap(assignments_list[i], assignments_list[j]):
-                        conflict = Conflict(
-                            conflict_id=f"teacher_overload_{teacher_id}_{i}_{j}",
-                            conflict_type=ConflictType.TEACHER_OVERLOAD,
-                            severity=0.8,
-                            description=f"Teacher {teacher_id} has overlapping assignments",
-                            assignment_ids=[assignments_list[i].id, assignments_list[j].id],
-                            teacher_ids=[teacher_id],
-                            suggested_strategies=[
-                                ResolutionStrategy.RESCHEDULE,
-                                ResolutionStrategy.ADJUST_DURATION,
-                            ],
-                        )
-                        conflicts.append(conflict)
+            self._add_bucket_overlaps(conflicts, "teacher", teacher_id, assignments_list)
 
         return conflicts
 
@@ -210,8 +576,7 @@ class ConflictDetector:
         """Detect capacity exceeded conflicts."""
         conflicts = []
 
-        for assignment in assignments:
-            request = context.request_lookup.get(assignment.request_id)
+        for assignment, request in zip(assignments, self._requests_for(assignments, context)):
             resource = context.resource_lookup.get(assignment.resource.id)
 
             if request and resource and hasattr(resource, "capacity"):
@@ -241,12 +606,12 @@ class ConflictDetector:
         """Detect time slot availability conflicts."""
         conflicts = []
 
-        for assignment in assignments:
-            request = context.request_lookup.get(assignment.request_id)
+        for assignment, request in zip(assignments, self._requests_for(assignments, context)):
             if request and hasattr(request, "blackout_dates"):
+                assignment_date = assignment.start_time.date()
                 # Check against blackout dates
                 for start_date, end_date in request.blackout_dates:
-                    if start_date <= assignment.start_time.date() <= end_date:
+                    if start_date <= assignment_date <= end_date:
                         conflict = Conflict(
                             conflict_id=f"blackout_date_{assignment.id}",
                             conflict_type=ConflictType.BLACKOUT_DATE,
@@ -265,14 +630,13 @@ class ConflictDetector:
         self,
         assignments: List[Any],
         context: Any,
-    ) -> List[Conflict]:
+    ) -> ConflictBatch:
         """Detect student scheduling conflicts."""
-        conflicts = []
+        conflicts = ConflictBatch()
         student_assignments = {}
 
         # Group by student
-        for assignment in assignments:
-            request = context.request_lookup.get(assignment.request_id)
+        for assignment, request in zip(assignments, self._requests_for(assignments, context)):
             if request and hasattr(request, "enrolled_students"):
                 for student_id in request.enrolled_students:
                     if student_id not in student_assignments:
@@ -281,21 +645,7 @@ class ConflictDetector:
 
         # Check for overlaps
         for student_id, assignments_list in student_assignments.items():
-            for i in range(len(assignments_list)):
-                for j in range(i + 1, len(assignments_list)):
-                    if self._assignments_overlap(assignments_list[i], assignments_list[j]):
-                        conflict = Conflict(
-                            conflict_id=f"student_conflict_{student_id}_{i}_{j}",
-                            conflict_type=ConflictType.STUDENT_CONFLICT,
-                            severity=0.6,  # Medium severity
-                            description=f"Student {student_id} has overlapping classes",
-                            assignment_ids=[assignments_list[i].id, assignments_list[j].id],
-                            student_ids=[student_id],
-                            suggested_strategies=[
-                                ResolutionStrategy.RESCHEDULE,
-                            ],
-                        )
-                        conflicts.append(conflict)
+            self._add_bucket_overlaps(conflicts, "student", student_id, assignments_list)
 
         return conflicts
 
@@ -303,13 +653,50 @@ class ConflictDetector:
         self,
         assignments: List[Any],
         context: Any,
+        targets: Optional[List[Any]] = None,
     ) -> List[Conflict]:
-        """Detect general constraint violations."""
-        conflicts = []
+        """Detect general constraint violations.
 
-        for assignment in assignments:
-            for constraint in context.constraints:
-                violation = constraint.check(assignment, assignments, context)
+        Args:
+            assignments: Full schedule passed to each constraint check
+            context: Scheduling context
+            targets: Assignments to check; defaults to all of ``assignments``
+        """
+        constraints = list(context.constraints or ())
+        if not constraints:
+            return []
+
+        if targets is None:
+            targets = assignments
+        caches: Optional[List[Dict[Tuple[Any, Any], Optional[Violation]]]] = None
+
+        # Check each constraint once over every assignment missing from the cache.
+        # Only verdicts with a cache_key are reused; the rest may depend on the
+        # other assignments and are checked on every pass.
+        results = []
+        for constraint in constraints:
+            cache_key = getattr(constraint, "cache_key", None)
+            keys = [cache_key(a) for a in targets] if cache_key is not None else [None] * len(targets)
+            row: List[Any] = [_MISSING] * len(targets)
+            if any(key is not None for key in keys):
+                if caches is None:
+                    caches = [self._check_cache.setdefault(a.id, {}) for a in targets]
+                for k, key in enumerate(keys):
+                    if key is not None:
+                        row[k] = caches[k].get((constraint, key), _MISSING)
+            missing = [k for k, violation in enumerate(row) if violation is _MISSING]
+            if missing:
+                found = self._check_many(constraint, [targets[k] for k in missing], assignments, context)
+                for k in missing:
+                    row[k] = found.get(id(targets[k]))
+                    if keys[k] is not None:
+                        caches[k][(constraint, keys[k])] = row[k]
+            results.append(row)
+
+        conflicts = []
+        for k, assignment in enumerate(targets):
+            for constraint, row in zip(constraints, results):
+                violation = row[k]
                 if violation:
                     conflict = Conflict(
                         conflict_id=f"constraint_violation_{constraint.constraint_type}_{assignment.id}",
@@ -328,11 +715,282 @@ class ConflictDetector:
 
         return conflicts
 
+    def _check_many(
+        self,
+        constraint: Any,
+        targets: List[Any],
+        assignments: List[Any],
+        context: Any,
+    ) -> Dict[int, Violation]:
+        """Run one constraint over several assignments, keyed by id() of the violator."""
+        check_batch = getattr(constraint, "check_batch", None)
+        if check_batch is not None:
+            return {id(a): violation for a, violation in check_batch(targets, assignments, context)}
+
+        found = {}
+        for assignment in targets:
+            violation = constraint.check(assignment, assignments, context)
+            if violation:
+                found[id(assignment)] = violation
+        return found
+
+    def invalidate(self, assignment_ids: Iterable[str]) -> None:
+        """
+        Drop cached constraint check results for the given assignments.
+
+        Only constraints that define ``Constraint.cache_key`` are cached, keyed
+        by that key, so results stay valid while the constraint and context
+        are unchanged. Callers that swap constraints or edit the context in
+        place should invalidate the affected assignments or clear the cache.
+
+        Args:
+            assignment_ids: Ids of assignments to re-check on the next pass
+        """
+        for assignment_id in assignment_ids:
+            self._check_cache.pop(assignment_id, None)
+
+    def clear_cache(self) -> None:
+        """Drop all cached constraint check results."""
+        self._check_cache.clear()
+
+    def _build_interval_table(self, assignments: List[Any]) -> Dict[int, Tuple[int, int]]:
+        """Map each assignment's id() to its (start, end) in epoch microseconds."""
+        return {id(a): _span_us(a) for a in assignments}
+
+    def _pairwise_overlaps(self, assignments: List[Any]) -> List[Tuple[int, int]]:
+        """
+        Find every pair of overlapping assignments with a sweep line.
+
+        Assignments are visited in start order while a heap keeps the ones that
+        have not ended yet, so only actually overlapping pairs are compared.
+
+        Args:
+            assignments: Assignments sharing a resource, teacher or student
+
+        Returns:
+            Sorted ``(i, j)`` index pairs into ``assignments`` with ``i < j``
+        """
+        if len(assignments) < 2:
+            return []
+
+        intervals = self._intervals
+        if intervals is None:
+            intervals = self._build_interval_table(assignments)
+        starts, ends = zip(*[intervals[id(a)] for a in assignments])
+        return _overlap_pairs(starts, ends)
+
+    def _build_indices(
+        self,
+        assignments: List[Any],
+        context: Any,
+    ) -> Dict[Tuple[str, str], _IntervalIndex]:
+        """
+        Build interval indices for every resource, teacher and student.
+
+        The indices are cached on the detector and kept up to date through
+        ``add_assignment`` and ``remove_assignment``, so overlaps for a single
+        assignment can be found without rescanning the whole schedule.
+
+        Args:
+            assignments: Current assignments
+            context: Scheduling context
+
+        Returns:
+            Mapping of ``(kind, entity_id)`` to the entity's interval index
+        """
+        self._indices = {}
+        self._index_keys = {}
+        for assignment in assignments:
+            self.add_assignment(assignment, context)
+        return self._indices
+
+    def add_assignment(self, assignment: Any, context: Any) -> None:
+        """Add an assignment to the cached interval indices."""
+        span = _span_us(assignment)
+        keys = list(dict.fromkeys(self._bucket_keys(assignment, context)))
+        for key in keys:
+            index = self._indices.get(key)
+            if index is None:
+                index = self._indices[key] = _IntervalIndex()
+            index.add(span[0], span[1], assignment)
+        self._index_keys[id(assignment)] = (span, keys)
+
+    def remove_assignment(self, assignment: Any) -> None:
+        """Remove an assignment from the cached interval indices, if present."""
+        entry = self._index_keys.pop(id(assignment), None)
+        if entry is None:
+            return
+        (start, _end), keys = entry
+        for key in keys:
+            index = self._indices.get(key)
+            if index is not None:
+                index.remove(start, assignment)
+                if not index:
+                    del self._indices[key]
+
+    def find_overlapping(self, assignment: Any) -> List[Tuple[Tuple[str, str], Any]]:
+        """
+        Find indexed assignments that overlap an indexed assignment.
+
+        Args:
+            assignment: Assignment previously added to the indices
+
+        Returns:
+            ``(bucket key, other assignment)`` pairs, one per shared bucket
+        """
+        entry = self._index_keys.get(id(assignment))
+        if entry is None:
+            return []
+        (start, end), keys = entry
+        return [
+            (key, other)
+            for key in keys
+            for other in self._indices[key].overlapping(start, end)
+            if other is not assignment
+        ]
+
+    def _lookup_requests(self, assignments: List[Any], context: Any) -> List[Any]:
+        """Look up the request of every assignment, in order."""
+        lookup = context.request_lookup.get
+        return [lookup(assignment.request_id) for assignment in assignments]
+
+    def _requests_for(self, assignments: List[Any], context: Any) -> List[Any]:
+        """Requests for ``assignments``, reusing the current pass's lookups when possible."""
+        cached = self._pass_requests.get(id(assignments))
+        if cached is not None and cached[0] is assignments:
+            return cached[1]
+        return self._lookup_requests(assignments, context)
+
+    def _partition(
+        self,
+        assignments: List[Any],
+        context: Any,
+        requests: Optional[List[Any]] = None,
+    ) -> List[List[Any]]:
+        """
+        Split assignments into groups that share no resource, teacher or student.
+
+        Uses union-find over the bucket keys, so two assignments land in the
+        same group exactly when a chain of shared buckets links them.
+
+        Args:
+            assignments: Assignments to split
+            context: Scheduling context
+            requests: Requests aligned with ``assignments``, looked up if omitted
+
+        Returns:
+            Groups in order of their first member, each in schedule order
+        """
+        if requests is None:
+            requests = self._lookup_requests(assignments, context)
+        parent = list(range(len(assignments)))
+
+        def find(k: int) -> int:
+            while parent[k] != k:
+                parent[k] = parent[parent[k]]
+                k = parent[k]
+            return k
+
+        first_member: Dict[Tuple[str, str], int] = {}
+        for k, (assignment, request) in enumerate(zip(assignments, requests)):
+            for key in self._bucket_keys(assignment, context, request):
+                other = first_member.setdefault(key, k)
+                if other != k:
+                    root_other, root = find(other), find(k)
+                    if root_other != root:
+                        parent[root] = root_other
+
+        groups: Dict[int, List[Any]] = {}
+        for k, assignment in enumerate(assignments):
+            groups.setdefault(find(k), []).append(assignment)
+        return list(groups.values())
+
+    def _bucket_keys(
+        self, assignment: Any, context: Any, request: Any = _MISSING
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield the resource, teacher and student buckets an assignment belongs to."""
+        for resource in assignment.assigned_resources:
+            for resource_id in resource:
+                yield ("resource", resource_id)
+
+        if request is _MISSING:
+            request = context.request_lookup.get(assignment.request_id)
+        if request and getattr(request, "teacher_id", None):
+            yield ("teacher", request.teacher_id)
+        if request and hasattr(request, "enrolled_students"):
+            for student_id in request.enrolled_students:
+                yield ("student", student_id)
+
     def _assignments_overlap(self, assignment1: Any, assignment2: Any) -> bool:
         """Check if two assignments overlap in time."""
-        end1 = assignment1.start_time + assignment1.duration
-        end2 = assignment2.start_time + assignment2.duration
-        return assignment1.start_time < end2 and assignment2.start_time < end1
+        start1, end1 = _span_us(assignment1)
+        start2, end2 = _span_us(assignment2)
+        return start1 < end2 and start2 < end1
+
+
+# Cost marking an assignment/resource pairing as impossible in the matching
+_INFEASIBLE_COST = 1e9
+
+
+def _min_cost_assignment(cost: List[List[float]]) -> List[int]:
+    """
+    Solve a rectangular assignment problem with the Hungarian algorithm.
+
+    Args:
+        cost: Row-major cost matrix with no more rows than columns
+
+    Returns:
+        The column matched to each row, minimising the total cost
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    inf = float("inf")
+    # Potentials and matching are 1-based; column 0 is a virtual start column
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    match = [0] * (m + 1)  # row matched to each column
+    way = [0] * (m + 1)
+
+    for row in range(1, n + 1):
+        match[0] = row
+        col0 = 0
+        min_slack = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[col0] = True
+            row0 = match[col0]
+            delta = inf
+            col1 = 0
+            costs = cost[row0 - 1]
+            for col in range(1, m + 1):
+                if not used[col]:
+                    slack = costs[col - 1] - u[row0] - v[col]
+                    if slack < min_slack[col]:
+                        min_slack[col] = slack
+                        way[col] = col0
+                    if min_slack[col] < delta:
+                        delta = min_slack[col]
+                        col1 = col
+            for col in range(m + 1):
+                if used[col]:
+                    u[match[col]] += delta
+                    v[col] -= delta
+                else:
+                    min_slack[col] -= delta
+            col0 = col1
+            if match[col0] == 0:
+                break
+        # Flip the augmenting path
+        while col0:
+            col1 = way[col0]
+            match[col0] = match[col1]
+            col0 = col1
+
+    result = [-1] * n
+    for col in range(1, m + 1):
+        if match[col]:
+            result[match[col] - 1] = col - 1
+    return result
 
 
 class ConflictResolver:
@@ -345,12 +1003,15 @@ class ConflictResolver:
             ResolutionStrategy.REMOVE_VIOLATION: self._resolve_by_removal,
             ResolutionStrategy.RESCHEDULE: self._resolve_by_rescheduling,
             ResolutionStrategy.REASSIGN: self._resolve_by_reassignment,
-            ResolutionStrategy.ALTERNATIVE_RESOURCE: self._resolve_with_alternative,
+            ResolutionStrategy.ALTERNATE_RESOURCE: self._resolve_with_alternative,
         }
+        # id -> assignment and id -> list position while resolve_conflicts runs
+        self._assignment_by_id: Optional[Dict[str, Any]] = None
+        self._assignment_positions: Optional[Dict[str, int]] = None
 
     def resolve_conflicts(
         self,
-        conflicts: List[Conflict],
+        conflicts: Sequence[Conflict],
         assignments: List[Any],
         context: Any,
         strategy_order: Optional[List[ResolutionStrategy]] = None,
@@ -369,46 +1030,64 @@ class ConflictResolver:
         """
         if not strategy_order:
             strategy_order = [
-                ResolutionStrategy.ALTERNATIVE_RESOURCE,
+                ResolutionStrategy.ALTERNATE_RESOURCE,
                 ResolutionStrategy.RESCHEDULE,
                 ResolutionStrategy.REASSIGN,
                 ResolutionStrategy.REMOVE_VIOLATION,
             ]
 
+        ordered_bits = [(strategy, _STRATEGY_BIT[strategy]) for strategy in strategy_order]
         result = ResolutionResult(success=False)
-        remaining_conflicts = conflicts.copy()
-
-        # Sort conflicts by severity (highest first)
-        remaining_conflicts.sort(key=lambda c: c.severity, reverse=True)
-
-        # Try to resolve each conflict
-        for conflict in remaining_conflicts:
-            for strategy in strategy_order:
-                if strategy not in conflict.suggested_strategies:
-                    continue
-
-                strategy_result = self._apply_resolution_strategy(
-                    conflict, strategy, assignments, context
-                )
-
-                if strategy_result.success:
-                    result.success = True
-                    result.resolved_conflicts.append(conflict.conflict_id)
-                    result.resolution_strategy = strategy
-                    result.resolution_details.update(strategy_result.resolution_details)
 
-                    # Check for new conflicts
-                    new_conflicts = self.detector.detect_all_conflicts(assignments, context)
-                    result.new_conflicts = new_conflicts
-
-                    break  # Move to next conflict
-                else:
-                    # Try next strategy
-                    continue
+        # Sort conflicts by severity (highest first); batches sort on their severity column
+        if isinstance(conflicts, ConflictBatch):
+            remaining_conflicts = [conflicts[i] for i in conflicts.order_by_severity()]
+        else:
+            remaining_conflicts = sorted(conflicts, key=lambda c: c.severity, reverse=True)
+
+        # Look assignments up by id; removals leave a None hole compacted at the end
+        self._assignment_by_id = {a.id: a for a in reversed(assignments)}
+        self._assignment_positions = {a.id: i for i, a in reversed(list(enumerate(assignments)))}
+        try:
+            # Try to resolve each conflict
+            for conflict in remaining_conflicts:
+                suggested = _strategy_mask(conflict.suggested_strategies)
+                for strategy, bit in ordered_bits:
+                    if not suggested & bit:
+                        continue
+
+                    strategy_result = self._apply_resolution_strategy(
+                        conflict, strategy, assignments, context
+                    )
 
-            # If no strategy worked, add to remaining conflicts
-            if conflict.conflict_id not in result.resolved_conflicts:
-                result.remaining_conflicts.append(conflict.conflict_id)
+                    if strategy_result.success:
+                        result.success = True
+                        result.resolved_conflicts.append(conflict.conflict_id)
+                        result.resolution_strategy = strategy
+                        result.resolution_details.update(strategy_result.resolution_details)
+
+                        # Check for new conflicts around the assignments that changed
+                        live = [a for a in assignments if a is not None]
+                        new_conflicts = self.detector.detect_around(
+                            strategy_result.resolution_details.get("changed_ids", ()),
+                            live,
+                            context,
+                        )
+                        result.new_conflicts = new_conflicts
+
+                        break  # Move to next conflict
+                    else:
+                        # Try next strategy
+                        continue
+
+                # If no strategy worked, add to remaining conflicts
+                if conflict.conflict_id not in result.resolved_conflicts:
+                    result.remaining_conflicts.append(conflict.conflict_id)
+        finally:
+            if len(self._assignment_by_id) < len(assignments):
+                assignments[:] = [a for a in assignments if a is not None]
+            self._assignment_by_id = None
+            self._assignment_positions = None
 
         return result
 
@@ -531,10 +1210,16 @@ class ConflictResolver:
         context: Any,
     ) -> ResolutionResult:
         """Apply a specific resolution strategy."""
-        if strategy in self.resolution_strategies:
-            return self.resolution_strategies[strategy](conflict, assignments, context)
+        handler = self.resolution_strategies.get(strategy, self._resolve_unsupported)
+        return handler(conflict, assignments, context)
 
-        # Default: failure
+    def _resolve_unsupported(
+        self,
+        conflict: Conflict,
+        assignments: List[Any],
+        context: Any,
+    ) -> ResolutionResult:
+        """Fail for strategies without a registered handler."""
         return ResolutionResult(success=False)
 
     def _resolve_by_removal(
@@ -547,9 +1232,12 @@ class ConflictResolver:
         # Find lowest priority assignment to remove
         assignment_to_remove = None
         min_priority = float("inf")
+        by_id = self._assignment_by_id
+        if by_id is None:
+            by_id = {a.id: a for a in reversed(assignments)}
 
         for assignment_id in conflict.assignment_ids:
-            assignment = next((a for a in assignments if a.id == assignment_id), None)
+            assignment = by_id.get(assignment_id)
             if assignment:
                 request = context.request_lookup.get(assignment.request_id)
                 priority = getattr(request, "priority", 5)
@@ -558,13 +1246,22 @@ class ConflictResolver:
                     assignment_to_remove = assignment
 
         if assignment_to_remove:
-            assignments.remove(assignment_to_remove)
+            if self._assignment_positions is not None:
+                # Leave a hole; resolve_conflicts compacts the list once at the end
+                position = self._assignment_positions.pop(assignment_to_remove.id)
+                assignments[position] = None
+                del by_id[assignment_to_remove.id]
+            else:
+                assignments.remove(assignment_to_remove)
+            self.detector.remove_assignment(assignment_to_remove)
+            self.detector.invalidate(conflict.assignment_ids)
             return ResolutionResult(
                 success=True,
                 resolution_details={
                     "action": "removed",
                     "assignment_id": assignment_to_remove.id,
                     "priority": min_priority,
+                    "changed_ids": list(conflict.assignment_ids),
                 },
                 quality_impact=-0.2,  # Slightly lower quality
             )
@@ -591,13 +1288,8 @@ class ConflictResolver:
         assignments: List[Any],
         context: Any,
     ) -> ResolutionResult:
-        """Resolve by assigning to different resource."""
-        # This is a simplified implementation
-        # In practice, would check for alternative resources
-
-        return ResolutionResult(
-            success=False, resolution_details={"reason": "Reassignment not implemented"}
-        )
+        """Resolve by assigning to different resource of the same type."""
+        return self._resolve_by_matching(conflict, assignments, context, same_type=True)
 
     def _resolve_with_alternative(
         self,
@@ -605,14 +1297,205 @@ class ConflictResolver:
         assignments: List[Any],
         context: Any,
     ) -> ResolutionResult:
-        """Resolve using alternative resources."""
-        # This is a simplified implementation
-        # In practice, would find and assign alternative resources
+        """Resolve using alternative resources of any type with enough capacity."""
+        return self._resolve_by_matching(conflict, assignments, context, same_type=False)
+
+    def _resolve_by_matching(
+        self,
+        conflict: Conflict,
+        assignments: List[Any],
+        context: Any,
+        same_type: bool,
+    ) -> ResolutionResult:
+        """
+        Move conflicting assignments to free resources via min-cost bipartite matching.
+
+        Rows are the conflicting assignments and columns are their current
+        resources plus every free candidate resource. Keeping a current
+        resource costs nothing, but each one can be kept by a single
+        assignment only. Moving costs more when the new room has more unused
+        capacity, and pairings that clash in time or capacity are infeasible.
+
+        Args:
+            conflict: Conflict to resolve
+            assignments: Current assignments, updated in place on success
+            context: Scheduling context
+            same_type: Only consider resources of the current resource's type
+
+        Returns:
+            ResolutionResult with the chosen matching
+        """
+        conflict_ids = set(conflict.assignment_ids)
+        by_id = self._assignment_by_id
+        if by_id is None:
+            by_id = {a.id: a for a in reversed(assignments)}
+        conflicting = [by_id[i] for i in dict.fromkeys(conflict.assignment_ids) if i in by_id]
+        current = [getattr(a, "resource", None) for a in conflicting]
+        if not conflicting or any(resource is None for resource in current):
+            return ResolutionResult(
+                success=False, resolution_details={"reason": "No resource to replace"}
+            )
+
+        kept = list({resource.id: resource for resource in current}.values())
+        kept_ids = {resource.id for resource in kept}
+        resource_types = {getattr(resource, "resource_type", None) for resource in current}
+        candidates = [
+            resource
+            for resource in context.resource_lookup.values()
+            if resource.id not in kept_ids
+            and (not same_type or getattr(resource, "resource_type", None) in resource_types)
+        ]
+        columns = kept + candidates
+        if len(columns) < len(conflicting):
+            return ResolutionResult(
+                success=False, resolution_details={"reason": "Alternative resources not found"}
+            )
+
+        # Bookings of everything outside the conflict, per resource
+        busy: Dict[str, List[Tuple[datetime, datetime]]] = {}
+        for assignment in assignments:
+            if assignment is None or assignment.id in conflict_ids:
+                continue
+            span = (assignment.start_time, assignment.start_time + assignment.duration)
+            for resource in assignment.assigned_resources:
+                for resource_id in resource:
+                    busy.setdefault(resource_id, []).append(span)
+
+        cost = []
+        for assignment, resource in zip(conflicting, current):
+            request = context.request_lookup.get(assignment.request_id)
+            enrollment = getattr(request, "enrollment_count", 0) or 0
+            start = assignment.start_time
+            end = start + assignment.duration
+            row = []
+            for col, candidate in enumerate(columns):
+                capacity = getattr(candidate, "capacity", None)
+                if capacity is not None and enrollment > capacity:
+                    row.append(_INFEASIBLE_COST)
+                elif col < len(kept):
+                    row.append(0.0 if candidate.id == resource.id else _INFEASIBLE_COST)
+                elif any(s < end and start < e for s, e in busy.get(candidate.id, ())):
+                    row.append(_INFEASIBLE_COST)
+                else:
+                    # Prefer the tightest fit among free resources
+                    spare = (capacity - enrollment) / capacity if capacity else 0.0
+                    row.append(1.0 + spare)
+            cost.append(row)
+
+        matching = _min_cost_assignment(cost)
+        if any(cost[row][col] >= _INFEASIBLE_COST for row, col in enumerate(matching)):
+            return ResolutionResult(
+                success=False, resolution_details={"reason": "Alternative resources not found"}
+            )
+
+        moves = {}
+        for row, col in enumerate(matching):
+            if col < len(kept):
+                continue
+            assignment = conflicting[row]
+            self._move_assignment(assignment, columns[col], context)
+            moves[assignment.id] = columns[col].id
+
+        if not moves:
+            return ResolutionResult(
+                success=False, resolution_details={"reason": "Alternative resources not found"}
+            )
+        self.detector.invalidate(conflict.assignment_ids)
 
         return ResolutionResult(
-            success=False, resolution_details={"reason": "Alternative resources not found"}
+            success=True,
+            resolution_details={
+                "action": "reassigned",
+                "matching": [
+                    (conflicting[row].id, columns[col].id) for row, col in enumerate(matching)
+                ],
+                "moved": moves,
+                "changed_ids": list(conflict.assignment_ids),
+            },
         )
 
+    def _move_assignment(self, assignment: Any, new: Any, context: Any) -> None:
+        """Move an assignment from its current resource to ``new``, keeping the indices in sync."""
+        old = assignment.resource
+        indexed = id(assignment) in self.detector._index_keys
+        if indexed:
+            self.detector.remove_assignment(assignment)
+        for resource in assignment.assigned_resources:
+            for position, resource_id in enumerate(resource):
+                if resource_id == old.id:
+                    resource[position] = new.id
+        assignment.resource = new
+        if indexed:
+            self.detector.add_assignment(assignment, context)
+
+    def apply_recorded(
+        self, details: Dict[str, Any], assignments: List[Any], context: Any
+    ) -> bool:
+        """
+        Re-apply the effect of an earlier successful resolution without searching again.
+
+        Args:
+            details: ``resolution_details`` of the successful resolution
+            assignments: Current assignments, updated in place on success
+            context: Scheduling context
+
+        Returns:
+            True if the effect was applied; False leaves the schedule untouched
+        """
+        by_id = {a.id: a for a in reversed(assignments)}
+        action = details.get("action")
+        if action == "removed":
+            assignment = by_id.get(details["assignment_id"])
+            if assignment is None:
+                return False
+            assignments.remove(assignment)
+            self.detector.remove_assignment(assignment)
+        elif action == "reassigned":
+            moves = []
+            for assignment_id, resource_id in details["moved"].items():
+                assignment = by_id.get(assignment_id)
+                new = context.resource_lookup.get(resource_id)
+                if assignment is None or new is None or getattr(assignment, "resource", None) is None:
+                    return False
+                moves.append((assignment, new))
+            for assignment, new in moves:
+                self._move_assignment(assignment, new, context)
+        else:
+            return False
+        self.detector.invalidate(details.get("changed_ids", ()))
+        return True
+
+    def snapshot(
+        self, assignments: List[Any], assignment_ids: Iterable[str]
+    ) -> Tuple[List[Any], List[Tuple[Any, ...]]]:
+        """Capture the schedule order and the resources of some assignments, for ``restore``."""
+        ids = set(assignment_ids)
+        states = [
+            (
+                a,
+                getattr(a, "resource", None),
+                copy.deepcopy(a.assigned_resources),
+                id(a) in self.detector._index_keys,
+            )
+            for a in assignments
+            if a.id in ids
+        ]
+        return assignments[:], states
+
+    def restore(
+        self, snapshot: Tuple[List[Any], List[Tuple[Any, ...]]], assignments: List[Any], context: Any
+    ) -> None:
+        """Undo changes made since ``snapshot``, including the detector's indices and cache."""
+        order, states = snapshot
+        for assignment, resource, assigned_resources, indexed in states:
+            self.detector.remove_assignment(assignment)
+            assignment.resource = resource
+            assignment.assigned_resources = assigned_resources
+            if indexed:
+                self.detector.add_assignment(assignment, context)
+        assignments[:] = order
+        self.detector.invalidate(state[0].id for state in states)
+
     def _determine_constraint_category(self, constraint: Constraint) -> str:
         """Determine category of a constraint."""
         constraint_type = constraint.constraint_type.lower()
@@ -629,14 +1512,64 @@ class ConflictResolver:
             return "general"
 
 
+def _assignments_fingerprint(assignments: Iterable[Any]) -> int:
+    """Hash the (id, start, end, resource) of every assignment, in schedule order."""
+    return hash(
+        tuple(
+            (assignment.id, *_span_us(assignment), getattr(getattr(assignment, "resource", None), "id", None))
+            for assignment in assignments
+        )
+    )
+
+
+def _context_fingerprint(context: Any) -> int:
+    """Hash the resources and constraint types of a scheduling context."""
+    resources = getattr(context, "resource_lookup", None) or {}
+    return hash(
+        (
+            tuple(
+                (resource_id, getattr(resource, "resource_type", None), getattr(resource, "capacity", None))
+                for resource_id, resource in sorted(resources.items())
+            ),
+            tuple(
+                getattr(constraint, "constraint_type", None)
+                for constraint in getattr(context, "constraints", None) or ()
+            ),
+        )
+    )
+
+
+@dataclass(**SLOTTED_DATACLASS)
+class _ResolutionPlan:
+    """Resolutions recorded by AutomatedResolver for one batch of conflicts."""
+
+    # (conflict id, strategy, resolution details) of each resolved conflict, in order
+    fixes: List[Tuple[str, ResolutionStrategy, Dict[str, Any]]]
+    # Assignments the fixes changed, and the conflict ids detect_around found around them
+    changed_ids: Tuple[str, ...]
+    expected: Tuple[str, ...]
+
+
+# Resolution plans kept by AutomatedResolver; the oldest is evicted first
+_RESULT_CACHE_SIZE = 256
+# Conflict patterns with learned strategies; the least recently used is evicted
+_SUCCESS_PATTERN_LIMIT = 4096
+# auto_resolve runs kept in the resolution history
+_HISTORY_LIMIT = 10_000
+
+
 class AutomatedResolver:
     """Automated conflict resolution with learning capabilities."""
 
     def __init__(self):
         self.resolver = ConflictResolver()
-        self.resolution_history = []
-        self.success_patterns = {}
+        self.resolution_history: Deque[Dict[str, Any]] = deque(maxlen=_HISTORY_LIMIT)
+        # pattern key -> how often each strategy resolved it, least recently used first
+        self.success_patterns: "OrderedDict[str, Counter[ResolutionStrategy]]" = OrderedDict()
         self.failure_patterns = {}
+        # (conflict ids, schedule fingerprint, context fingerprint) -> the resolutions
+        # found for them; conflicts nothing resolved are left out and retried
+        self._result_cache: Dict[Tuple[Tuple[str, ...], int, int], _ResolutionPlan] = {}
 
     def auto_resolve(
         self,
@@ -662,27 +1595,58 @@ class AutomatedResolver:
         # Sort conflicts by severity
         sorted_conflicts = sorted(conflicts, key=lambda c: c.severity, reverse=True)
 
+        # Identical conflicts on an identical schedule and context re-apply the
+        # recorded resolutions instead of searching for them again
+        cache_key = (
+            tuple(sorted(c.conflict_id for c in sorted_conflicts)),
+            _assignments_fingerprint(assignments),
+            _context_fingerprint(context),
+        )
+        plan = self._result_cache.get(cache_key)
+        fixes: List[Tuple[str, ResolutionStrategy, Dict[str, Any]]] = []
+        if plan is not None and self._replay(plan, assignments, context):
+            fixes.extend(plan.fixes)
+        replayed = {conflict_id: strategy for conflict_id, strategy, _ in fixes}
+
         for conflict in sorted_conflicts:
             # Check for successful patterns
             pattern_key = self._get_pattern_key(conflict)
-            if pattern_key in self.success_patterns:
-                # Use previously successful strategy
-                successful_strategy = self.success_patterns[pattern_key]
+            strategy = replayed.get(conflict.conflict_id)
+            if strategy is not None:
+                self._record_success(pattern_key, strategy)
+                result.resolved_conflicts.append(conflict.conflict_id)
+                continue
+
+            successful_strategy = self._preferred_strategy(pattern_key)
+            if successful_strategy is not None:
+                # Use the strategy that most often resolved this pattern
                 attempt_result = self.resolver.resolve_conflicts(
                     [conflict], assignments, context, [successful_strategy]
                 )
             else:
                 # Try default strategies
-                attempt_result = self.resolver.resolve_conflicts([conflict], assignments, context)
+                attempt_result = self.resolver.resolve_conflicts(
+                    [conflict], assignments, context
+                )
 
             # Record result
             if attempt_result.success:
                 if attempt_result.resolution_strategy:
-                    self.success_patterns[pattern_key] = attempt_result.resolution_strategy
+                    self._record_success(pattern_key, attempt_result.resolution_strategy)
+                    fixes.append(
+                        (
+                            conflict.conflict_id,
+                            attempt_result.resolution_strategy,
+                            attempt_result.resolution_details,
+                        )
+                    )
                 result.resolved_conflicts.append(conflict.conflict_id)
             else:
                 result.remaining_conflicts.append(conflict.conflict_id)
 
+        if len(fixes) > len(replayed):
+            self._store_plan(cache_key, fixes, assignments, context)
+
         # Determine overall success
         result.success = len(result.resolved_conflicts) > 0
 
@@ -698,6 +1662,66 @@ class AutomatedResolver:
 
         return result
 
+    def _replay(self, plan: _ResolutionPlan, assignments: List[Any], context: Any) -> bool:
+        """
+        Re-apply a recorded plan and check it with one ``detect_around`` call.
+
+        Returns:
+            True if the plan applied and left the expected conflicts; otherwise
+            the schedule is restored and False is returned
+        """
+        resolver = self.resolver
+        snapshot = resolver.snapshot(assignments, plan.changed_ids)
+        for _, _, details in plan.fixes:
+            if not resolver.apply_recorded(details, assignments, context):
+                resolver.restore(snapshot, assignments, context)
+                return False
+        found = resolver.detector.detect_around(plan.changed_ids, assignments, context)
+        if tuple(found.conflict_ids()) != plan.expected:
+            resolver.restore(snapshot, assignments, context)
+            return False
+        return True
+
+    def _store_plan(
+        self,
+        cache_key: Tuple[Tuple[str, ...], int, int],
+        fixes: List[Tuple[str, ResolutionStrategy, Dict[str, Any]]],
+        assignments: List[Any],
+        context: Any,
+    ) -> None:
+        """Record the resolutions of a batch with the conflicts left around them."""
+        changed_ids = tuple(
+            dict.fromkeys(
+                assignment_id for _, _, details in fixes for assignment_id in details.get("changed_ids", ())
+            )
+        )
+        found = self.resolver.detector.detect_around(changed_ids, assignments, context)
+        self._result_cache.pop(cache_key, None)
+        if len(self._result_cache) >= _RESULT_CACHE_SIZE:
+            del self._result_cache[next(iter(self._result_cache))]
+        self._result_cache[cache_key] = _ResolutionPlan(
+            fixes=list(fixes), changed_ids=changed_ids, expected=tuple(found.conflict_ids())
+        )
+
+    def _preferred_strategy(self, pattern_key: str) -> Optional[ResolutionStrategy]:
+        """Return the strategy that most often resolved a pattern, if any."""
+        counts = self.success_patterns.get(pattern_key)
+        if not counts:
+            return None
+        self.success_patterns.move_to_end(pattern_key)
+        return counts.most_common(1)[0][0]
+
+    def _record_success(self, pattern_key: str, strategy: ResolutionStrategy) -> None:
+        """Count a successful strategy for a pattern, evicting the stalest pattern if full."""
+        counts = self.success_patterns.get(pattern_key)
+        if counts is None:
+            if len(self.success_patterns) >= _SUCCESS_PATTERN_LIMIT:
+                self.success_patterns.popitem(last=False)
+            counts = self.success_patterns[pattern_key] = Counter()
+        else:
+            self.success_patterns.move_to_end(pattern_key)
+        counts[strategy] += 1
+
     def _get_pattern_key(self, conflict: Conflict) -> str:
         """Generate pattern key for conflict type recognition."""
         return f"{conflict.conflict_type.value}_{len(conflict.assignment_ids)}"
@@ -1,58 +1,129 @@
 """Genetic algorithm solver backend implementation."""
 
+import heapq
 import random
 import time
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple
+from zoneinfo import ZoneInfo
+
+from edusched.objectives.base import ColumnarAssignments, weighted_score
 from edusched.solvers.base import SolverBackend
+from edusched.utils.scheduling_utils import (
+    CalendarAvailability,
+    OccurrenceSpreader,
+    ResourceBookings,
+    request_buffers,
+    suitable_resources,
+    to_microseconds,
+)
 
 if TYPE_CHECKING:
     from edusched.constraints.base import ConstraintContext
     from edusched.domain.assignment import Assignment
     from edusched.domain.problem import Problem, ProblemIndices
+    from edusched.domain.resource import Resource
     from edusched.domain.result import Result
     from edusched.domain.session_request import SessionRequest
     from edusched.objectives.base import Objective
 
 
+# Granularity of generated time slots
+_SLOT_GRANULARITY = timedelta(minutes=15)
+# Fitness lost per constraint violation
+_VIOLATION_PENALTY = 100
+
+
 class ScheduleIndividual:
     """Represents a complete schedule solution for genetic algorithm."""
     
+    __slots__ = ("assignments", "problem", "fitness", "groups", "columns")
+    
     def __init__(self, assignments: List["Assignment"], problem: "Problem"):
         self.assignments = assignments
         self.problem = problem
         self.fitness = None  # Will be calculated when needed
+        # Assignments grouped by request position; filled by the solver, cleared on mutation
+        self.groups: Optional[List[List["Assignment"]]] = None
+        # Column view of the assignments for objective scoring; filled lazily, cleared on mutation
+        self.columns: Optional[ColumnarAssignments] = None
+
+    def columnar(self) -> ColumnarAssignments:
+        """Return the assignments as columns, extracting them once until the next mutation."""
+        if self.columns is None:
+            self.columns = ColumnarAssignments.from_assignments(self.assignments)
+        return self.columns
+
+    def calculate_fitness(self, context: "ConstraintContext",
+                          checks: Optional[Tuple[Callable, ...]] = None) -> float:
+        """
+        Calculate fitness of this individual based on constraints and objectives.
 
-    def calculate_fitness(self, context: "ConstraintContext") -> float:
-        """Calculate fitness of this individual based on constraints and objectives."""
+        ``checks`` are the bound ``check_batch`` methods of the problem's
+        constraints, as built once per solve by the solver.
+        """
         if self.fitness is not None:
             return self.fitness
             
         constraint_violations = 0
         objective_score = 0.0
         
-        # Check constraint violations
-        for assignment in self.assignments:
-            for constraint in self.problem.constraints:
-                violation = constraint.check(assignment, self.assignments, context)
-                if violation:
-                    constraint_violations += 1
+        # Check constraint violations, one batch per constraint
+        if checks is None:
+            checks = _constraint_checks(self.problem)
+        assignments = self.assignments
+        for check in checks:
+            constraint_violations += len(check(assignments, assignments, context))
         
         # Calculate objective satisfaction
         if self.problem.objectives:
-            total_weight = sum(obj.weight for obj in self.problem.objectives)
-            if total_weight > 0:
-                objective_score = sum(
-                    obj.score(self.assignments) * obj.weight 
-                    for obj in self.problem.objectives
-                ) / total_weight
+            # Objectives that can work from the cached columns skip the assignment objects
+            score = weighted_score(self.problem.objectives, self.assignments, self.columnar())
+            if score is not None:
+                objective_score = score
         
         # Fitness is higher for fewer violations and better objective scores
         # Negative penalty for violations, positive for objectives
-        self.fitness = -constraint_violations * 100 + objective_score
+        self.fitness = -constraint_violations * _VIOLATION_PENALTY + objective_score
         return self.fitness
 
 
+def _constraint_checks(problem: "Problem") -> Tuple[Callable, ...]:
+    """Return the bound batch check of each of the problem's constraints."""
+    return tuple(constraint.check_batch for constraint in problem.constraints)
+
+
+# (problem, context, indices, solver) of the solve a worker process works for
+_worker_state: Optional[
+    Tuple["Problem", "ConstraintContext", "ProblemIndices", "GeneticAlgorithmSolver"]
+] = None
+
+
+def _init_worker(
+    problem: "Problem",
+    context: "ConstraintContext",
+    indices: "ProblemIndices",
+    solver: "GeneticAlgorithmSolver",
+) -> None:
+    """Keep the problem, context, indices and prepared solver in a worker process."""
+    global _worker_state
+    _worker_state = (problem, context, indices, solver)
+
+
+def _evaluate_fitness(assignments: List["Assignment"]) -> float:
+    """Evaluate the fitness of one set of assignments in a worker process."""
+    problem, context, _, solver = _worker_state
+    return ScheduleIndividual(assignments, problem).calculate_fitness(context, solver._checks)
+
+
+def _random_solution(seed: int) -> List["Assignment"]:
+    """Create one random initial solution in a worker process."""
+    problem, context, indices, solver = _worker_state
+    return solver._create_random_solution(problem, context, indices, random.Random(seed))
+
+
 class GeneticAlgorithmSolver(SolverBackend):
     """Genetic algorithm solver backend for complex optimization problems."""
 
@@ -61,12 +132,54 @@ class GeneticAlgorithmSolver(SolverBackend):
                  mutation_rate: float = 0.1,
                  crossover_rate: float = 0.8,
                  max_generations: int = 100,
-                 elite_size: int = 5):
+                 elite_size: int = 5,
+                 workers: int = 1,
+                 patience: Optional[int] = 20,
+                 tol: float = 1e-4):
+        """
+        Initialize genetic algorithm solver.
+
+        Args:
+            population_size: Number of individuals per generation
+            mutation_rate: Probability of mutating each child
+            crossover_rate: Probability of crossing over each pair of parents
+            max_generations: Maximum number of generations to evolve
+            elite_size: Number of best individuals carried over unchanged
+            workers: Processes used to build the initial population and evaluate
+                fitness; 1 works in-process.
+                Scripts using more than one worker need an
+                ``if __name__ == "__main__":`` guard on platforms that spawn.
+            patience: Stop after this many consecutive generations in which the
+                best fitness improved by no more than ``tol``; None disables it
+            tol: Smallest best-fitness improvement that counts as progress
+        """
         self.population_size = population_size
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.max_generations = max_generations
         self.elite_size = elite_size
+        self.workers = workers
+        self.patience = patience
+        self.tol = tol
+        self.spreader = None  # Will be initialized with holiday calendar
+        self._rng = random.Random()  # Reseeded by each solve
+        self.timezone = None  # Institutional timezone, set per solve
+        # request id -> (setup, cleanup) for requests whose teacher sets them, per solve
+        self._buffers: Dict[str, Tuple[int, int]] = {}
+        # request id -> resource type -> resources meeting its attributes and capacity, per solve
+        self._candidates: Dict[str, Dict[str, List["Resource"]]] = {}
+        self._candidate_ids: Dict[str, Set[str]] = {}
+        # calendar id -> sorted availability index, per solve
+        self._availability: Dict[str, CalendarAvailability] = {}
+        # Bound check_batch of each constraint, per solve
+        self._checks: Tuple[Callable, ...] = ()
+        # request id -> position in problem.requests, per solve
+        self._request_positions: Dict[str, int] = {}
+        # Occurrence dates and slot offsets from midnight per request id, and time
+        # slots per (request id, date), per solve
+        self._dates_cache: Dict[str, List[date]] = {}
+        self._offsets_cache: Dict[str, List[Tuple[timedelta, timedelta]]] = {}
+        self._slots_cache: Dict[Tuple[str, date], List[Tuple[datetime, datetime]]] = {}
 
     def solve(
         self,
@@ -89,9 +202,8 @@ class GeneticAlgorithmSolver(SolverBackend):
 
         start_time = time.time()
 
-        # Set seed for determinism
-        if seed is not None:
-            random.seed(seed)
+        # Seeded generator for determinism, independent of the global random state
+        self._rng = random.Random(seed)
 
         # Validate problem
         errors = problem.validate()
@@ -107,27 +219,80 @@ class GeneticAlgorithmSolver(SolverBackend):
         # Create constraint context
         context = self._create_context(problem, indices)
 
-        # Initialize population
-        population = self._initialize_population(problem, context)
-        
+        # Initialize occurrence spreader with holiday calendar
+        if problem.holiday_calendar:
+            self.spreader = OccurrenceSpreader(problem.holiday_calendar)
+        else:
+            # Create default holiday calendar if none provided
+            from edusched.domain.holiday_calendar import HolidayCalendar
+
+            current_year = datetime.now().year
+            default_calendar = HolidayCalendar(
+                id="default_academic",
+                name="Default Academic Calendar",
+                year=current_year,
+                excluded_weekdays={5, 6},  # Weekends
+            )
+            self.spreader = OccurrenceSpreader(default_calendar)
+
+        # Get calendar for timezone
+        calendar = context.calendar_lookup.get(problem.institutional_calendar_id)
+        self.timezone = calendar.timezone if calendar and hasattr(calendar, "timezone") else ZoneInfo("UTC")
+
+        self._request_positions = indices.request_index
+        self._dates_cache = {}
+        self._offsets_cache = {}
+        self._slots_cache = {}
+        self._buffers = self._request_buffers(problem, context)
+        self._checks = _constraint_checks(problem)
+        self._candidates = self._precompute_candidates(problem, indices)
+        self._candidate_ids = {
+            request_id: {resource.id for resources in by_type.values() for resource in resources}
+            for request_id, by_type in self._candidates.items()
+        }
+        self._availability = {
+            calendar_id: CalendarAvailability(calendar)
+            for calendar_id, calendar in context.calendar_lookup.items()
+        }
+
         best_solution = None
         best_fitness = float('-inf')
         
-        # Evolve population
-        for generation in range(self.max_generations):
-            # Evaluate fitness of all individuals
-            for individual in population:
-                fitness = individual.calculate_fitness(context)
-                if fitness > best_fitness:
-                    best_fitness = fitness
-                    best_solution = individual
-            
-            # Check if we found a perfect solution (no violations)
-            if best_fitness >= 0 and self._is_valid_solution(best_solution.assignments, problem, context):
-                break
+        executor = self._create_executor(problem, context, indices)
+        try:
+            # Initialize population
+            population = self._initialize_population(problem, context, indices, executor)
             
-            # Create new generation
-            population = self._create_new_generation(population, problem, context)
+            # Evolve population until it converges, stagnates or runs out of generations
+            previous_best = float('-inf')
+            stagnation = 0
+            for generation in range(self.max_generations):
+                # Evaluate fitness of all individuals
+                self._evaluate_population(population, context, executor)
+                for individual in population:
+                    fitness = individual.calculate_fitness(context, self._checks)
+                    if fitness > best_fitness:
+                        best_fitness = fitness
+                        best_solution = individual
+                
+                # Check if we found a perfect solution (no violations)
+                if best_fitness >= 0 and self._is_valid_solution(best_solution.assignments, problem, context):
+                    break
+                
+                # Stop once the best fitness has stopped improving
+                if best_fitness - previous_best > self.tol:
+                    stagnation = 0
+                else:
+                    stagnation += 1
+                    if self.patience is not None and stagnation >= self.patience:
+                        break
+                previous_best = best_fitness
+                
+                # Create new generation
+                population = self._create_new_generation(population, problem, context, indices)
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
         # Return the best solution found
         if best_solution is not None:
@@ -136,7 +301,9 @@ class GeneticAlgorithmSolver(SolverBackend):
             return Result(
                 status="feasible" if best_fitness >= 0 else "partial",
                 assignments=best_solution.assignments,
-                unscheduled_requests=self._get_unscheduled_requests(problem, best_solution.assignments),
+                unscheduled_requests=self._get_unscheduled_requests(
+                    problem, indices, best_solution.assignments
+                ),
                 objective_score=objective_score,
                 backend_used=self.backend_name,
                 seed_used=seed,
@@ -167,52 +334,102 @@ class GeneticAlgorithmSolver(SolverBackend):
             teacher_lookup=indices.teacher_lookup,
         )
 
-    def _initialize_population(self, problem: "Problem", context: "ConstraintContext") -> List[ScheduleIndividual]:
-        """Initialize population with random valid solutions."""
-        population = []
-        
-        for _ in range(self.population_size):
-            # Create random assignment for each request
-            assignments = self._create_random_solution(problem, context)
-            individual = ScheduleIndividual(assignments, problem)
-            population.append(individual)
+    def _create_executor(self, problem: "Problem", context: "ConstraintContext",
+                         indices: "ProblemIndices") -> Optional[Executor]:
+        """Start the worker pool, or return None to work in-process."""
+        # Too few individuals per worker to pay for shipping them to other processes
+        if self.workers <= 1 or self.population_size < 2 * self.workers:
+            return None
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(problem, context, indices, self),
+        )
+
+    def _evaluate_population(self, population: List[ScheduleIndividual],
+                             context: "ConstraintContext", executor: Optional[Executor]) -> None:
+        """Evaluate every individual without a cached fitness, in parallel when possible."""
+        if executor is None:
+            return
+        pending = [individual for individual in population if individual.fitness is None]
+        if not pending:
+            return
+        chunksize = max(1, len(pending) // self.workers)
+        results = executor.map(
+            _evaluate_fitness, [individual.assignments for individual in pending], chunksize=chunksize
+        )
+        for individual, fitness in zip(pending, results):
+            individual.fitness = fitness
+
+    def _precompute_candidates(
+        self, problem: "Problem", indices: "ProblemIndices"
+    ) -> Dict[str, Dict[str, List["Resource"]]]:
+        """
+        Find the resources of each type that fit each request.
+
+        Attribute and capacity checks depend only on the request and the
+        resource, so they are done once per solve instead of on every
+        resource assignment.
+
+        Args:
+            problem: The scheduling problem
+            indices: Problem lookup structures
+
+        Returns:
+            Mapping of request id to resource type to suitable resources;
+            types with no suitable resource are left out
+        """
+        return {
+            request.id: suitable_resources(request, indices.resources_by_type)
+            for request in problem.requests
+        }
+
+    def _request_buffers(
+        self, problem: "Problem", context: "ConstraintContext"
+    ) -> Dict[str, Tuple[int, int]]:
+        """Look up the setup/cleanup buffers of each request's teacher once, in microseconds."""
+        return request_buffers(problem.requests, context.teacher_lookup)
+
+    def _initialize_population(self, problem: "Problem", context: "ConstraintContext",
+                               indices: "ProblemIndices",
+                               executor: Optional[Executor] = None) -> List[ScheduleIndividual]:
+        """Initialize population with random valid solutions, in parallel when possible."""
+        # One seed per individual keeps the population independent of how it is built
+        seeds = [self._rng.getrandbits(64) for _ in range(self.population_size)]
+        if executor is None:
+            solutions = [
+                self._create_random_solution(problem, context, indices, random.Random(seed))
+                for seed in seeds
+            ]
+        else:
+            chunksize = max(1, len(seeds) // self.workers)
+            solutions = executor.map(_random_solution, seeds, chunksize=chunksize)
         
-        return population
+        return [ScheduleIndividual(assignments, problem) for assignments in solutions]
 
-    def _create_random_solution(self, problem: "Problem", context: "ConstraintContext") -> List["Assignment"]:
-        """Create a random solution for the problem."""
+    def _create_random_solution(self, problem: "Problem", context: "ConstraintContext",
+                                indices: "ProblemIndices",
+                                rng: Optional[random.Random] = None) -> List["Assignment"]:
+        """Create a random solution for the problem, drawing from ``rng`` or the solver's generator."""
         from edusched.domain.assignment import Assignment
-        from edusched.utils.scheduling_utils import OccurrenceSpreader
-        from zoneinfo import ZoneInfo
         
+        rng = rng or self._rng
         assignments = []
-        
-        # Use occurrence spreader to generate valid dates
-        spreader = OccurrenceSpreader(problem.holiday_calendar) if problem.holiday_calendar else \
-                   OccurrenceSpreader(None)  # Default holiday calendar
-        
-        # Get calendar for timezone
-        calendar = context.calendar_lookup.get(context.problem.institutional_calendar_id)
-        timezone = calendar.timezone if calendar and hasattr(calendar, "timezone") else ZoneInfo("UTC")
+        bookings = ResourceBookings(self._buffers)
         
         # Create assignments for each request
         for request in problem.requests:
             # Generate occurrence dates
-            schedule_dates = spreader.generate_occurrence_dates(request, timezone)
+            schedule_dates = self._dates_for(request)
             
             for occurrence_index in range(min(request.number_of_occurrences, len(schedule_dates))):
                 if occurrence_index < len(schedule_dates):
                     # Get available time slots for this date
-                    time_slots = spreader.generate_time_slots(
-                        schedule_dates[occurrence_index],
-                        request,
-                        timedelta(minutes=15),  # Default granularity
-                        timezone
-                    )
+                    time_slots = self._slots_for(request, schedule_dates[occurrence_index])
                     
                     # Pick a random time slot
                     if time_slots:
-                        start_time, end_time = random.choice(time_slots)
+                        start_time, end_time = rng.choice(time_slots)
                         
                         # Create assignment with random resource
                         assignment = Assignment(
@@ -224,71 +441,82 @@ class GeneticAlgorithmSolver(SolverBackend):
                         )
                         
                         # Assign resources
-                        if self._assign_resources(assignment, context, problem.build_indices(), assignments):
+                        if self._assign_resources(assignment, context, indices, bookings, rng):
                             assignments.append(assignment)
         
         return assignments
 
+    def _dates_for(self, request: "SessionRequest") -> List[date]:
+        """Return the request's occurrence dates, generated once per solve."""
+        dates = self._dates_cache.get(request.id)
+        if dates is None:
+            dates = self.spreader.generate_occurrence_dates(request, self.timezone)
+            self._dates_cache[request.id] = dates
+        return dates
+
+    def _slots_for(self, request: "SessionRequest", schedule_date: date) -> List[Tuple[datetime, datetime]]:
+        """Return the request's time slots on a date, generated once per solve.
+
+        The request's times of day are generated once and shifted onto each date.
+        """
+        key = (request.id, schedule_date)
+        slots = self._slots_cache.get(key)
+        if slots is None:
+            offsets = self._offsets_cache.get(request.id)
+            if offsets is None:
+                offsets = self.spreader.daily_slot_offsets(request, _SLOT_GRANULARITY)
+                self._offsets_cache[request.id] = offsets
+            slots = self.spreader.slots_on_date(schedule_date, offsets, self.timezone)
+            self._slots_cache[key] = slots
+        return slots
+
     def _assign_resources(
         self,
         assignment: "Assignment",
         context: "ConstraintContext",
         indices: "ProblemIndices",
-        current_solution: List["Assignment"],
+        bookings: ResourceBookings,
+        rng: random.Random,
     ) -> bool:
         """
         Assign appropriate resources to an assignment.
 
+        On success the assignment is added to ``bookings``.
+
         Returns True if successful assignment found, False otherwise.
         """
-        from edusched.utils.capacity_utils import check_capacity_fit
-
-        request = context.request_lookup[assignment.request_id]
-
         # For each resource type needed, find suitable resource
         assigned_resources: Dict[str, List[str]] = {}
 
-        # Group resources by type
-        for resource_type, resources in indices.resources_by_type.items():
-            # Find resources that satisfy requirements and are available
+        # Unbuffered span in epoch microseconds, for calendar checks, and the
+        # buffered span for booking checks; the same for every resource
+        times = (to_microseconds(assignment.start_time), to_microseconds(assignment.end_time))
+        span = bookings.buffered_span(assignment.request_id, *times)
+
+        # Resources of each type that fit the request's attributes and capacity
+        for resource_type, resources in self._candidates[assignment.request_id].items():
+            # Keep those that are available
             suitable_resources = []
             for resource in resources:
-                if resource.can_satisfy(request.required_attributes):
-                    # Check capacity for classrooms
-                    if resource_type == "classroom" and request.modality != "online":
-                        # Skip if no capacity info
-                        if resource.capacity is None:
-                            continue
-
-                        # Check if classroom can fit the enrollment
-                        can_fit, _ = check_capacity_fit(
-                            resource,
-                            request.enrollment_count,
-                            request.min_capacity or 0,
-                            request.max_capacity,
-                            buffer_percent=0.1,  # 10% buffer
-                        )
-                        if not can_fit:
-                            continue
-
-                    # Check availability if calendar specified
-                    if resource.availability_calendar_id:
-                        calendar = context.calendar_lookup[resource.availability_calendar_id]
-                        if not calendar.is_available(assignment.start_time, assignment.end_time):
-                            continue
-
-                    # Check if not already booked
-                    if self._is_resource_available(
-                        resource.id, assignment, context, current_solution
-                    ):
-                        suitable_resources.append(resource)
+                # Check availability if calendar specified
+                if resource.availability_calendar_id:
+                    calendar = self._availability[resource.availability_calendar_id]
+                    if not calendar.is_available(*times):
+                        continue
+
+                # Check if not already booked
+                if self._is_resource_available(
+                    resource.id, assignment, context, bookings, span
+                ):
+                    suitable_resources.append(resource)
 
             if suitable_resources:
                 # Assign a random suitable resource
-                assigned_resources[resource_type] = [random.choice(suitable_resources).id]
+                assigned_resources[resource_type] = [rng.choice(suitable_resources).id]
 
         if assigned_resources:
             assignment.assigned_resources = assigned_resources
+            bookings.add(assignment, span)
             return True
 
         return False
@@ -298,212 +526,168 @@ class GeneticAlgorithmSolver(SolverBackend):
         resource_id: str,
         assignment: "Assignment",
         context: "ConstraintContext",
-        solution: List["Assignment"],
+        bookings: ResourceBookings,
+        span: Optional[Tuple[int, int]] = None,
     ) -> bool:
-        """Check if resource is available during the assignment period."""
-        from datetime import timedelta
-
-        # Get setup/cleanup time requirements
-        setup_minutes = 15  # Default setup time
-        cleanup_minutes = 10  # Default cleanup time
-
-        # Check if teacher has specific setup requirements
-        request = context.request_lookup.get(assignment.request_id)
-        if request and request.teacher_id:
-            teacher = context.teacher_lookup.get(request.teacher_id)
-            if teacher:
-                setup_minutes = teacher.setup_time_minutes
-                cleanup_minutes = teacher.cleanup_time_minutes
-
-        # Check against existing solution (including locked assignments)
-        # Include setup/cleanup buffer times
-        assignment_start = assignment.start_time - timedelta(minutes=setup_minutes)
-        assignment_end = assignment.end_time + timedelta(minutes=cleanup_minutes)
-
-        for existing in solution:
-            for resource_ids in existing.assigned_resources.values():
-                if resource_id in resource_ids:
-                    # Also add buffer for existing assignment
-                    existing_setup = 15
-                    existing_cleanup = 10
-                    if existing.request_id != assignment.request_id:
-                        existing_request = context.request_lookup.get(existing.request_id)
-                        if existing_request and existing_request.teacher_id:
-                            existing_teacher = context.teacher_lookup.get(
-                                existing_request.teacher_id
-                            )
-                            if existing_teacher:
-                                existing_setup = existing_teacher.setup_time_minutes
-                                existing_cleanup = existing_teacher.cleanup_time_minutes
-
-                    existing_start = existing.start_time - timedelta(minutes=existing_setup)
-                    existing_end = existing.end_time + timedelta(minutes=existing_cleanup)
-
-                    if assignment_start < existing_end and assignment_end > existing_start:
-                        return False
+        """Check if resource is available during the assignment period.
 
-        return True
+        ``span`` is the assignment's buffered span from ``bookings.span``,
+        passed in when the caller checks several resources for one slot.
+        """
+        # Both the assignment and existing bookings include setup/cleanup buffers
+        assignment_start, assignment_end = span if span is not None else bookings.span(assignment)
+        return bookings.is_free(resource_id, assignment_start, assignment_end)
 
-    def _create_new_generation(self, population: List[ScheduleIndividual], 
-                              problem: "Problem", context: "ConstraintContext") -> List[ScheduleIndividual]:
+    def _create_new_generation(self, population: List[ScheduleIndividual], problem: "Problem",
+                               context: "ConstraintContext",
+                               indices: "ProblemIndices") -> List[ScheduleIndividual]:
         """Create a new generation using selection, crossover, and mutation."""
-        new_population = []
+        size = self.population_size
+        new_population: List[Optional[ScheduleIndividual]] = [None] * size
+        
+        # Evaluate every individual once; sorting and selection read this list
+        checks = self._checks
+        fitness = [individual.calculate_fitness(context, checks) for individual in population]
         
-        # Keep elite individuals
-        sorted_population = sorted(population, key=lambda x: x.calculate_fitness(context), reverse=True)
-        new_population.extend(sorted_population[:self.elite_size])
+        # Keep elite individuals; only the top few need ordering
+        ranked = heapq.nlargest(min(self.elite_size, size), range(len(population)),
+                                key=fitness.__getitem__)
+        elites = len(ranked)
+        new_population[:elites] = [population[i] for i in ranked]
         
-        # Fill the rest of the population
-        while len(new_population) < self.population_size:
+        # Fill the remaining slots two children at a time
+        draw = self._rng.random
+        crossover_rate = self.crossover_rate
+        for slot in range(elites, size, 2):
             # Selection
-            parent1 = self._tournament_selection(population, context)
-            parent2 = self._tournament_selection(population, context)
+            parent1 = self._tournament_selection(population, fitness)
+            parent2 = self._tournament_selection(population, fitness)
             
             # Crossover
-            if random.random() < self.crossover_rate:
+            if draw() < crossover_rate:
                 child1, child2 = self._crossover(parent1, parent2, problem, context)
             else:
                 child1 = ScheduleIndividual(parent1.assignments[:], problem)
                 child2 = ScheduleIndividual(parent2.assignments[:], problem)
+                child1.groups, child1.columns = parent1.groups, parent1.columns
+                child2.groups, child2.columns = parent2.groups, parent2.columns
             
-            # Mutation
-            self._mutate(child1, problem, context)
-            self._mutate(child2, problem, context)
-            
-            new_population.extend([child1, child2])
+            # Mutation; the second child is dropped when only one slot is left
+            self._mutate(child1, problem, context, indices)
+            new_population[slot] = child1
+            if slot + 1 < size:
+                self._mutate(child2, problem, context, indices)
+                new_population[slot + 1] = child2
         
-        # Ensure population size is correct (might be slightly over due to pairs)
-        return new_population[:self.population_size]
+        return new_population
 
-    def _tournament_selection(self, population: List[ScheduleIndividual], 
-                            context: "ConstraintContext", tournament_size: int = 3) -> ScheduleIndividual:
-        """Select an individual using tournament selection."""
-        tournament = random.sample(population, min(tournament_size, len(population)))
-        return max(tournament, key=lambda x: x.calculate_fitness(context))
+    def _tournament_selection(self, population: List[ScheduleIndividual], fitness: List[float],
+                              tournament_size: int = 3) -> ScheduleIndividual:
+        """Select an individual using tournament selection over precomputed fitness."""
+        tournament = self._rng.sample(range(len(population)), min(tournament_size, len(population)))
+        return population[max(tournament, key=fitness.__getitem__)]
 
     def _crossover(self, parent1: ScheduleIndividual, parent2: ScheduleIndividual,
                   problem: "Problem", context: "ConstraintContext") -> tuple:
         """Perform crossover between two parents to create two children."""
-        # Simple crossover: mix assignments from both parents
-        # This is a basic implementation - more sophisticated approaches could be used
-        
-        # Create new assignments list by combining parts of both parents
-        child_assignments1 = []
-        child_assignments2 = []
-        
-        # Group assignments by request ID
-        parent1_by_request = {}
-        parent2_by_request = {}
-        
-        for assignment in parent1.assignments:
-            if assignment.request_id not in parent1_by_request:
-                parent1_by_request[assignment.request_id] = []
-            parent1_by_request[assignment.request_id].append(assignment)
-        
-        for assignment in parent2.assignments:
-            if assignment.request_id not in parent2_by_request:
-                parent2_by_request[assignment.request_id] = []
-            parent2_by_request[assignment.request_id].append(assignment)
+        # Uniform crossover: each request's assignments come from one parent or the other
+        groups1 = self._groups_of(parent1)
+        groups2 = self._groups_of(parent2)
+        draw = self._rng.random
+        mask = [draw() < 0.5 for _ in range(len(groups1))]
         
-        # Alternate taking assignments from each parent for each request
-        all_request_ids = set(parent1_by_request.keys()) | set(parent2_by_request.keys())
+        child_groups1 = [group1 if from_first else group2
+                         for from_first, group1, group2 in zip(mask, groups1, groups2)]
+        child_groups2 = [group2 if from_first else group1
+                         for from_first, group1, group2 in zip(mask, groups1, groups2)]
         
-        for request_id in all_request_ids:
-            parent1_assignments = parent1_by_request.get(request_id, [])
-            parent2_assignments = parent2_by_request.get(request_id, [])
-            
-            # For simplicity, take all assignments from one parent or the other
-            if random.random() < 0.5:
-                child_assignments1.extend(parent1_assignments)
-                child_assignments2.extend(parent2_assignments)
-            else:
-                child_assignments1.extend(parent2_assignments)
-                child_assignments2.extend(parent1_assignments)
-        
-        child1 = ScheduleIndividual(child_assignments1, problem)
-        child2 = ScheduleIndividual(child_assignments2, problem)
+        child1 = ScheduleIndividual([a for group in child_groups1 for a in group], problem)
+        child2 = ScheduleIndividual([a for group in child_groups2 for a in group], problem)
+        # Groups are only read, so children share the parents' lists
+        child1.groups = child_groups1
+        child2.groups = child_groups2
         
         return child1, child2
 
-    def _mutate(self, individual: ScheduleIndividual, problem: "Problem", context: "ConstraintContext"):
+    def _groups_of(self, individual: ScheduleIndividual) -> List[List["Assignment"]]:
+        """Return the individual's assignments grouped by request position, grouping once."""
+        if individual.groups is None:
+            individual.groups = self._group_by_request(individual.assignments)
+        return individual.groups
+
+    def _group_by_request(self, assignments: List["Assignment"]) -> List[List["Assignment"]]:
+        """Group assignments into lists indexed by their request's position in the problem."""
+        positions = self._request_positions
+        groups = [[] for _ in range(len(positions))]
+        for assignment in assignments:
+            groups[positions[assignment.request_id]].append(assignment)
+        return groups
+
+    def _mutate(self, individual: ScheduleIndividual, problem: "Problem", context: "ConstraintContext",
+                indices: "ProblemIndices"):
         """Apply mutation to an individual."""
-        if random.random() > self.mutation_rate:
+        if self._rng.random() > self.mutation_rate:
             return  # No mutation this time
         
         # Simple mutation: randomly change time or resource for some assignments
         if not individual.assignments:
             return
             
-        # Pick a random assignment to mutate
-        assignment_idx = random.randint(0, len(individual.assignments) - 1)
-        assignment = individual.assignments[assignment_idx]
+        # Pick a random assignment to mutate; copy it first since parents share assignments
+        assignment_idx = self._rng.randint(0, len(individual.assignments) - 1)
+        assignment = replace(individual.assignments[assignment_idx])
+        individual.assignments[assignment_idx] = assignment
+        individual.groups = None
+        individual.columns = None
         
         # Mutate either the time or the resources
-        if random.random() < 0.5:
+        if self._rng.random() < 0.5:
             # Mutate time - change to a different valid time slot
             request = context.request_lookup[assignment.request_id]
             if request:
-                from edusched.utils.scheduling_utils import OccurrenceSpreader
-                from zoneinfo import ZoneInfo
-                
-                spreader = OccurrenceSpreader(problem.holiday_calendar) if problem.holiday_calendar else \
-                           OccurrenceSpreader(None)
-                
-                calendar = context.calendar_lookup.get(context.problem.institutional_calendar_id)
-                timezone = calendar.timezone if calendar and hasattr(calendar, "timezone") else ZoneInfo("UTC")
-                
                 # Find a new valid time slot
-                schedule_dates = spreader.generate_occurrence_dates(request, timezone)
+                schedule_dates = self._dates_for(request)
                 if schedule_dates:
-                    new_date = random.choice(schedule_dates)
-                    time_slots = spreader.generate_time_slots(
-                        new_date,
-                        request,
-                        timedelta(minutes=15),
-                        timezone
-                    )
+                    new_date = self._rng.choice(schedule_dates)
+                    time_slots = self._slots_for(request, new_date)
                     
                     if time_slots:
-                        new_start, new_end = random.choice(time_slots)
+                        new_start, new_end = self._rng.choice(time_slots)
                         assignment.start_time = new_start
                         assignment.end_time = new_end
+                        individual.fitness = None
         else:
             # Mutate resources - assign different resources if available
-            indices = problem.build_indices()
-            self._assign_resources(assignment, context, indices, 
-                                 [a for i, a in enumerate(individual.assignments) if i != assignment_idx])
+            # Only bookings of resources this request could move to matter
+            bookings = ResourceBookings(self._buffers)
+            bookings.extend(
+                (a for i, a in enumerate(individual.assignments) if i != assignment_idx),
+                self._candidate_ids[assignment.request_id],
+            )
+            if self._assign_resources(assignment, context, indices, bookings, self._rng):
+                individual.fitness = None
 
     def _is_valid_solution(self, assignments: List["Assignment"], 
                           problem: "Problem", context: "ConstraintContext") -> bool:
         """Check if a solution satisfies all constraints."""
-        for assignment in assignments:
-            for constraint in problem.constraints:
-                violation = constraint.check(assignment, assignments, context)
-                if violation:
-                    return False
+        for constraint in problem.constraints:
+            if constraint.check_batch(assignments, assignments, context):
+                return False
         return True
 
-    def _get_unscheduled_requests(self, problem: "Problem", assignments: List["Assignment"]) -> List[str]:
+    def _get_unscheduled_requests(
+        self, problem: "Problem", indices: "ProblemIndices", assignments: List["Assignment"]
+    ) -> List[str]:
         """Get list of request IDs that weren't scheduled."""
-        scheduled_request_ids = {a.request_id for a in assignments}
-        return [req.id for req in problem.requests if req.id not in scheduled_request_ids]
+        scheduled = indices.scheduled_mask(assignments)
+        position = indices.request_index
+        return [req.id for req in problem.requests if not scheduled[position[req.id]]]
 
     def _calculate_objectives(
         self, objectives: List["Objective"], solution: List["Assignment"]
-    ) -> float:
+    ) -> Optional[float]:
         """Calculate weighted objective score."""
-        if not objectives:
-            return None
-
-        total_score = 0.0
-        total_weight = 0.0
-
-        for objective in objectives:
-            score = objective.score(solution)
-            total_score += score * objective.weight
-            total_weight += objective.weight
-
-        return total_score / total_weight if total_weight > 0 else None
+        return weighted_score(objectives, solution)
 
     @property
     def backend_name(self) -> str:
@@ -1,28 +1,127 @@
 """Heuristic solver backend implementation."""
 
+import heapq
 import random
 import time
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Dict, List, Optional, Set
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from itertools import islice, product
+from math import prod
+from typing import TYPE_CHECKING, Dict, Hashable, Iterator, List, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
+from edusched.objectives.base import weighted_score
 from edusched.solvers.base import SolverBackend
-from edusched.utils.scheduling_utils import OccurrenceSpreader
+from edusched.utils.scheduling_utils import (
+    CalendarAvailability,
+    OccurrenceSpreader,
+    ResourceBookings,
+    request_buffers,
+    suitable_resources,
+    to_microseconds,
+)
 
 if TYPE_CHECKING:
-    from edusched.constraints.base import ConstraintContext
+    from edusched.constraints.base import Constraint, ConstraintContext, Violation
     from edusched.domain.assignment import Assignment
     from edusched.domain.problem import Problem, ProblemIndices
+    from edusched.domain.resource import Resource
     from edusched.domain.result import Result
     from edusched.domain.session_request import SessionRequest
 
+# Candidate checks between re-sorts of the constraints by rejection rate
+_REORDER_INTERVAL = 256
+# Resource combinations tried for a slot before moving on to the next slot
+_MAX_RESOURCE_COMBINATIONS = 4
+# Dates tried for each occurrence
+_MAX_DATES = 10
+# Request orderings accepted by HeuristicSolver
+_ORDERINGS = ("priority", "saturation")
+
+
+class _ConstraintStats:
+    """How often a constraint has been checked and how often it rejected.
+
+    For constraints that override ``Constraint.cache_key``, ``passed`` holds
+    the keys of the assignments that satisfied it; otherwise it is None.
+    """
+
+    __slots__ = ("constraint", "checks", "rejects", "passed")
+
+    def __init__(self, constraint: "Constraint"):
+        from edusched.constraints.base import Constraint
+
+        self.constraint = constraint
+        self.checks = 0
+        self.rejects = 0
+        self.passed: Optional[Set[Hashable]] = (
+            set() if type(constraint).cache_key is not Constraint.cache_key else None
+        )
+
+    @property
+    def rejection_rate(self) -> float:
+        return self.rejects / self.checks if self.checks else 0.0
+
+
+def _pair_count(
+    free_slots: Dict[date, List[Tuple[Tuple[int, int], Dict[str, Set[str]]]]]
+) -> int:
+    """Count the free (slot, resource combination) pairs from ``_free_slot_resources`` results."""
+    count = 0
+    for slots in free_slots.values():
+        for _, free_by_type in slots:
+            sizes = [len(free) for free in free_by_type.values() if free]
+            if sizes:
+                count += prod(sizes)
+    return count
+
 
 class HeuristicSolver(SolverBackend):
     """Greedy heuristic solver backend."""
 
-    def __init__(self, max_attempts: int = 1000):
+    def __init__(self, max_attempts: int = 1000, ordering: str = "priority"):
+        """
+        Initialize heuristic solver.
+
+        Args:
+            max_attempts: Maximum scheduling attempts
+            ordering: Order in which requests are scheduled. "priority" takes
+                longer classes first, then later deadlines. "saturation" always
+                takes next the request with the fewest free (slot, resource)
+                pairs for its first occurrence, recounting the requests that
+                share resources with each request scheduled; it can place more
+                requests on crowded problems but costs more per request.
+        """
+        if ordering not in _ORDERINGS:
+            raise ValueError(f"Unknown ordering: {ordering}")
         self.max_attempts = max_attempts
+        self.ordering = ordering
         self.spreader = None  # Will be initialized with holiday calendar
+        self.timezone = None  # Institutional timezone, set per solve
+        # Slot granularity of the institutional calendar, set per solve
+        self._granularity = timedelta(minutes=15)
+        # Per-resource index of the buffered bookings in the solution being built, per solve
+        self._bookings: Optional[ResourceBookings] = None
+        # request id -> resource type -> resources meeting its attributes and capacity, per solve
+        self._candidates: Dict[str, Dict[str, List["Resource"]]] = {}
+        # request id -> first occurrence's candidate dates, per solve
+        self._first_dates: Dict[str, List[date]] = {}
+        # request id -> slot offsets from midnight and (request id, date) -> slots, per solve
+        self._slot_offsets: Dict[str, List[Tuple[timedelta, timedelta]]] = {}
+        self._slots: Dict[Tuple[str, date], List[Tuple[datetime, datetime, Tuple[int, int]]]] = {}
+        # Time-dependent constraints, most often rejecting first, and candidates checked, per
+        # solve; those that never read the assigned resources are checked per slot beforehand
+        self._slot_stats: List[_ConstraintStats] = []
+        self._constraint_stats: List[_ConstraintStats] = []
+        # request id -> the slot and candidate stats that apply to it, until the next re-sort
+        self._request_stats: Dict[str, Tuple[List[_ConstraintStats], List[_ConstraintStats]]] = {}
+        # Constraints that depend only on the request and resources, and their first
+        # violation per (request id, assigned resources), per solve
+        self._resource_constraints: List["Constraint"] = []
+        self._resource_verdicts: Dict[Tuple, Optional["Violation"]] = {}
+        # calendar id -> sorted availability index, per solve
+        self._availability: Dict[str, CalendarAvailability] = {}
+        self._candidates_checked = 0
 
     def solve(
         self,
@@ -79,16 +178,48 @@ class HeuristicSolver(SolverBackend):
         # Create constraint context
         context = self._create_context(problem, indices)
 
+        # Institutional calendar settings are fixed for the whole solve
+        calendar = context.calendar_lookup.get(problem.institutional_calendar_id)
+        self.timezone = calendar.timezone if hasattr(calendar, "timezone") else ZoneInfo("UTC")
+        self._granularity = calendar.timeslot_granularity if calendar else timedelta(minutes=15)
+
         # Start with locked assignments
         solution = problem.locked_assignments.copy()
+        buffers = request_buffers(problem.requests, context.teacher_lookup)
+        self._bookings = ResourceBookings(buffers)
+        self._bookings.extend(solution)
+        self._candidates = {}
+        self._first_dates = {}
+        self._slot_offsets = {}
+        self._slots = {}
+        checked = self._constraints_to_check(problem.constraints, buffers)
+        self._slot_stats = [
+            _ConstraintStats(c) for c in checked if c.depends_on_time and not c.depends_on_resources
+        ]
+        self._constraint_stats = [
+            _ConstraintStats(c) for c in checked if c.depends_on_time and c.depends_on_resources
+        ]
+        self._request_stats = {}
+        self._resource_constraints = [c for c in checked if not c.depends_on_time]
+        self._resource_verdicts = {}
+        self._candidates_checked = 0
+        self._availability = {
+            calendar_id: CalendarAvailability(calendar)
+            for calendar_id, calendar in context.calendar_lookup.items()
+        }
 
         # Try to schedule each request
         unscheduled = []
-        scheduled_requests: Set[str] = {a.request_id for a in solution}
+        scheduled = indices.scheduled_mask(solution)
 
         # Sort requests by priority using new priority system (longer classes first)
-        requests_to_schedule = [r for r in problem.requests if r.id not in scheduled_requests]
+        position = indices.request_index
+        requests_to_schedule = [r for r in problem.requests if not scheduled[position[r.id]]]
         requests_to_schedule = self.spreader.sort_requests_by_priority(requests_to_schedule)
+        if self.ordering == "saturation":
+            requests_to_schedule = self._saturation_order(
+                requests_to_schedule, solution, context, indices
+            )
 
         for request in requests_to_schedule:
             scheduled_occurrences = 0
@@ -101,6 +232,7 @@ class HeuristicSolver(SolverBackend):
 
                 if assignment:
                     solution.append(assignment)
+                    self._bookings.add(assignment)
                     scheduled_occurrences += 1
                 else:
                     # Couldn't schedule this occurrence
@@ -147,6 +279,24 @@ class HeuristicSolver(SolverBackend):
             solve_time_seconds=time.time() - start_time,
         )
 
+    def _constraints_to_check(
+        self, constraints: List["Constraint"], buffers: Dict[str, Tuple[int, int]]
+    ) -> List["Constraint"]:
+        """
+        Leave out the constraints that the resource bookings already enforce.
+
+        Candidates only take resources that are free over their buffered span,
+        checked against the integer booking columns. With non-negative buffers
+        that span covers the one ``NoOverlap`` compares, so a ``NoOverlap``
+        check could never reject a candidate and would only re-scan the
+        solution.
+        """
+        from edusched.constraints.hard_constraints import NoOverlap
+
+        if any(setup < 0 or cleanup < 0 for setup, cleanup in buffers.values()):
+            return constraints
+        return [constraint for constraint in constraints if type(constraint) is not NoOverlap]
+
     def _create_context(self, problem: "Problem", indices: "ProblemIndices") -> "ConstraintContext":
         """Create constraint context for checking constraints."""
         from edusched.constraints.base import ConstraintContext
@@ -174,55 +324,230 @@ class HeuristicSolver(SolverBackend):
         """
         from edusched.domain.assignment import Assignment
 
-        # Get calendar for granularity
-        calendar = context.calendar_lookup.get(context.problem.institutional_calendar_id)
-        if calendar:
-            granularity = calendar.timeslot_granularity
-        else:
-            granularity = timedelta(minutes=15)  # Default
+        # No slot can be assigned if no resource of any type fits the request
+        if not self._candidates_for(request, indices):
+            return None
 
         # Generate spread-out occurrence dates if this is the first occurrence
         if occurrence_index == 0:
-            schedule_dates = self.spreader.generate_occurrence_dates(
-                request, calendar.timezone if hasattr(calendar, "timezone") else ZoneInfo("UTC")
-            )
+            schedule_dates = self._first_occurrence_dates(request)
         else:
             # For subsequent occurrences, find the next available date
-            schedule_dates = self._find_next_available_dates(
-                request,
-                solution,
-                calendar.timezone if hasattr(calendar, "timezone") else ZoneInfo("UTC"),
-            )
+            schedule_dates = self._find_next_available_dates(request, solution, self.timezone)
+
+        # One tentative assignment is moved from slot to slot; only the accepted
+        # candidate is copied into a new Assignment
+        scratch = Assignment(
+            request_id=request.id,
+            occurrence_index=occurrence_index,
+            start_time=request.earliest_date,
+            end_time=request.earliest_date + request.duration,
+            cohort_id=request.cohort_id,
+        )
+
+        # Bound once for the slot loop below
+        bookings = self._bookings
+        available_resources = self._available_resources
+        check_slot = self._check_slot
+        check_constraints = self._check_constraints
 
         # Try each date in the preferred order (try more dates to handle conflicts)
-        for schedule_date in schedule_dates[:10]:  # Try up to 10 dates
+        for schedule_date in schedule_dates[:_MAX_DATES]:
             # Get available time slots for this date
-            time_slots = self.spreader.generate_time_slots(
-                schedule_date,
-                request,
-                granularity,
-                calendar.timezone if hasattr(calendar, "timezone") else ZoneInfo("UTC"),
-            )
+            time_slots = self._slots_for(schedule_date, request, self._granularity, self.timezone)
 
             # Try each time slot
-            for start_time, end_time in time_slots:
-                # Create tentative assignment
-                assignment = Assignment(
-                    request_id=request.id,
-                    occurrence_index=occurrence_index,
-                    start_time=start_time,
-                    end_time=end_time,
-                    cohort_id=request.cohort_id,
+            for start_time, end_time, times in time_slots:
+                scratch.start_time = start_time
+                scratch.end_time = end_time
+
+                # Constraints on the times alone rule the slot out for any resources, so
+                # they are checked before looking for free ones; they never read the
+                # resources left on the scratch assignment by the previous slot
+                if check_slot(scratch, solution, context) is not None:
+                    continue
+
+                # Free resources of each type, as many as the combinations below can use;
+                # skip the constraint checks if there are none
+                available = available_resources(
+                    scratch, context, indices, bookings, _MAX_RESOURCE_COMBINATIONS, times
                 )
-
-                # Try to assign resources
-                if self._assign_resources(assignment, context, indices, solution):
-                    # Check all constraints
-                    if self._check_constraints(assignment, solution, context):
-                        return assignment
+                if not available:
+                    continue
+
+                # Try the best resource of each type first, then a few alternates
+                combinations = product(*available.values())
+                for combination in islice(combinations, _MAX_RESOURCE_COMBINATIONS):
+                    scratch.assigned_resources = {
+                        resource_type: [resource_id]
+                        for resource_type, resource_id in zip(available, combination)
+                    }
+                    # Check the remaining constraints
+                    violation = check_constraints(scratch, solution, context)
+                    if violation is None:
+                        return replace(scratch)
+                    if violation.affected_resource_id is None:
+                        # Not caused by the resources chosen, so alternates fail too
+                        break
 
         return None
 
+    def _first_occurrence_dates(self, request: "SessionRequest") -> List[date]:
+        """Return the spread-out dates for a request's first occurrence, once per solve."""
+        dates = self._first_dates.get(request.id)
+        if dates is None:
+            dates = self.spreader.generate_occurrence_dates(request, self.timezone)
+            self._first_dates[request.id] = dates
+        return dates
+
+    def _saturation_order(
+        self,
+        requests: List["SessionRequest"],
+        solution: List["Assignment"],
+        context: "ConstraintContext",
+        indices: "ProblemIndices",
+    ) -> Iterator["SessionRequest"]:
+        """
+        Yield requests with the fewest free (slot, resource) pairs first.
+
+        The free resources of each candidate slot of a request's first
+        occurrence are found once, and the pair totals are kept in a heap,
+        ties going to the earlier request in ``requests``. Bookings only ever
+        take resources away, so after the caller schedules a yielded request
+        only the resources it booked are re-checked, on the dates it booked
+        them; outdated heap entries are skipped when popped.
+
+        Args:
+            requests: Requests to schedule, in tie-breaking order
+            solution: The solution being built; read after each yield
+            context: Constraint context
+            indices: Problem lookup structures
+        """
+        bookings = self._bookings
+        by_id = {request.id: request for request in requests}
+        position = {request.id: i for i, request in enumerate(requests)}
+        candidate_ids = {
+            request.id: {
+                resource.id
+                for resources in self._candidates_for(request, indices).values()
+                for resource in resources
+            }
+            for request in requests
+        }
+        free_slots = {
+            request.id: {
+                schedule_date: self._free_slot_resources(request, schedule_date, context, indices)
+                for schedule_date in self._first_occurrence_dates(request)[:_MAX_DATES]
+            }
+            for request in requests
+        }
+        counts = {request_id: _pair_count(by_date) for request_id, by_date in free_slots.items()}
+        heap = [(count, position[request_id], request_id) for request_id, count in counts.items()]
+        heapq.heapify(heap)
+
+        while heap:
+            count, _, request_id = heapq.heappop(heap)
+            if counts.get(request_id) != count:
+                continue  # Scheduled already or recounted since
+            del counts[request_id]
+
+            scheduled_before = len(solution)
+            yield by_id[request_id]
+
+            booked = set()
+            booked_dates = set()
+            for assignment in solution[scheduled_before:]:
+                for resource_ids in assignment.assigned_resources.values():
+                    booked.update(resource_ids)
+                booked_dates.add(assignment.start_time.astimezone(self.timezone).date())
+                booked_dates.add(assignment.end_time.astimezone(self.timezone).date())
+            if not booked:
+                continue
+
+            for other_id in counts:
+                if not candidate_ids[other_id] & booked:
+                    continue
+                by_date = free_slots[other_id]
+                changed = False
+                for schedule_date in by_date.keys() & booked_dates:
+                    for span, free_by_type in by_date[schedule_date]:
+                        for free in free_by_type.values():
+                            for resource_id in free & booked:
+                                if not bookings.is_free(resource_id, *span):
+                                    free.discard(resource_id)
+                                    changed = True
+                if changed:
+                    counts[other_id] = count = _pair_count(by_date)
+                    heapq.heappush(heap, (count, position[other_id], other_id))
+
+    def _free_slot_resources(
+        self,
+        request: "SessionRequest",
+        schedule_date: date,
+        context: "ConstraintContext",
+        indices: "ProblemIndices",
+    ) -> List[Tuple[Tuple[int, int], Dict[str, Set[str]]]]:
+        """
+        Find the free resources of each type in a request's slots on a date.
+
+        Returns:
+            (buffered span, resource type -> free resource ids) for each slot
+        """
+        from edusched.domain.assignment import Assignment
+
+        probe = Assignment(
+            request_id=request.id,
+            occurrence_index=0,
+            start_time=request.earliest_date,
+            end_time=request.earliest_date + request.duration,
+        )
+        free_slots = []
+        for start_time, end_time, times in self._slots_for(
+            schedule_date, request, self._granularity, self.timezone
+        ):
+            probe.start_time = start_time
+            probe.end_time = end_time
+            available = self._available_resources(
+                probe, context, indices, self._bookings, times=times
+            )
+            free_slots.append(
+                (
+                    self._bookings.buffered_span(request.id, *times),
+                    {resource_type: set(ids) for resource_type, ids in available.items()},
+                )
+            )
+        return free_slots
+
+    def _slots_for(
+        self,
+        schedule_date: date,
+        request: "SessionRequest",
+        granularity: timedelta,
+        timezone: ZoneInfo,
+    ) -> List[Tuple[datetime, datetime, Tuple[int, int]]]:
+        """
+        Return the candidate time slots for a request on a date, once per solve.
+
+        The request's times of day are the same on every date, so they are
+        generated once per request and shifted onto each date. Later
+        occurrences of a request often revisit the same dates, so the slot
+        datetimes, and their start and end in epoch microseconds for the
+        availability checks, are built once and reused.
+        """
+        key = (request.id, schedule_date)
+        slots = self._slots.get(key)
+        if slots is None:
+            offsets = self._slot_offsets.get(request.id)
+            if offsets is None:
+                offsets = self.spreader.daily_slot_offsets(request, granularity)
+                self._slot_offsets[request.id] = offsets
+            slots = [
+                (start, end, (to_microseconds(start), to_microseconds(end)))
+                for start, end in self.spreader.slots_on_date(schedule_date, offsets, timezone)
+            ]
+            self._slots[key] = slots
+        return slots
+
     def _find_next_available_dates(
         self, request: "SessionRequest", solution: List["Assignment"], timezone: ZoneInfo
     ) -> List:
@@ -254,196 +579,240 @@ class HeuristicSolver(SolverBackend):
 
         return available_dates[:10]  # Return up to 10 candidate dates
 
-    def _assign_resources(
+    def _available_resources(
         self,
         assignment: "Assignment",
         context: "ConstraintContext",
         indices: "ProblemIndices",
-        current_solution: List["Assignment"],
-    ) -> bool:
+        bookings: ResourceBookings,
+        limit: Optional[int] = None,
+        times: Optional[Tuple[int, int]] = None,
+    ) -> Dict[str, List[str]]:
         """
-        Assign appropriate resources to an assignment.
+        Find the resources of each type that are free for an assignment.
 
-        Returns True if successful assignment found, False otherwise.
-        """
-        from edusched.utils.capacity_utils import check_capacity_fit
+        Args:
+            assignment: Assignment whose times are checked
+            context: Constraint context
+            indices: Problem lookup structures
+            bookings: Bookings of the solution being built
+            limit: If given, stop at the first ``limit`` free resources of each type
+            times: The assignment's start and end in epoch microseconds, if the
+                caller already has them
 
+        Returns:
+            Mapping of resource type to free resource ids, best first; types
+            with no free resource are left out, so an empty mapping means the
+            slot cannot be assigned
+        """
         request = context.request_lookup[assignment.request_id]
 
-        # For each resource type needed, find suitable resource
-        assigned_resources: Dict[str, List[str]] = {}
+        # For each resource type needed, find suitable resources
+        available: Dict[str, List[str]] = {}
 
-        # Group resources by type
-        for resource_type, resources in indices.resources_by_type.items():
-            # Find resources that satisfy requirements and are available
+        # Unbuffered span in epoch microseconds, for calendar checks
+        if times is None:
+            times = (to_microseconds(assignment.start_time), to_microseconds(assignment.end_time))
+
+        # The buffered span is the same for every resource
+        span = bookings.buffered_span(assignment.request_id, *times)
+
+        # Resources of each type that fit the request, best first
+        for resource_type, resources in self._candidates_for(request, indices).items():
+            # Keep those that are available
             suitable_resources = []
             for resource in resources:
-                if resource.can_satisfy(request.required_attributes):
-                    # Check capacity for classrooms
-                    if resource_type == "classroom" and request.modality != "online":
-                        # Skip if no capacity info
-                        if resource.capacity is None:
-                            continue
-
-                        # Check if classroom can fit the enrollment
-                        can_fit, _ = check_capacity_fit(
-                            resource,
-                            request.enrollment_count,
-                            request.min_capacity or 0,
-                            request.max_capacity,
-                            buffer_percent=0.1,  # 10% buffer
-                        )
-                        if not can_fit:
-                            continue
-
-                    # Check availability if calendar specified
-                    if resource.availability_calendar_id:
-                        calendar = context.calendar_lookup[resource.availability_calendar_id]
-                        if not calendar.is_available(assignment.start_time, assignment.end_time):
-                            continue
-
-                    # Check if not already booked
-                    if self._is_resource_available(
-                        resource.id, assignment, context, current_solution
-                    ):
-                        suitable_resources.append(resource)
+                # Check availability if calendar specified
+                if resource.availability_calendar_id:
+                    calendar = self._availability[resource.availability_calendar_id]
+                    if not calendar.is_available(*times):
+                        continue
+
+                # Check if not already booked
+                if self._is_resource_available(resource.id, assignment, context, bookings, span):
+                    suitable_resources.append(resource)
+                    if len(suitable_resources) == limit:
+                        break
 
             if suitable_resources:
-                # Sort by efficiency for classrooms (closest fit to required capacity)
-                if resource_type == "classroom" and request.modality != "online":
-                    from edusched.utils.capacity_utils import calculate_efficiency_score
+                available[resource_type] = [resource.id for resource in suitable_resources]
 
-                    required_capacity = max(request.enrollment_count, request.min_capacity or 0)
-                    required_with_buffer = int(required_capacity * 1.1)  # 10% buffer
+        return available
 
-                    suitable_resources.sort(
-                        key=lambda r: calculate_efficiency_score(
-                            context.resource_lookup[r.id].capacity or 0,
-                            required_with_buffer,
-                            request.max_capacity,
-                        ),
-                        reverse=True,
-                    )
+    def _candidates_for(
+        self, request: "SessionRequest", indices: "ProblemIndices"
+    ) -> Dict[str, List["Resource"]]:
+        """
+        Find the resources of each type that fit a request, once per solve.
 
-                # Assign the best resource
-                assigned_resources[resource_type] = [suitable_resources[0].id]
+        Attribute and capacity checks, and how well a classroom's capacity
+        fits the enrollment, depend only on the request and the resource, so
+        every occurrence and candidate slot of the request reuses the result.
 
-        if assigned_resources:
-            assignment.assigned_resources = assigned_resources
-            return True
+        Args:
+            request: The session request being scheduled
+            indices: Problem lookup structures
 
-        return False
+        Returns:
+            Mapping of resource type to suitable resources, classrooms best fit
+            first and other types in index order; types with no suitable
+            resource are left out
+        """
+        cached = self._candidates.get(request.id)
+        if cached is not None:
+            return cached
+
+        from edusched.utils.capacity_utils import calculate_efficiency_score
+
+        by_type = suitable_resources(request, indices.resources_by_type)
+
+        # Rank classrooms by efficiency (closest fit to required capacity)
+        classrooms = by_type.get("classroom")
+        if classrooms and request.modality != "online":
+            required_capacity = max(request.enrollment_count, request.min_capacity or 0)
+            required_with_buffer = int(required_capacity * 1.1)  # 10% buffer
+            # Stable, so equally efficient rooms keep index order
+            classrooms.sort(
+                key=lambda r: calculate_efficiency_score(
+                    r.capacity or 0, required_with_buffer, request.max_capacity
+                ),
+                reverse=True,
+            )
+
+        self._candidates[request.id] = by_type
+        return by_type
 
     def _is_resource_available(
         self,
         resource_id: str,
         assignment: "Assignment",
         context: "ConstraintContext",
-        solution: List["Assignment"],
+        bookings: ResourceBookings,
+        span: Optional[Tuple[int, int]] = None,
     ) -> bool:
-        """Check if resource is available during the assignment period."""
-        from datetime import timedelta
-
-        # Get setup/cleanup time requirements
-        setup_minutes = 15  # Default setup time
-        cleanup_minutes = 10  # Default cleanup time
-
-        # Check if teacher has specific setup requirements
-        request = context.request_lookup.get(assignment.request_id)
-        if request and request.teacher_id:
-            teacher = context.teacher_lookup.get(request.teacher_id)
-            if teacher:
-                setup_minutes = teacher.setup_time_minutes
-                cleanup_minutes = teacher.cleanup_time_minutes
-
-        # Check against existing solution (including locked assignments)
-        # Include setup/cleanup buffer times
-        assignment_start = assignment.start_time - timedelta(minutes=setup_minutes)
-        assignment_end = assignment.end_time + timedelta(minutes=cleanup_minutes)
-
-        for existing in solution:
-            for resource_ids in existing.assigned_resources.values():
-                if resource_id in resource_ids:
-                    # Also add buffer for existing assignment
-                    existing_setup = 15
-                    existing_cleanup = 10
-                    if existing.request_id != assignment.request_id:
-                        existing_request = context.request_lookup.get(existing.request_id)
-                        if existing_request and existing_request.teacher_id:
-                            existing_teacher = context.teacher_lookup.get(
-                                existing_request.teacher_id
-                            )
-                            if existing_teacher:
-                                existing_setup = existing_teacher.setup_time_minutes
-                                existing_cleanup = existing_teacher.cleanup_time_minutes
-
-                    existing_start = existing.start_time - timedelta(minutes=existing_setup)
-                    existing_end = existing.end_time + timedelta(minutes=existing_cleanup)
-
-                    if assignment_start < existing_end and assignment_end > existing_start:
-                        return False
-
-        return True
+        """Check if resource is available during the assignment period.
+
+        ``span`` is the assignment's buffered span from ``bookings.span``,
+        passed in when the caller checks several resources for one slot.
+        """
+        # Both the assignment and existing bookings (including locked assignments)
+        # are widened by their teacher's setup/cleanup buffers
+        start, end = span if span is not None else bookings.span(assignment)
+        return bookings.is_free(resource_id, start, end)
 
     def _check_constraints(
         self,
         assignment: "Assignment",
         solution: List["Assignment"],
         context: "ConstraintContext",
-    ) -> bool:
-        """Check all constraints against the assignment."""
-        for constraint in context.problem.constraints:
-            violation = constraint.check(assignment, solution, context)
+    ) -> Optional["Violation"]:
+        """
+        Check the constraints that involve the assigned resources, returning the first violation.
+
+        Constraints that do not depend on time are checked first, once per
+        request and set of assigned resources; later slots tried with the same
+        resources reuse the result. Of the others, those that have rejected
+        the largest share of candidates so far are checked first, so failing
+        candidates are usually dropped after one check. The order is refreshed
+        every ``_REORDER_INTERVAL`` candidates; the sort is stable, so ties
+        keep the problem's declared order. Constraints that never read the
+        assigned resources are left to ``_check_slot``.
+        """
+        if self._resource_constraints:
+            resources = assignment.assigned_resources.items()
+            key = (assignment.request_id, tuple((kind, tuple(ids)) for kind, ids in resources))
+            if key in self._resource_verdicts:
+                violation = self._resource_verdicts[key]
+            else:
+                violation = self._check_resource_constraints(assignment, solution, context)
+                self._resource_verdicts[key] = violation
             if violation:
-                return False
-        return True
-
-    def _next_aligned_timeslot(
-        self, current: datetime, granularity: timedelta, max_date: datetime
-    ) -> datetime:
-        """Get next timeslot aligned to granularity."""
-        # Round up to next granularity boundary
-        if granularity.total_seconds() > 0:
-            # Calculate minutes since midnight
-            minutes_since_midnight = current.hour * 60 + current.minute + current.second / 60
-            granularity_minutes = granularity.total_seconds() / 60
-
-            # Find next aligned time
-            next_minutes = (
-                (minutes_since_midnight // granularity_minutes) + 1
-            ) * granularity_minutes
-            next_hour = int(next_minutes // 60)
-            next_minute = int(next_minutes % 60)
-
-            next_time = current.replace(
-                hour=next_hour % 24, minute=next_minute, second=0, microsecond=0
+                return violation
+
+        self._candidates_checked += 1
+        if self._candidates_checked % _REORDER_INTERVAL == 0:
+            self._constraint_stats.sort(key=lambda stats: stats.rejection_rate, reverse=True)
+            self._slot_stats.sort(key=lambda stats: stats.rejection_rate, reverse=True)
+            self._request_stats = {}
+
+        _, candidate_stats = self._stats_for(assignment.request_id)
+        return self._check_ordered(candidate_stats, assignment, solution, context)
+
+    def _check_slot(
+        self,
+        assignment: "Assignment",
+        solution: List["Assignment"],
+        context: "ConstraintContext",
+    ) -> Optional["Violation"]:
+        """Check the constraints that never read the assigned resources, returning the first violation."""
+        slot_stats, _ = self._stats_for(assignment.request_id)
+        return self._check_ordered(slot_stats, assignment, solution, context)
+
+    def _stats_for(
+        self, request_id: str
+    ) -> Tuple[List[_ConstraintStats], List[_ConstraintStats]]:
+        """
+        Return the slot and candidate constraint stats that apply to a request, in check order.
+
+        Constraints scoped to other requests are left out, so they are not
+        called for every slot of every request. The lists are rebuilt after
+        each re-sort.
+        """
+        stats = self._request_stats.get(request_id)
+        if stats is None:
+            stats = (
+                [s for s in self._slot_stats if s.constraint.applies_to(request_id)],
+                [s for s in self._constraint_stats if s.constraint.applies_to(request_id)],
             )
+            self._request_stats[request_id] = stats
+        return stats
 
-            # If we've passed midnight, move to next day
-            if next_hour >= 24:
-                days_to_add = int(next_hour // 24)
-                next_time += timedelta(days=days_to_add)
+    def _check_ordered(
+        self,
+        constraint_stats: List[_ConstraintStats],
+        assignment: "Assignment",
+        solution: List["Assignment"],
+        context: "ConstraintContext",
+    ) -> Optional["Violation"]:
+        """
+        Check constraints in the given order, recording checks and rejections.
 
-            return next_time
+        Constraints with a cache key are skipped for assignments whose key
+        already passed them.
+        """
+        for stats in constraint_stats:
+            stats.checks += 1
+            passed = stats.passed
+            if passed is not None:
+                key = stats.constraint.cache_key(assignment)
+                if key in passed:
+                    continue
+            violation = stats.constraint.check(assignment, solution, context)
+            if violation:
+                stats.rejects += 1
+                return violation
+            if passed is not None and key is not None:
+                passed.add(key)
+        return None
 
-        return current + timedelta(minutes=15)
+    def _check_resource_constraints(
+        self,
+        assignment: "Assignment",
+        solution: List["Assignment"],
+        context: "ConstraintContext",
+    ) -> Optional["Violation"]:
+        """Check the constraints that do not depend on time, returning the first violation."""
+        for constraint in self._resource_constraints:
+            violation = constraint.check(assignment, solution, context)
+            if violation:
+                return violation
+        return None
 
     def _calculate_objectives(
         self, objectives: List["Objective"], solution: List["Assignment"]
-    ) -> float:
+    ) -> Optional[float]:
         """Calculate weighted objective score."""
-        if not objectives:
-            return None
-
-        total_score = 0.0
-        total_weight = 0.0
-
-        for objective in objectives:
-            score = objective.score(solution)
-            total_score += score * objective.weight
-            total_weight += objective.weight
-
-        return total_score / total_weight if total_weight > 0 else None
+        return weighted_score(objectives, solution)
 
     def _generate_infeasibility_report(
         self,
@@ -14,6 +14,28 @@ if TYPE_CHECKING:
     from edusched.domain.result import Result
 
 
+def _record_usage(
+    usage: Dict[str, List[Tuple[datetime, datetime]]], assignment: "Assignment"
+) -> None:
+    """Add an assignment's time span to the usage list of each resource it holds."""
+    for resource_ids in assignment.assigned_resources.values():
+        for resource_id in resource_ids:
+            if resource_id not in usage:
+                usage[resource_id] = []
+            # Insert while maintaining sorted order
+            bisect.insort(usage[resource_id], (assignment.start_time, assignment.end_time))
+
+
+def _resource_usage_map(
+    schedule: List["Assignment"],
+) -> Dict[str, List[Tuple[datetime, datetime]]]:
+    """Map each resource id to the sorted time spans it is booked for in a schedule."""
+    usage: Dict[str, List[Tuple[datetime, datetime]]] = {}
+    for assignment in schedule:
+        _record_usage(usage, assignment)
+    return usage
+
+
 class IncrementalSolver(SolverBackend):
     """Solver for incremental schedule modifications."""
 
@@ -42,15 +64,18 @@ class IncrementalSolver(SolverBackend):
 
         updated_schedule = existing_schedule.copy()
         conflicts = []
+        # Bookings per resource, kept up to date as occurrences are added
+        resource_usage = _resource_usage_map(updated_schedule)
 
         # Try to schedule all occurrences of the new course
         for occurrence_index in range(new_request.number_of_occurrences):
             assignment = self._schedule_single_occurrence(
-                new_request, occurrence_index, updated_schedule, context, indices
+                new_request, occurrence_index, updated_schedule, context, indices, resource_usage
             )
 
             if assignment:
                 updated_schedule.append(assignment)
+                _record_usage(resource_usage, assignment)
             else:
                 # Couldn't schedule this occurrence
                 conflicts.append(f"Occurrence {occurrence_index + 1} of {new_request.id}")
@@ -203,8 +228,13 @@ class IncrementalSolver(SolverBackend):
         current_schedule: List["Assignment"],
         context: ConstraintContext,
         indices: ProblemIndices,
+        resource_usage: Dict[str, List[Tuple[datetime, datetime]]],
     ) -> Optional["Assignment"]:
-        """Attempt to schedule a single occurrence."""
+        """Attempt to schedule a single occurrence.
+
+        ``resource_usage`` maps resource ids to their bookings in
+        ``current_schedule``, as built by ``_resource_usage_map``.
+        """
         from edusched.domain.assignment import Assignment
 
         # Generate candidate time slots
@@ -222,7 +252,7 @@ class IncrementalSolver(SolverBackend):
             )
 
             # Try to assign resources
-            if self._assign_resources(assignment, context, indices, current_schedule):
+            if self._assign_resources(assignment, context, indices, resource_usage):
                 # Check constraints
                 if self._check_constraints(assignment, current_schedule, context):
                     return assignment
@@ -264,7 +294,7 @@ class IncrementalSolver(SolverBackend):
         assignment,
         context: ConstraintContext,
         indices: ProblemIndices,
-        current_schedule: List["Assignment"],
+        resource_usage: Dict[str, List[Tuple[datetime, datetime]]],
     ) -> bool:
         """Assign resources to assignment."""
         request = context.request_lookup[assignment.request_id]
@@ -277,7 +307,7 @@ class IncrementalSolver(SolverBackend):
 
                 # Find available resources of this type
                 for resource in indices.resources_by_type.get(resource_type, []):
-                    if self._is_resource_available(resource, assignment, current_schedule):
+                    if self._is_resource_available(resource, assignment, resource_usage):
                         available_resources.append(resource)
 
                 # Check if we have enough resources
@@ -291,18 +321,13 @@ class IncrementalSolver(SolverBackend):
         return True
 
     def _is_resource_available(
-        self, resource, assignment, current_schedule: List["Assignment"]
+        self, resource, assignment, resource_usage: Dict[str, List[Tuple[datetime, datetime]]]
     ) -> bool:
         """Check if resource is available at assignment time."""
-        # Check against existing assignments
-        for existing in current_schedule:
-            for resource_ids in existing.assigned_resources.values():
-                if resource.id in resource_ids:
-                    if (
-                        assignment.start_time < existing.end_time
-                        and assignment.end_time > existing.start_time
-                    ):
-                        return False
+        # Check against the existing bookings of this resource only
+        for start_time, end_time in resource_usage.get(resource.id, ()):
+            if assignment.start_time < end_time and assignment.end_time > start_time:
+                return False
         return True
 
     def _check_constraints(self, assignment, current_schedule, context: ConstraintContext) -> bool:
@@ -447,17 +472,7 @@ class IncrementalState:
         self, schedule: List["Assignment"]
     ) -> Dict[str, List[Tuple[datetime, datetime]]]:
         """Build resource usage map for efficient conflict checking."""
-        usage_map = {}
-        for assignment in schedule:
-            for resource_ids in assignment.assigned_resources.values():
-                for resource_id in resource_ids:
-                    if resource_id not in usage_map:
-                        usage_map[resource_id] = []
-                    # Insert while maintaining sorted order
-                    bisect.insort(
-                        usage_map[resource_id], (assignment.start_time, assignment.end_time)
-                    )
-        return usage_map
+        return _resource_usage_map(schedule)
 
     def has_resource_conflict(
         self, resource_id: str, start_time: datetime, end_time: datetime
@@ -491,13 +506,7 @@ class IncrementalState:
         self.schedule.append(assignment)
 
         # Update resource usage
-        for resource_ids in assignment.assigned_resources.values():
-            for resource_id in resource_ids:
-                if resource_id not in self.resource_usage:
-                    self.resource_usage[resource_id] = []
-                bisect.insort(
-                    self.resource_usage[resource_id], (assignment.start_time, assignment.end_time)
-                )
+        _record_usage(self.resource_usage, assignment)
 
         # Clear affected constraint cache
         self._invalidate_constraint_cache(assignment)
@@ -0,0 +1,8 @@
+"""Compatibility helpers for the supported Python versions."""
+
+import sys
+from typing import Any, Dict
+
+# dataclass() options that make records slotted where supported (3.10+); used
+# for the classes solvers, detectors and reports create in bulk
+SLOTTED_DATACLASS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
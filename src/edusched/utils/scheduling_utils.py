@@ -1,11 +1,23 @@
 """Utilities for scheduling with patterns and spreading occurrences."""
 
-from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+import bisect
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
 from edusched.domain.holiday_calendar import HolidayCalendar
 from edusched.domain.session_request import SessionRequest
+from edusched.utils.capacity_utils import check_capacity_fit
+
+if TYPE_CHECKING:
+    from edusched.domain.assignment import Assignment
+    from edusched.domain.calendar import Calendar, TimeWindow
+    from edusched.domain.resource import Resource
+    from edusched.domain.teacher import Teacher
+
+# Any midnight will do for formatting wall-clock offsets as times of day
+_WALL_CLOCK_DAY = datetime(2000, 1, 1)
 
 
 class OccurrenceSpreader:
@@ -236,29 +248,56 @@ class OccurrenceSpreader:
         Returns:
             List of (start_time, end_time) tuples
         """
+        offsets = self.daily_slot_offsets(request, calendar_granularity)
+        return self.slots_on_date(schedule_date, offsets, timezone)
+
+    def daily_slot_offsets(
+        self, request: SessionRequest, calendar_granularity: timedelta
+    ) -> List[Tuple[timedelta, timedelta]]:
+        """
+        Generate a request's potential time slots as offsets from local midnight.
+
+        Slots and preferred times are wall-clock times, so the offsets are the
+        same on every date and can be computed once per request.
+
+        Args:
+            request: The session request
+            calendar_granularity: Time slot granularity from calendar
+
+        Returns:
+            List of (start, end) offsets from midnight
+        """
         # Default time slots (9 AM to 5 PM)
         default_start_time = 9  # 9 AM
         default_end_time = 17  # 5 PM
 
-        slots = []
+        offsets = []
         current_hour = default_start_time
 
         while current_hour + (request.duration.total_seconds() / 3600) <= default_end_time:
-            start_time = datetime.combine(
-                schedule_date, datetime.min.time(), tzinfo=timezone
-            ) + timedelta(hours=current_hour)
-            end_time = start_time + request.duration
+            start = timedelta(hours=current_hour)
+            end = start + request.duration
 
             # Check against preferred time slots
-            if self._is_preferred_time_slot(start_time, end_time, request):
-                slots.append((start_time, end_time))
+            if self._is_preferred_time_slot(_WALL_CLOCK_DAY + start, _WALL_CLOCK_DAY + end, request):
+                offsets.append((start, end))
 
             # Move to next possible time (accounting for duration)
             current_hour = (
                 current_hour + int(request.duration.total_seconds() / 3600) + 1
             )  # Add duration hours + 1 hour gap
 
-        return slots
+        return offsets
+
+    @staticmethod
+    def slots_on_date(
+        schedule_date: date,
+        offsets: List[Tuple[timedelta, timedelta]],
+        timezone: ZoneInfo = ZoneInfo("UTC"),
+    ) -> List[Tuple[datetime, datetime]]:
+        """Place offsets from ``daily_slot_offsets`` on a date, as (start_time, end_time) tuples."""
+        midnight = datetime.combine(schedule_date, datetime.min.time(), tzinfo=timezone)
+        return [(midnight + start, midnight + end) for start, end in offsets]
 
     def _is_preferred_time_slot(
         self, start_time: datetime, end_time: datetime, request: SessionRequest
@@ -294,7 +333,205 @@ class OccurrenceSpreader:
             return 1
 
     def sort_requests_by_priority(self, requests: List[SessionRequest]) -> List[SessionRequest]:
-        """Sort requests by priority (longer classes first)."""
+        """Sort requests by priority (longer classes first).
+
+        Ties are broken by latest date, compared as integer epoch microseconds
+        so the sort compares plain ints rather than aware datetimes.
+        """
         return sorted(
-            requests, key=lambda r: (self.calculate_priority_score(r), r.latest_date), reverse=True
+            requests,
+            key=lambda r: (self.calculate_priority_score(r), to_microseconds(r.latest_date)),
+            reverse=True,
         )
+
+
+MINUTE_US = 60_000_000
+# Setup/cleanup buffers (microseconds) used when a request has no teacher with specific requirements
+DEFAULT_BUFFERS = (15 * MINUTE_US, 10 * MINUTE_US)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def to_microseconds(moment: datetime) -> int:
+    """Return ``moment`` as integer microseconds since the epoch."""
+    return (moment - (_EPOCH if moment.tzinfo is not None else _NAIVE_EPOCH)) // _ONE_MICROSECOND
+
+
+def request_buffers(
+    requests: Iterable[SessionRequest], teacher_lookup: Dict[str, "Teacher"]
+) -> Dict[str, Tuple[int, int]]:
+    """Look up the setup/cleanup buffers of each request's teacher once, in microseconds.
+
+    Requests without a known teacher are left out and use ``DEFAULT_BUFFERS``.
+    """
+    buffers = {}
+    for request in requests:
+        teacher = teacher_lookup.get(request.teacher_id) if request.teacher_id else None
+        if teacher:
+            buffers[request.id] = (
+                teacher.setup_time_minutes * MINUTE_US,
+                teacher.cleanup_time_minutes * MINUTE_US,
+            )
+    return buffers
+
+
+def suitable_resources(
+    request: SessionRequest, resources_by_type: Dict[str, List["Resource"]]
+) -> Dict[str, List["Resource"]]:
+    """Find the resources of each type whose attributes and capacity fit a request.
+
+    Classrooms for requests that are not online must have a known capacity that
+    fits the enrollment with a 10% buffer. Resources keep their index order, and
+    types with no suitable resource are left out.
+    """
+    by_type = {}
+    for resource_type, resources in resources_by_type.items():
+        suitable = []
+        for resource in resources:
+            if not resource.can_satisfy(request.required_attributes):
+                continue
+
+            # Check capacity for classrooms
+            if resource_type == "classroom" and request.modality != "online":
+                # Skip if no capacity info
+                if resource.capacity is None:
+                    continue
+
+                # Check if classroom can fit the enrollment
+                can_fit, _ = check_capacity_fit(
+                    resource,
+                    request.enrollment_count,
+                    request.min_capacity or 0,
+                    request.max_capacity,
+                    buffer_percent=0.1,  # 10% buffer
+                )
+                if not can_fit:
+                    continue
+
+            suitable.append(resource)
+        if suitable:
+            by_type[resource_type] = suitable
+    return by_type
+
+
+class ResourceBookings:
+    """Buffered booking spans of a schedule, stored column-wise per resource.
+
+    Spans are integer microseconds since the epoch, so lookups compare plain
+    ints. Each resource's spans are kept sorted by start, alongside the running
+    maximum of their ends, so an availability check is one bisection and one
+    comparison.
+    """
+
+    def __init__(self, buffers: Dict[str, Tuple[int, int]]):
+        self._buffers = buffers
+        self._starts: Dict[str, List[int]] = {}
+        self._ends: Dict[str, List[int]] = {}
+        # latest_ends[k] is the latest end among the first k + 1 bookings by start
+        self._latest_ends: Dict[str, List[int]] = {}
+
+    def span(self, assignment: "Assignment") -> Tuple[int, int]:
+        """Return the assignment's time span widened by its setup/cleanup buffers."""
+        return self.buffered_span(
+            assignment.request_id,
+            to_microseconds(assignment.start_time),
+            to_microseconds(assignment.end_time),
+        )
+
+    def buffered_span(self, request_id: str, start: int, end: int) -> Tuple[int, int]:
+        """Widen a span of a request, in epoch microseconds, by its setup/cleanup buffers."""
+        setup, cleanup = self._buffers.get(request_id, DEFAULT_BUFFERS)
+        return start - setup, end + cleanup
+
+    def add(self, assignment: "Assignment", span: Optional[Tuple[int, int]] = None) -> None:
+        """Book every resource assigned to ``assignment``.
+
+        ``span`` is the assignment's buffered span, if the caller already has it.
+        """
+        start, end = span if span is not None else self.span(assignment)
+        for resource_ids in assignment.assigned_resources.values():
+            for resource_id in resource_ids:
+                starts = self._starts.setdefault(resource_id, [])
+                latest_ends = self._latest_ends.setdefault(resource_id, [])
+                position = bisect.bisect_right(starts, start)
+                starts.insert(position, start)
+                self._ends.setdefault(resource_id, []).insert(position, end)
+                latest_ends.insert(position, max(end, latest_ends[position - 1]) if position else end)
+                # Raise the running maximum of later bookings until one already ends later
+                for k in range(position + 1, len(latest_ends)):
+                    if latest_ends[k] >= end:
+                        break
+                    latest_ends[k] = end
+
+    def extend(
+        self, assignments: Iterable["Assignment"], resource_ids: Optional[Set[str]] = None
+    ) -> None:
+        """Book the resources of several assignments, sorting each resource once.
+
+        When ``resource_ids`` is given, only bookings of those resources are kept.
+        """
+        spans: Dict[str, List[Tuple[int, int]]] = {}
+        for assignment in assignments:
+            span = None
+            for booked in assignment.assigned_resources.values():
+                for resource_id in booked:
+                    if resource_ids is not None and resource_id not in resource_ids:
+                        continue
+                    if span is None:
+                        span = self.span(assignment)
+                    spans.setdefault(resource_id, []).append(span)
+
+        for resource_id, added in spans.items():
+            added.extend(zip(self._starts.get(resource_id, ()), self._ends.get(resource_id, ())))
+            added.sort()
+            self._starts[resource_id] = [start for start, _ in added]
+            self._ends[resource_id] = [end for _, end in added]
+            self._latest_ends[resource_id] = list(accumulate(self._ends[resource_id], max))
+
+    def is_free(self, resource_id: str, start: int, end: int) -> bool:
+        """Check that no booking of ``resource_id`` overlaps ``[start, end)``."""
+        starts = self._starts.get(resource_id)
+        if not starts:
+            return True
+        # Bookings starting before ``end`` overlap the span if any ends after ``start``
+        count = bisect.bisect_left(starts, end)
+        return not count or self._latest_ends[resource_id][count - 1] <= start
+
+
+class CalendarAvailability:
+    """A calendar's availability windows and blackout periods, sorted for bisection.
+
+    Answers the same question as ``Calendar.is_available`` for spans given in
+    integer microseconds since the epoch. Each list of periods is sorted by
+    start, with the running maximum of their ends, so a lookup bisects once
+    per list instead of scanning every period.
+    """
+
+    def __init__(self, calendar: "Calendar"):
+        self._window_starts, self._window_reach = self._sorted(calendar.availability_windows)
+        self._blackout_starts, self._blackout_reach = self._sorted(calendar.blackout_periods)
+
+    @staticmethod
+    def _sorted(periods: Iterable["TimeWindow"]) -> Tuple[List[int], List[int]]:
+        """Return the period starts in order and the latest end reached by each prefix."""
+        spans = sorted((to_microseconds(p.start), to_microseconds(p.end)) for p in periods)
+        reach = []
+        latest = None
+        for _, end in spans:
+            latest = end if latest is None or end > latest else latest
+            reach.append(latest)
+        return [start for start, _ in spans], reach
+
+    def is_available(self, start: int, end: int) -> bool:
+        """Check that ``[start, end)`` lies in a window and misses every blackout."""
+        if self._window_starts:
+            # Some window starting at or before ``start`` must also end at or after ``end``
+            last = bisect.bisect_right(self._window_starts, start)
+            if not last or self._window_reach[last - 1] < end:
+                return False
+
+        # No blackout starting before ``end`` may still be running at ``start``
+        last = bisect.bisect_left(self._blackout_starts, end)
+        return not last or self._blackout_reach[last - 1] <= start
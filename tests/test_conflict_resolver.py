@@ -0,0 +1,615 @@
+"""Tests for conflict detection and resolution."""
+
+from datetime import datetime, timedelta
+from itertools import permutations
+from types import SimpleNamespace
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from edusched.constraints.base import Constraint, Violation
+from edusched.solvers.conflict_resolver import (
+    AutomatedResolver,
+    ConflictBatch,
+    ConflictDetector,
+    ConflictResolver,
+    ConflictType,
+    ResolutionStrategy,
+    _min_cost_assignment,
+)
+
+BASE = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+
+
+def _make_assignment(assignment_id, start_minutes, duration_minutes, **extra):
+    return SimpleNamespace(
+        id=assignment_id,
+        start_time=BASE + timedelta(minutes=start_minutes),
+        duration=timedelta(minutes=duration_minutes),
+        **extra,
+    )
+
+
+def _make_context(requests=(), constraints=()):
+    return SimpleNamespace(
+        request_lookup={request.id: request for request in requests},
+        resource_lookup={},
+        constraints=list(constraints),
+    )
+
+
+def _make_double_booking():
+    rooms = {
+        "Room1": SimpleNamespace(id="Room1", resource_type="classroom", capacity=30),
+        "Room2": SimpleNamespace(id="Room2", resource_type="classroom", capacity=40),
+    }
+    requests = [
+        SimpleNamespace(id=f"r{i}", teacher_id=None, enrollment_count=25, priority=i + 1)
+        for i in range(2)
+    ]
+    assignments = [
+        _make_assignment(
+            f"a{i}",
+            30 * i,
+            60,
+            request_id=f"r{i}",
+            resource=rooms["Room1"],
+            assigned_resources=[["Room1"]],
+        )
+        for i in range(2)
+    ]
+    context = _make_context(requests)
+    context.resource_lookup = rooms
+    return assignments, context
+
+
+class _CountingConstraint:
+    """Constraint stub that flags every assignment and counts its checks."""
+
+    constraint_type = "soft.counting"
+
+    def __init__(self):
+        self.calls = 0
+
+    def check(self, assignment, solution, context):
+        self.calls += 1
+        return Violation(constraint_type=self.constraint_type, affected_request_id=assignment.request_id)
+
+    def cache_key(self, assignment):
+        return (assignment.start_time, assignment.duration)
+
+
+class _BusyResourceConstraint:
+    """Flags assignments sharing their resource with more than one other assignment."""
+
+    constraint_type = "hard.max_two_per_resource"
+
+    def check(self, assignment, solution, context):
+        sharing = [a for a in solution if a.resource.id == assignment.resource.id]
+        if len(sharing) > 2:
+            return Violation(constraint_type=self.constraint_type, affected_request_id=assignment.request_id)
+        return None
+
+
+class _EveningConstraint(Constraint):
+    """Flags sessions starting at or after 17:00 and counts batch calls."""
+
+    def __init__(self):
+        self.batch_calls = 0
+
+    def check(self, assignment, solution, context):
+        if assignment.start_time.hour >= 17:
+            return Violation(constraint_type=self.constraint_type, affected_request_id=assignment.request_id)
+        return None
+
+    def check_batch(self, assignments, solution, context):
+        self.batch_calls += 1
+        return super().check_batch(assignments, solution, context)
+
+    def explain(self, violation):
+        return "Evening session"
+
+    @property
+    def constraint_type(self):
+        return "soft.no_evening"
+
+
+class TestPairwiseOverlaps:
+    """Tests for the sweep-line overlap search."""
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=600),
+                st.integers(min_value=0, max_value=180),
+            ),
+            max_size=25,
+        )
+    )
+    def test_matches_brute_force(self, slots):
+        """The sweep finds exactly the pairs a full pairwise scan finds."""
+        detector = ConflictDetector()
+        assignments = [
+            _make_assignment(f"a{i}", start, duration) for i, (start, duration) in enumerate(slots)
+        ]
+
+        expected = [
+            (i, j)
+            for i in range(len(assignments))
+            for j in range(i + 1, len(assignments))
+            if detector._assignments_overlap(assignments[i], assignments[j])
+        ]
+
+        assert detector._pairwise_overlaps(assignments) == expected
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=600),
+                st.integers(min_value=0, max_value=120),
+            ),
+            max_size=25,
+        ).map(sorted)
+    )
+    def test_schedule_order_matches_brute_force(self, slots):
+        """Buckets already in start order take the unsorted path's results."""
+        detector = ConflictDetector()
+        assignments = [
+            _make_assignment(f"a{i}", start, duration) for i, (start, duration) in enumerate(slots)
+        ]
+
+        expected = [
+            (i, j)
+            for i in range(len(assignments))
+            for j in range(i + 1, len(assignments))
+            if detector._assignments_overlap(assignments[i], assignments[j])
+        ]
+
+        assert detector._pairwise_overlaps(assignments) == expected
+
+    def test_teacher_overload_detected(self):
+        """Overlapping sessions of the same teacher are reported once per pair."""
+        detector = ConflictDetector()
+        requests = [
+            SimpleNamespace(id="r1", teacher_id="prof_smith"),
+            SimpleNamespace(id="r2", teacher_id="prof_smith"),
+            SimpleNamespace(id="r3", teacher_id="prof_smith"),
+        ]
+        assignments = [
+            _make_assignment("a1", 0, 60, request_id="r1"),
+            _make_assignment("a2", 30, 60, request_id="r2"),
+            _make_assignment("a3", 120, 60, request_id="r3"),
+        ]
+
+        conflicts = detector._detect_teacher_overload(assignments, _make_context(requests))
+
+        assert len(conflicts) == 1
+        assert conflicts[0].conflict_type == ConflictType.TEACHER_OVERLOAD
+        assert conflicts[0].assignment_ids == ["a1", "a2"]
+        assert conflicts[0].conflict_id == "teacher_overload_prof_smith_0_1"
+
+
+class TestConflictDetector:
+    """Tests for full detection passes."""
+
+    def test_detect_all_conflicts(self):
+        """A full pass reports room double-bookings and clears its interval table."""
+        detector = ConflictDetector()
+        room = SimpleNamespace(id="Room1")
+        requests = [SimpleNamespace(id="r1", teacher_id=None), SimpleNamespace(id="r2", teacher_id=None)]
+        assignments = [
+            _make_assignment("a1", 0, 60, request_id="r1", resource=room, assigned_resources=[["Room1"]]),
+            _make_assignment("a2", 30, 60, request_id="r2", resource=room, assigned_resources=[["Room1"]]),
+        ]
+
+        conflicts = detector.detect_all_conflicts(assignments, _make_context(requests))
+
+        assert [c.conflict_type for c in conflicts] == [ConflictType.RESOURCE_DOUBLE_BOOKING]
+        assert conflicts[0].assignment_ids == ["a1", "a2"]
+        assert detector._intervals is None
+
+    def test_partition_groups_linked_assignments(self):
+        """Assignments linked through shared rooms or teachers share a partition."""
+        detector = ConflictDetector()
+        requests = [
+            SimpleNamespace(id="r0", teacher_id="prof_a"),
+            SimpleNamespace(id="r1", teacher_id=None),
+            SimpleNamespace(id="r2", teacher_id="prof_a"),
+            SimpleNamespace(id="r3", teacher_id=None),
+        ]
+        rooms = ["Room1", "Room2", "Room2", "Room3"]
+        assignments = [
+            _make_assignment(f"a{i}", 0, 60, request_id=f"r{i}", assigned_resources=[[room]])
+            for i, room in enumerate(rooms)
+        ]
+
+        partitions = detector._partition(assignments, _make_context(requests))
+
+        assert [[a.id for a in group] for group in partitions] == [["a0", "a1", "a2"], ["a3"]]
+
+    def test_detection_time_is_opt_in(self):
+        """Conflicts carry one shared detection time only when recording is enabled."""
+        room = SimpleNamespace(id="Room1")
+        requests = [SimpleNamespace(id=f"r{i}", teacher_id=None) for i in range(3)]
+        assignments = [
+            _make_assignment(f"a{i}", 0, 60, request_id=f"r{i}", resource=room, assigned_resources=[["Room1"]])
+            for i in range(3)
+        ]
+
+        plain = ConflictDetector().detect_all_conflicts(assignments, _make_context(requests))
+        stamped = ConflictDetector(record_detection_time=True).detect_all_conflicts(
+            assignments, _make_context(requests)
+        )
+
+        assert len(plain) == len(stamped) == 3
+        assert all(c.detection_time is None for c in plain)
+        assert len({c.detection_time for c in stamped}) == 1
+        assert stamped[0].detection_time is not None
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=600),
+                st.integers(min_value=0, max_value=180),
+            ),
+            min_size=1,
+            max_size=20,
+        )
+    )
+    def test_indices_match_pairwise_scan(self, slots):
+        """Index queries find the same overlaps as a pairwise scan, before and after removal."""
+        detector = ConflictDetector()
+        requests = [SimpleNamespace(id="r", teacher_id="prof_smith")]
+        assignments = [
+            _make_assignment(f"a{i}", start, duration, request_id="r", assigned_resources=[])
+            for i, (start, duration) in enumerate(slots)
+        ]
+        detector._build_indices(assignments, _make_context(requests))
+
+        removed = assignments.pop()
+        detector.remove_assignment(removed)
+
+        for assignment in assignments:
+            expected = {
+                other.id
+                for other in assignments
+                if other is not assignment and detector._assignments_overlap(assignment, other)
+            }
+            found = {other.id for _, other in detector.find_overlapping(assignment)}
+            assert found == expected
+        assert detector.find_overlapping(removed) == []
+
+    def test_constraint_checks_are_cached(self):
+        """Unchanged assignments are not re-checked on later detection passes."""
+        detector = ConflictDetector()
+        constraint = _CountingConstraint()
+        context = _make_context([SimpleNamespace(id="r1", teacher_id=None)], [constraint])
+        assignment = _make_assignment(
+            "a1", 0, 60, request_id="r1", resource=SimpleNamespace(id="Room1"), assigned_resources=[["Room1"]]
+        )
+
+        first = detector._detect_constraint_violations([assignment], context)
+        second = detector._detect_constraint_violations([assignment], context)
+        assert constraint.calls == 1
+        assert [c.conflict_id for c in first] == [c.conflict_id for c in second]
+
+        assignment.start_time += timedelta(hours=1)
+        detector._detect_constraint_violations([assignment], context)
+        assert constraint.calls == 2
+
+        detector.invalidate(["a1"])
+        detector._detect_constraint_violations([assignment], context)
+        assert constraint.calls == 3
+
+    def test_solution_dependent_checks_are_not_cached(self):
+        """Constraints without a cache_key see neighbours change between passes."""
+        detector = ConflictDetector()
+        rooms = {name: SimpleNamespace(id=name) for name in ("Room1", "Room2")}
+        context = _make_context([], [_BusyResourceConstraint()])
+        assignments = [
+            _make_assignment(f"a{i}", 60 * i, 60, request_id=f"r{i}", resource=rooms[room], assigned_resources=[])
+            for i, room in enumerate(["Room1", "Room1", "Room2"])
+        ]
+
+        def flagged():
+            conflicts = detector.detect_all_conflicts(assignments, context)
+            return sorted(c.assignment_ids[0] for c in conflicts if c.violated_constraints)
+
+        assert flagged() == []
+        assignments[2].resource = rooms["Room1"]
+        assert flagged() == ["a0", "a1", "a2"]
+        assignments[2].resource = rooms["Room2"]
+        assert flagged() == []
+
+    def test_constraints_are_checked_in_batches(self):
+        """Each constraint gets one check_batch call per pass, in schedule order."""
+        detector = ConflictDetector()
+        constraint = _EveningConstraint()
+        context = _make_context([], [constraint])
+        assignments = [
+            _make_assignment(f"a{i}", minutes, 60, request_id=f"r{i}", assigned_resources=[])
+            for i, minutes in enumerate([0, 600, 60, 480])
+        ]
+
+        conflicts = detector._detect_constraint_violations(assignments, context)
+
+        assert constraint.batch_calls == 1
+        assert [c.assignment_ids for c in conflicts] == [["a1"], ["a3"]]
+        assert conflicts[0].conflict_id == "constraint_violation_soft.no_evening_a1"
+
+    def test_no_constraints_skips_checks(self):
+        """Without constraints no assignment is visited or cached."""
+        detector = ConflictDetector()
+
+        assert detector._detect_constraint_violations([object()], _make_context()) == []
+        assert detector._check_cache == {}
+
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=300),
+                st.sampled_from(["Room1", "Room2", "Room3"]),
+                st.sampled_from(["prof_a", "prof_b", None]),
+            ),
+            min_size=1,
+            max_size=15,
+        ),
+        st.data(),
+    )
+    def test_detect_around_matches_full_pass(self, slots, data):
+        """Local re-detection finds every full-pass conflict touching the changed assignments."""
+        detector = ConflictDetector()
+        requests = []
+        assignments = []
+        for i, (start, room, teacher) in enumerate(slots):
+            requests.append(SimpleNamespace(id=f"r{i}", teacher_id=teacher))
+            assignments.append(
+                _make_assignment(
+                    f"a{i}",
+                    start,
+                    60,
+                    request_id=f"r{i}",
+                    resource=SimpleNamespace(id=room),
+                    assigned_resources=[[room]],
+                )
+            )
+        context = _make_context(requests)
+        changed = data.draw(st.sets(st.sampled_from([a.id for a in assignments])))
+
+        full = {c.conflict_id: c for c in detector.detect_all_conflicts(assignments, context)}
+        local = {c.conflict_id: c for c in detector.detect_around(changed, assignments, context)}
+
+        assert set(local) <= set(full)
+        for conflict_id, conflict in full.items():
+            if changed & set(conflict.assignment_ids):
+                assert conflict_id in local
+        everything = detector.detect_around([a.id for a in assignments], assignments, context)
+        assert {c.conflict_id for c in everything} == set(full)
+
+
+class TestConflictBatch:
+    """Tests for lazily built conflict batches."""
+
+    def test_overlaps_are_built_on_access(self):
+        """Overlap entries become Conflict objects only when read, and only once."""
+        batch = ConflictBatch()
+        a1, a2 = _make_assignment("a1", 0, 60), _make_assignment("a2", 30, 60)
+        batch.add_overlap("student", "s1", 0, 1, a1, a2)
+        batch.add_overlap("resource", "Room1", 0, 1, a1, a2)
+
+        assert len(batch) == 2
+        assert batch._conflicts == [None, None]
+        assert batch.order_by_severity() == [1, 0]
+        assert batch.conflict_ids() == ["student_conflict_s1_0_1", "resource_conflict_Room1_0_1"]
+        assert batch._conflicts == [None, None]
+
+        conflict = batch[-1]
+        assert conflict.conflict_id == "resource_conflict_Room1_0_1"
+        assert conflict.conflict_type == ConflictType.RESOURCE_DOUBLE_BOOKING
+        assert conflict.assignment_ids == ["a1", "a2"]
+        assert batch[1] is conflict
+        assert batch._conflicts[0] is None
+
+
+class TestConflictResolver:
+    """Tests for conflict resolution strategies."""
+
+    def test_reassigns_double_booking(self):
+        """The default strategy order moves one session to the free room."""
+        assignments, context = _make_double_booking()
+        resolver = ConflictResolver()
+        conflicts = resolver.detector.detect_all_conflicts(assignments, context)
+
+        result = resolver.resolve_conflicts(conflicts, assignments, context)
+
+        assert result.success
+        assert result.resolution_strategy == ResolutionStrategy.REASSIGN
+        assert result.resolved_conflicts == ["resource_conflict_Room1_0_1"]
+        assert sorted(a.resource.id for a in assignments) == ["Room1", "Room2"]
+        assert len(result.new_conflicts) == 0
+
+    def test_removal_compacts_assignments(self):
+        """Removing the lowest-priority session leaves no holes in the list."""
+        assignments, context = _make_double_booking()
+        resolver = ConflictResolver()
+        conflicts = resolver.detector.detect_all_conflicts(assignments, context)
+        for conflict in conflicts:
+            conflict.suggested_strategies.append(ResolutionStrategy.REMOVE_VIOLATION)
+
+        result = resolver.resolve_conflicts(
+            conflicts, assignments, context, [ResolutionStrategy.REMOVE_VIOLATION]
+        )
+
+        assert result.success
+        assert result.resolution_details["assignment_id"] == "a0"
+        assert [a.id for a in assignments] == ["a1"]
+
+    def test_unregistered_strategy_fails(self):
+        """Suggested strategies without a handler leave the conflict unresolved."""
+        assignments, context = _make_double_booking()
+        resolver = ConflictResolver()
+        conflicts = resolver.detector.detect_all_conflicts(assignments, context)
+
+        result = resolver.resolve_conflicts(
+            conflicts, assignments, context, [ResolutionStrategy.ADJUST_DURATION]
+        )
+
+        assert not result.success
+        assert result.remaining_conflicts == ["resource_conflict_Room1_0_1"]
+
+
+class TestAutomatedResolver:
+    """Tests for learned resolution strategies."""
+
+    def test_remembers_successful_strategy(self):
+        """A resolved conflict records its strategy under the conflict's pattern."""
+        assignments, context = _make_double_booking()
+        resolver = AutomatedResolver()
+        conflicts = resolver.resolver.detector.detect_all_conflicts(assignments, context)
+
+        result = resolver.auto_resolve(conflicts, assignments, context)
+
+        assert result.success
+        assert result.resolved_conflicts == ["resource_conflict_Room1_0_1"]
+        assert resolver.success_patterns == {
+            "resource_double_booking_2": {ResolutionStrategy.REASSIGN: 1}
+        }
+        assert resolver.resolution_history[-1]["resolved_count"] == 1
+
+    def test_prefers_most_successful_strategy(self):
+        """Learned strategies are counted and the least recently used pattern is evicted."""
+        resolver = AutomatedResolver()
+        for strategy in [
+            ResolutionStrategy.REASSIGN,
+            ResolutionStrategy.REMOVE_VIOLATION,
+            ResolutionStrategy.REMOVE_VIOLATION,
+        ]:
+            resolver._record_success("p1", strategy)
+
+        assert resolver._preferred_strategy("p1") == ResolutionStrategy.REMOVE_VIOLATION
+        assert resolver._preferred_strategy("p2") is None
+
+        with patch("edusched.solvers.conflict_resolver._SUCCESS_PATTERN_LIMIT", 2):
+            resolver._record_success("p2", ResolutionStrategy.REASSIGN)
+            resolver._preferred_strategy("p1")
+            resolver._record_success("p3", ResolutionStrategy.REASSIGN)
+
+        assert list(resolver.success_patterns) == ["p1", "p3"]
+
+    def test_replays_plan_for_identical_input(self):
+        """Re-resolving an identical schedule runs only the recorded strategies."""
+        assignments, context = _make_double_booking()
+        resolver = AutomatedResolver()
+        conflicts = resolver.resolver.detector.detect_all_conflicts(assignments, context)
+        orders = []
+        resolve = resolver.resolver.resolve_conflicts
+
+        def spy(conflicts, assignments, context, strategy_order=None):
+            orders.append(strategy_order)
+            return resolve(conflicts, assignments, context, strategy_order)
+
+        resolver.resolver.resolve_conflicts = spy
+        resolver.auto_resolve(conflicts, assignments, context)
+        for assignment in assignments:
+            assignment.resource = context.resource_lookup["Room1"]
+            assignment.assigned_resources = [["Room1"]]
+        resolver.success_patterns.clear()
+        result = resolver.auto_resolve(conflicts, assignments, context)
+
+        assert result.resolved_conflicts == ["resource_conflict_Room1_0_1"]
+        assert orders == [None]
+        assert sorted(a.resource.id for a in assignments) == ["Room1", "Room2"]
+        assert sorted(r for a in assignments for ids in a.assigned_resources for r in ids) == ["Room1", "Room2"]
+        assert resolver.success_patterns == {"resource_double_booking_2": {ResolutionStrategy.REASSIGN: 1}}
+        assert len(resolver.resolver.detector.detect_all_conflicts(assignments, context)) == 0
+
+    def test_replay_rolls_back_when_verification_fails(self):
+        """A replay that leaves unexpected conflicts is undone and the conflicts are resolved afresh."""
+        assignments, context = _make_double_booking()
+        resolver = AutomatedResolver()
+        conflicts = resolver.resolver.detector.detect_all_conflicts(assignments, context)
+        resolver.auto_resolve(conflicts, assignments, context)
+        for assignment in assignments:
+            assignment.resource = context.resource_lookup["Room1"]
+            assignment.assigned_resources = [["Room1"]]
+        # Enrollment is outside the cache key, but the replayed move now overfills Room2
+        for request in context.request_lookup.values():
+            request.enrollment_count = 45
+        orders = []
+        resolve = resolver.resolver.resolve_conflicts
+
+        def spy(conflicts, assignments, context, strategy_order=None):
+            orders.append(strategy_order)
+            return resolve(conflicts, assignments, context, strategy_order)
+
+        resolver.resolver.resolve_conflicts = spy
+        result = resolver.auto_resolve(conflicts, assignments, context)
+
+        assert orders == [[ResolutionStrategy.REASSIGN]]
+        assert result.remaining_conflicts == ["resource_conflict_Room1_0_1"]
+        assert [a.resource.id for a in assignments] == ["Room1", "Room1"]
+        assert [a.assigned_resources for a in assignments] == [[["Room1"]], [["Room1"]]]
+
+    def test_retries_known_failures(self):
+        """A conflict nothing resolved is attempted again once the context changes in place."""
+        assignments, context = _make_double_booking()
+        room2 = context.resource_lookup.pop("Room2")
+        resolver = AutomatedResolver()
+        conflicts = resolver.resolver.detector.detect_all_conflicts(assignments, context)
+
+        first = resolver.auto_resolve(conflicts, assignments, context)
+        context.resource_lookup["Room2"] = room2
+        second = resolver.auto_resolve(conflicts, assignments, context)
+
+        assert first.remaining_conflicts == ["resource_conflict_Room1_0_1"]
+        assert second.resolved_conflicts == ["resource_conflict_Room1_0_1"]
+
+    def test_failures_are_not_replayed(self):
+        """Failed conflicts on an unchanged schedule go through the strategies again."""
+        assignments, context = _make_double_booking()
+        del context.resource_lookup["Room2"]
+        resolver = AutomatedResolver()
+        conflicts = resolver.resolver.detector.detect_all_conflicts(assignments, context)
+        calls = []
+        resolve = resolver.resolver.resolve_conflicts
+
+        def spy(conflicts, assignments, context, strategy_order=None):
+            calls.append(strategy_order)
+            return resolve(conflicts, assignments, context, strategy_order)
+
+        resolver.resolver.resolve_conflicts = spy
+        first = resolver.auto_resolve(conflicts, assignments, context)
+        second = resolver.auto_resolve(conflicts, assignments, context)
+
+        assert first.remaining_conflicts == second.remaining_conflicts == ["resource_conflict_Room1_0_1"]
+        assert calls == [None, None]
+
+
+class TestMinCostAssignment:
+    """Tests for the Hungarian matching helper."""
+
+    @given(
+        st.integers(min_value=1, max_value=4).flatmap(
+            lambda rows: st.integers(min_value=rows, max_value=5).flatmap(
+                lambda cols: st.lists(
+                    st.lists(st.integers(min_value=0, max_value=50), min_size=cols, max_size=cols),
+                    min_size=rows,
+                    max_size=rows,
+                )
+            )
+        )
+    )
+    def test_matches_brute_force_optimum(self, cost):
+        """The matching is one-to-one and as cheap as the best permutation."""
+        matching = _min_cost_assignment(cost)
+        cols = len(cost[0])
+
+        assert len(set(matching)) == len(cost)
+        assert all(0 <= col < cols for col in matching)
+        best = min(
+            sum(cost[row][col] for row, col in enumerate(choice))
+            for choice in permutations(range(cols), len(cost))
+        )
+        assert sum(cost[row][col] for row, col in enumerate(matching)) == best
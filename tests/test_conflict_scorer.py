@@ -0,0 +1,54 @@
+"""Tests for conflict scoring and classification."""
+
+import pytest
+
+from edusched.constraints.base import Violation
+from edusched.scoring.conflict_scorer import ConflictScorer, ConflictType
+
+
+def _violation(message):
+    return Violation(constraint_type="hard.test", affected_request_id="req1", message=message)
+
+
+class TestConflictClassification:
+    """Tests for the keyword rules applied to violation messages."""
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("Room double booked", ConflictType.ROOM_DOUBLE_BOOKING),
+            ("Teacher DOUBLE booked in room 12", ConflictType.ROOM_DOUBLE_BOOKING),
+            ("teacher double booking", ConflictType.TEACHER_DOUBLE_BOOKING),
+            ("Conflict for student 12345", ConflictType.STUDENT_CONFLICT),
+            ("Enrollment exceeds room capacity", ConflictType.CAPACITY_EXCEEDED),
+            ("Projector missing", ConflictType.EQUIPMENT_MISSING),
+            ("Prerequisite CS101 not met", ConflictType.PREREQUISITE_MISSING),
+            ("Holiday schedule pattern broken", ConflictType.PATTERN_VIOLATION),
+            ("Scheduled on a holiday", ConflictType.HOLIDAY_VIOLATION),
+            ("Room is not wheelchair accessible", ConflictType.ACCESSIBILITY_VIOLATION),
+            ("Time preference not met", ConflictType.PREFERENCE_VIOLATION),
+            ("Something unexpected", ConflictType.PATTERN_VIOLATION),
+            ("", ConflictType.PATTERN_VIOLATION),
+        ],
+    )
+    def test_identify_conflict_type(self, message, expected):
+        """Rules are tried in priority order, case-insensitively."""
+        assert ConflictScorer()._identify_conflict_type("hard.test", message) is expected
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("Room double booked", "Reschedule one of the conflicting classes"),
+            ("Equipment capacity exceeded", "Use a larger room or split into multiple sections"),
+            ("PREREQUISITE missing", "Ensure prerequisites are completed or take prerequisite course first"),
+            ("Holiday pattern broken", "Adjust scheduling pattern or move to different day"),
+            ("Scheduled on a holiday", "Schedule on different date outside holiday period"),
+            ("Equipment not available", "Choose room with required equipment or add equipment"),
+            ("Accessibility requirement", "Select wheelchair-accessible room with required features"),
+            ("Time preference not met", "Consider alternative time if preference cannot be met"),
+            ("Student double booked", "Review constraint and adjust scheduling accordingly"),
+        ],
+    )
+    def test_suggest_resolution(self, message, expected):
+        """Resolution hints follow the same ordered keyword matching."""
+        assert ConflictScorer()._suggest_resolution(_violation(message)) == expected
@@ -116,6 +116,49 @@ class TestNoOverlapProperties:
         assert violation is not None, "Overlapping assignments should violate NoOverlap constraint"
         assert resource_id in str(violation) or violation.affected_resource_id == resource_id
 
+    @given(
+        st.lists(
+            st.tuples(
+                st.integers(min_value=0, max_value=600),
+                st.integers(min_value=0, max_value=180),
+                st.sampled_from([["room1"], ["room2"], ["room2", "room1"]]),
+            ),
+            max_size=15,
+        ),
+        st.integers(min_value=0, max_value=15),
+    )
+    def test_batch_matches_single_checks(self, slots, split):
+        """
+        check_batch reports exactly the assignments that check flags, in order.
+        """
+        base = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+        assignments = [
+            Assignment(
+                request_id=f"r{i}",
+                occurrence_index=0,
+                start_time=base + timedelta(minutes=start),
+                end_time=base + timedelta(minutes=start + duration),
+                assigned_resources={"classroom": rooms},
+            )
+            for i, (start, duration, rooms) in enumerate(slots)
+        ]
+        solution = assignments[:split]
+        constraint = NoOverlap("room1")
+        context = ConstraintContext(
+            problem=Problem(requests=[], resources=[], calendars=[], constraints=[]),
+            resource_lookup={},
+            calendar_lookup={},
+            request_lookup={},
+        )
+
+        expected = [
+            (assignment, constraint.check(assignment, solution, context))
+            for assignment in assignments
+            if constraint.check(assignment, solution, context)
+        ]
+
+        assert constraint.check_batch(assignments, solution, context) == expected
+
 
 class TestBlackoutDatesProperties:
     """Property-based tests for BlackoutDates constraint."""
@@ -324,6 +367,49 @@ class TestMinGapBetweenOccurrencesProperties:
         violation = constraint.check(close_assignment, [existing], context)
         assert violation is not None, "Assignment with insufficient gap should violate MinGapBetweenOccurrences constraint"
 
+    @given(
+        st.lists(
+            st.tuples(
+                st.sampled_from(["r1", "r2"]),
+                st.integers(min_value=0, max_value=48),
+                st.integers(min_value=1, max_value=3),
+            ),
+            max_size=10,
+        ),
+        st.integers(min_value=0, max_value=10),
+    )
+    def test_batch_matches_single_checks(self, slots, split):
+        """
+        check_batch reports exactly the assignments that check flags, in order.
+        """
+        base = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+        assignments = [
+            Assignment(
+                request_id=request_id,
+                occurrence_index=i,
+                start_time=base + timedelta(hours=start),
+                end_time=base + timedelta(hours=start + duration),
+                assigned_resources={},
+            )
+            for i, (request_id, start, duration) in enumerate(slots)
+        ]
+        solution = assignments[:split]
+        constraint = MinGapBetweenOccurrences("r1", timedelta(hours=6))
+        context = ConstraintContext(
+            problem=Problem(requests=[], resources=[], calendars=[], constraints=[]),
+            resource_lookup={},
+            calendar_lookup={},
+            request_lookup={},
+        )
+
+        expected = [
+            (assignment, constraint.check(assignment, solution, context))
+            for assignment in assignments
+            if constraint.check(assignment, solution, context)
+        ]
+
+        assert constraint.check_batch(assignments, solution, context) == expected
+
 
 class TestWithinDateRangeProperties:
     """Property-based tests for WithinDateRange constraint."""
@@ -404,6 +490,54 @@ class TestWithinDateRangeProperties:
         violation = constraint.check(late_assignment, [], context)
         assert violation is not None, "Assignment after latest date should violate WithinDateRange constraint"
 
+    @given(
+        st.lists(
+            st.tuples(
+                st.sampled_from(["r1", "r2"]),
+                st.integers(min_value=-48, max_value=48 * 9),
+                st.integers(min_value=1, max_value=3),
+            ),
+            max_size=10,
+        )
+    )
+    def test_batch_matches_single_checks(self, slots):
+        """
+        check_batch reports exactly the assignments that check flags, in order.
+        """
+        base = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+        request = SessionRequest(
+            id="r1",
+            duration=timedelta(hours=1),
+            number_of_occurrences=1,
+            earliest_date=base,
+            latest_date=base + timedelta(days=7),
+        )
+        assignments = [
+            Assignment(
+                request_id=request_id,
+                occurrence_index=i,
+                start_time=base + timedelta(hours=start),
+                end_time=base + timedelta(hours=start + duration),
+                assigned_resources={},
+            )
+            for i, (request_id, start, duration) in enumerate(slots)
+        ]
+        constraint = WithinDateRange("r1")
+        context = ConstraintContext(
+            problem=Problem(requests=[request], resources=[], calendars=[], constraints=[]),
+            resource_lookup={},
+            calendar_lookup={},
+            request_lookup={"r1": request},
+        )
+
+        expected = [
+            (assignment, constraint.check(assignment, assignments, context))
+            for assignment in assignments
+            if constraint.check(assignment, assignments, context)
+        ]
+
+        assert constraint.check_batch(assignments, assignments, context) == expected
+
 
 class TestAttributeMatchProperties:
     """Property-based tests for AttributeMatch constraint."""
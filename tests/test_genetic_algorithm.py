@@ -0,0 +1,303 @@
+"""Tests for the genetic algorithm solver backend."""
+
+import random
+from dataclasses import astuple
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from edusched.constraints.base import Constraint, Violation
+from edusched.constraints.hard_constraints import NoOverlap, WithinDateRange
+from edusched.domain.assignment import Assignment
+from edusched.domain.calendar import Calendar
+from edusched.domain.holiday_calendar import HolidayCalendar
+from edusched.domain.problem import Problem
+from edusched.domain.resource import Resource
+from edusched.domain.session_request import SessionRequest
+from edusched.domain.teacher import Teacher
+from edusched.objectives.objectives import MinimizeEveningSessions
+from edusched.solvers.genetic_algorithm import GeneticAlgorithmSolver, ScheduleIndividual
+from edusched.utils.scheduling_utils import OccurrenceSpreader, ResourceBookings
+
+
+def _make_problem(num_requests=4, num_rooms=2, holiday_calendar=True):
+    utc = ZoneInfo("UTC")
+    start = datetime(2024, 1, 8, tzinfo=utc)
+    requests = [
+        SessionRequest(
+            id=f"req{i}",
+            duration=timedelta(hours=1),
+            number_of_occurrences=2,
+            earliest_date=start,
+            latest_date=start + timedelta(days=14),
+            enrollment_count=20,
+        )
+        for i in range(num_requests)
+    ]
+    rooms = [
+        Resource(id=f"room{i}", resource_type="classroom", capacity=30) for i in range(num_rooms)
+    ]
+    return Problem(
+        requests=requests,
+        resources=rooms,
+        calendars=[Calendar(id="cal1", timezone=utc, timeslot_granularity=timedelta(minutes=30))],
+        constraints=[NoOverlap(room.id) for room in rooms]
+        + [WithinDateRange(request.id) for request in requests],
+        institutional_calendar_id="cal1",
+        holiday_calendar=(
+            HolidayCalendar(id="hc", name="Term", year=2024, excluded_weekdays={5, 6})
+            if holiday_calendar
+            else None
+        ),
+    )
+
+
+class _AlwaysViolated(Constraint):
+    """Flags every assignment, so no solution ever improves."""
+
+    def check(self, assignment, solution, context):
+        return Violation(constraint_type=self.constraint_type, affected_request_id=assignment.request_id)
+
+    def explain(self, violation):
+        return "Always violated"
+
+    @property
+    def constraint_type(self):
+        return "hard.always_violated"
+
+
+class TestGeneticAlgorithmSolver:
+    """Tests for GeneticAlgorithmSolver."""
+
+    def test_solves_without_holiday_calendar(self):
+        """A default holiday calendar is used when the problem has none."""
+        solver = GeneticAlgorithmSolver(population_size=6, max_generations=3)
+        result = solver.solve(_make_problem(holiday_calendar=False), seed=1)
+
+        assert result.backend_used == "genetic_algorithm"
+        assert result.assignments
+        assert all(a.start_time.weekday() < 5 for a in result.assignments)
+
+    def test_seeded_solve_leaves_global_random_alone(self):
+        """Seeded solves are reproducible and do not reseed the random module."""
+        solver = GeneticAlgorithmSolver(population_size=6, max_generations=3)
+        random.seed(99)
+        expected = random.random()
+
+        random.seed(99)
+        first = solver.solve(_make_problem(), seed=4)
+        second = solver.solve(_make_problem(), seed=4)
+
+        assert random.random() == expected
+        assert [astuple(a) for a in first.assignments] == [astuple(a) for a in second.assignments]
+
+    def test_indices_built_once_per_solve(self):
+        """Problem indices are built once and shared by initialization and mutation."""
+        problem = _make_problem()
+        solver = GeneticAlgorithmSolver(population_size=6, max_generations=5, mutation_rate=1.0)
+
+        with patch.object(Problem, "build_indices", autospec=True, side_effect=Problem.build_indices) as build:
+            solver.solve(problem, seed=1)
+
+        assert build.call_count == 1
+
+    def test_occurrence_dates_generated_once_per_request(self):
+        """Occurrence dates are generated once per request, however often they are reused."""
+        problem = _make_problem(num_requests=3)
+        solver = GeneticAlgorithmSolver(population_size=6, max_generations=4, mutation_rate=1.0)
+        generate = OccurrenceSpreader.generate_occurrence_dates
+
+        with patch.object(
+            OccurrenceSpreader, "generate_occurrence_dates", autospec=True, side_effect=generate
+        ) as dates:
+            solver.solve(problem, seed=1)
+            solver.solve(problem, seed=1)
+
+        assert dates.call_count == 2 * len(problem.requests)
+
+    def test_stops_after_patience_generations_without_improvement(self):
+        """A stagnating search stops early unless patience is disabled."""
+        generations = {}
+        for patience in (3, None):
+            problem = _make_problem()
+            problem.constraints.append(_AlwaysViolated())
+            solver = GeneticAlgorithmSolver(population_size=4, max_generations=30, patience=patience)
+            new_generation = GeneticAlgorithmSolver._create_new_generation
+
+            with patch.object(
+                GeneticAlgorithmSolver, "_create_new_generation", autospec=True, side_effect=new_generation
+            ) as breed:
+                result = solver.solve(problem, seed=1)
+
+            assert result.status == "partial"
+            generations[patience] = breed.call_count
+
+        assert generations == {3: 3, None: 30}
+
+    def test_candidates_respect_capacity(self):
+        """Rooms too small for a request are never candidates for it."""
+        problem = _make_problem(num_requests=2, num_rooms=2)
+        problem.resources[1].capacity = 10
+        solver = GeneticAlgorithmSolver(population_size=4, max_generations=2)
+
+        result = solver.solve(problem, seed=1)
+
+        assert solver._candidates["req0"] == {"classroom": [problem.resources[0]]}
+        assert all(a.assigned_resources == {"classroom": ["room0"]} for a in result.assignments)
+
+    def test_worker_pool_matches_in_process_fitness(self):
+        """Evaluating fitness in worker processes gives the same solution."""
+        results = [
+            GeneticAlgorithmSolver(population_size=8, max_generations=3, workers=workers).solve(
+                _make_problem(), seed=7
+            )
+            for workers in (1, 2)
+        ]
+
+        assert [astuple(a) for a in results[0].assignments] == [
+            astuple(a) for a in results[1].assignments
+        ]
+        assert results[0].status == results[1].status
+
+    def test_worker_pool_matches_in_process_on_crowded_problem(self):
+        """Same seed gives the same schedule in-process and in workers when violations abound."""
+        for seed in range(3):
+            results = [
+                GeneticAlgorithmSolver(population_size=12, max_generations=4, workers=workers).solve(
+                    _make_problem(num_requests=12, num_rooms=1), seed=seed
+                )
+                for workers in (1, 2)
+            ]
+
+            assert [astuple(a) for a in results[0].assignments] == [
+                astuple(a) for a in results[1].assignments
+            ]
+
+    def test_new_generation_is_exactly_population_size(self):
+        """Odd numbers of free slots are filled without overshooting the population."""
+        problem = _make_problem()
+        solver = GeneticAlgorithmSolver(population_size=7, max_generations=1, elite_size=2)
+        solver.solve(problem, seed=1)
+        indices = problem.build_indices()
+        context = solver._create_context(problem, indices)
+        population = solver._initialize_population(problem, context, indices)
+
+        new_population = solver._create_new_generation(population, problem, context, indices)
+
+        assert len(new_population) == 7
+        assert all(isinstance(individual, ScheduleIndividual) for individual in new_population)
+        best = max(population, key=lambda individual: individual.fitness)
+        assert new_population[0] is best
+
+    def test_crossover_takes_each_request_from_one_parent(self):
+        """Children split each request's assignments between the two parents."""
+        problem = _make_problem()
+        solver = GeneticAlgorithmSolver(population_size=4, max_generations=1)
+        solver.solve(problem, seed=1)
+        indices = problem.build_indices()
+        context = solver._create_context(problem, indices)
+        solver._rng.seed(5)
+        parent1, parent2 = (
+            ScheduleIndividual(solver._create_random_solution(problem, context, indices), problem)
+            for _ in range(2)
+        )
+
+        child1, child2 = solver._crossover(parent1, parent2, problem, context)
+
+        for request in problem.requests:
+            from1, from2, got1, got2 = (
+                [a for a in individual.assignments if a.request_id == request.id]
+                for individual in (parent1, parent2, child1, child2)
+            )
+            assert (got1, got2) in [(from1, from2), (from2, from1)]
+        assert [a.request_id for a in child1.assignments] == sorted(
+            (a.request_id for a in child1.assignments), key=solver._request_positions.get
+        )
+        for child in (child1, child2):
+            assert child.groups == solver._group_by_request(child.assignments)
+
+    def test_mutation_copies_shared_assignments(self):
+        """Mutating a child leaves its parent intact and clears the child's fitness."""
+        problem = _make_problem()
+        solver = GeneticAlgorithmSolver(population_size=4, max_generations=1, mutation_rate=1.0)
+        solver.solve(problem, seed=1)
+        indices = problem.build_indices()
+        context = solver._create_context(problem, indices)
+
+        solver._rng.seed(3)
+        parent = ScheduleIndividual(solver._create_random_solution(problem, context, indices), problem)
+        before = [astuple(a) for a in parent.assignments]
+        for _ in range(20):
+            child = ScheduleIndividual(parent.assignments[:], problem)
+            child.fitness = 0.0
+            child.groups = solver._groups_of(parent)
+            solver._mutate(child, problem, context, indices)
+            if child.fitness is None:
+                break
+
+        assert child.fitness is None
+        assert child.groups is None and child.columns is None
+        assert solver._groups_of(parent) == solver._group_by_request(parent.assignments)
+        assert [astuple(a) for a in parent.assignments] == before
+        assert sum(c is not p for c, p in zip(child.assignments, parent.assignments)) == 1
+
+    def test_teacher_buffers_block_adjacent_bookings(self):
+        """A booking blocks its room for the teacher's setup and cleanup time."""
+        problem = _make_problem(num_requests=2, num_rooms=1)
+        problem.teachers = [Teacher(id="t1", name="Smith", setup_time_minutes=5, cleanup_time_minutes=45)]
+        problem.requests[0].teacher_id = "t1"
+        indices = problem.build_indices()
+        solver = GeneticAlgorithmSolver()
+        context = solver._create_context(problem, indices)
+        solver._buffers = solver._request_buffers(problem, context)
+
+        start = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+        booked = Assignment("req0", 0, start, start + timedelta(hours=1), {"classroom": ["room0"]})
+        bookings = ResourceBookings(solver._buffers)
+        bookings.add(booked)
+
+        def candidate(minutes_after):
+            begin = booked.end_time + timedelta(minutes=minutes_after)
+            return Assignment("req1", 0, begin, begin + timedelta(hours=1))
+
+        assert not solver._is_resource_available("room0", candidate(50), context, bookings)
+        assert solver._is_resource_available("room0", candidate(60), context, bookings)
+        assert solver._is_resource_available("room1", candidate(0), context, bookings)
+
+
+class TestScheduleIndividual:
+    """Tests for ScheduleIndividual fitness."""
+
+    def test_fitness_counts_every_violation(self):
+        """Every constraint is checked and each violation costs the full penalty."""
+        problem = _make_problem(num_requests=1)
+        assignment = Assignment("req0", 0, datetime(2024, 1, 8, 9, tzinfo=ZoneInfo("UTC")),
+                                datetime(2024, 1, 8, 10, tzinfo=ZoneInfo("UTC")))
+        violated = _AlwaysViolated()
+        calls = []
+
+        def check(assignments, solution, context):
+            calls.append(len(assignments))
+            return violated.check_batch(assignments, solution, context)
+
+        individual = ScheduleIndividual([assignment], problem)
+        assert individual.calculate_fitness(None, (check, check)) == -200
+        assert calls == [1, 1]
+
+    def test_objectives_score_from_cached_columns(self):
+        """Objective scoring extracts the columns once and matches scoring the assignments."""
+        problem = _make_problem(num_requests=2)
+        problem.objectives = [MinimizeEveningSessions(weight=2.0)]
+        utc = ZoneInfo("UTC")
+        assignments = [
+            Assignment("req0", 0, datetime(2024, 1, 8, 9, tzinfo=utc), datetime(2024, 1, 8, 10, tzinfo=utc)),
+            Assignment("req1", 0, datetime(2024, 1, 8, 18, tzinfo=utc), datetime(2024, 1, 8, 19, tzinfo=utc)),
+        ]
+        individual = ScheduleIndividual(assignments, problem)
+
+        fitness = individual.calculate_fitness(None, ())
+
+        assert fitness == problem.objectives[0].score(assignments)
+        assert individual.columns.request_ids == ["req0", "req1"]
+        assert individual.columnar() is individual.columns
+
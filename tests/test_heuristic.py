@@ -0,0 +1,404 @@
+"""Tests for the greedy heuristic solver backend."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from edusched.constraints.base import Constraint, Violation
+from edusched.constraints.hard_constraints import (
+    AttributeMatch,
+    BlackoutDates,
+    NoOverlap,
+    WithinDateRange,
+)
+from edusched.domain.assignment import Assignment
+from edusched.domain.calendar import Calendar, TimeWindow
+from edusched.domain.holiday_calendar import HolidayCalendar
+from edusched.domain.problem import Problem
+from edusched.domain.resource import Resource
+from edusched.domain.session_request import SessionRequest
+from edusched.domain.teacher import Teacher
+from edusched.solvers.heuristic import _REORDER_INTERVAL, HeuristicSolver
+from edusched.utils.capacity_utils import calculate_efficiency_score
+from edusched.utils.scheduling_utils import (
+    OccurrenceSpreader,
+    ResourceBookings,
+    request_buffers,
+    to_microseconds,
+)
+
+UTC = ZoneInfo("UTC")
+START = datetime(2024, 1, 8, tzinfo=UTC)
+
+
+def _make_problem(num_requests=3, num_rooms=2, occurrences=2):
+    requests = [
+        SessionRequest(
+            id=f"req{i}",
+            duration=timedelta(hours=1),
+            number_of_occurrences=occurrences,
+            earliest_date=START,
+            latest_date=START + timedelta(days=14),
+            enrollment_count=20,
+        )
+        for i in range(num_requests)
+    ]
+    rooms = [
+        Resource(id=f"room{i}", resource_type="classroom", capacity=30) for i in range(num_rooms)
+    ]
+    return Problem(
+        requests=requests,
+        resources=rooms,
+        calendars=[Calendar(id="cal1", timezone=UTC, timeslot_granularity=timedelta(minutes=30))],
+        constraints=[NoOverlap(room.id) for room in rooms]
+        + [WithinDateRange(request.id) for request in requests],
+        institutional_calendar_id="cal1",
+        holiday_calendar=HolidayCalendar(id="hc", name="Term", year=2024, excluded_weekdays={5, 6}),
+    )
+
+
+class _AlwaysViolated(Constraint):
+    """Rejects every assignment."""
+
+    def check(self, assignment, solution, context):
+        return Violation(constraint_type=self.constraint_type, affected_request_id=assignment.request_id)
+
+    def explain(self, violation):
+        return "Always violated"
+
+    @property
+    def constraint_type(self):
+        return "hard.always_violated"
+
+
+class _RejectsResource(Constraint):
+    """Rejects every assignment that uses one resource."""
+
+    def __init__(self, resource_id):
+        self.resource_id = resource_id
+
+    def check(self, assignment, solution, context):
+        for resource_ids in assignment.assigned_resources.values():
+            if self.resource_id in resource_ids:
+                return Violation(
+                    constraint_type=self.constraint_type,
+                    affected_request_id=assignment.request_id,
+                    affected_resource_id=self.resource_id,
+                )
+        return None
+
+    def explain(self, violation):
+        return f"Resource '{violation.affected_resource_id}' is not allowed"
+
+    @property
+    def constraint_type(self):
+        return "hard.rejects_resource"
+
+
+class _RejectsEarlyStarts(Constraint):
+    """Rejects every assignment starting before 15:00, whatever its resources."""
+
+    depends_on_resources = False
+
+    def check(self, assignment, solution, context):
+        if assignment.start_time.hour < 15:
+            return Violation(constraint_type=self.constraint_type, affected_request_id=assignment.request_id)
+        return None
+
+    def explain(self, violation):
+        return "Starts before 15:00"
+
+    @property
+    def constraint_type(self):
+        return "hard.rejects_early_starts"
+
+
+def _overlaps(first, second):
+    return first.start_time < second.end_time and second.start_time < first.end_time
+
+
+class TestHeuristicSolver:
+    """Tests for HeuristicSolver."""
+
+    def test_no_room_is_double_booked(self):
+        """Sessions sharing a room never overlap, locked assignments included."""
+        problem = _make_problem(num_requests=6, num_rooms=2)
+        locked = Assignment("locked", 0, START.replace(hour=9), START.replace(hour=12),
+                            {"classroom": ["room0"]})
+        problem.locked_assignments = [locked]
+
+        result = HeuristicSolver().solve(problem, seed=1)
+
+        assert result.assignments[0] is locked
+        for i, first in enumerate(result.assignments):
+            for second in result.assignments[i + 1:]:
+                if first.assigned_resources == second.assigned_resources:
+                    assert not _overlaps(first, second)
+
+    def test_teacher_buffers_block_adjacent_bookings(self):
+        """A booking blocks its room for its teacher's setup and cleanup time."""
+        problem = _make_problem(num_requests=2, num_rooms=1)
+        problem.teachers = [Teacher(id="t1", name="Smith", setup_time_minutes=5, cleanup_time_minutes=45)]
+        problem.requests[0].teacher_id = "t1"
+        indices = problem.build_indices()
+        solver = HeuristicSolver()
+        context = solver._create_context(problem, indices)
+
+        booked = Assignment("req0", 0, START.replace(hour=9), START.replace(hour=10),
+                            {"classroom": ["room0"]})
+        bookings = ResourceBookings(request_buffers(problem.requests, context.teacher_lookup))
+        bookings.add(booked)
+
+        def candidate(minutes_after):
+            begin = booked.end_time + timedelta(minutes=minutes_after)
+            return Assignment("req1", 0, begin, begin + timedelta(hours=1))
+
+        assert not solver._is_resource_available("room0", candidate(50), context, bookings)
+        assert solver._is_resource_available("room0", candidate(60), context, bookings)
+        assert solver._is_resource_available("room1", candidate(0), context, bookings)
+
+    def test_resource_fit_checked_once_per_request(self):
+        """Attribute checks run once per request and resource, however many slots are tried."""
+        problem = _make_problem(num_requests=3, num_rooms=2, occurrences=3)
+        problem.resources[1].capacity = 10
+
+        with patch.object(Resource, "can_satisfy", autospec=True, return_value=True) as can_satisfy:
+            result = HeuristicSolver().solve(problem, seed=1)
+
+        # Once while validating the problem and once while scheduling
+        assert can_satisfy.call_count == 2 * len(problem.requests) * len(problem.resources)
+        assert all(a.assigned_resources == {"classroom": ["room0"]} for a in result.assignments)
+
+    def test_classroom_fit_ranked_once_per_request(self):
+        """Classrooms are scored for fit once per request, not on every slot."""
+        problem = _make_problem(num_requests=3, num_rooms=3, occurrences=3)
+        problem.resources[0].capacity = 60
+
+        with patch(
+            "edusched.utils.capacity_utils.calculate_efficiency_score", side_effect=calculate_efficiency_score
+        ) as score:
+            result = HeuristicSolver().solve(problem, seed=1)
+
+        assert score.call_count == len(problem.requests) * len(problem.resources)
+        assert result.assignments[0].assigned_resources == {"classroom": ["room1"]}
+
+    def test_time_slots_generated_once_per_request(self):
+        """A request's times of day are generated once and reused on every date."""
+        problem = _make_problem(num_requests=4, num_rooms=1, occurrences=3)
+        solver = HeuristicSolver()
+        generate = OccurrenceSpreader.daily_slot_offsets
+
+        with patch.object(
+            OccurrenceSpreader, "daily_slot_offsets", autospec=True, side_effect=generate
+        ) as offsets:
+            solver.solve(problem, seed=1)
+
+        requested = [call.args[1].id for call in offsets.call_args_list]
+        assert sorted(requested) == sorted(request.id for request in problem.requests)
+        assert len(solver._slots) > len(problem.requests)
+        requests = {request.id: request for request in problem.requests}
+        for (request_id, schedule_date), slots in solver._slots.items():
+            assert [(start, end) for start, end, _ in slots] == solver.spreader.generate_time_slots(
+                schedule_date, requests[request_id], timedelta(minutes=30), UTC
+            )
+            assert all(times == (to_microseconds(start), to_microseconds(end)) for start, end, times in slots)
+
+    def test_rejecting_constraints_move_to_the_front(self):
+        """A constraint that rejects most candidates is checked first after a re-sort."""
+        problem = _make_problem(num_requests=1, num_rooms=1, occurrences=1)
+        passing = _RejectsResource("room1")
+        rejecting = _AlwaysViolated()
+        problem.constraints += [passing, rejecting]
+        solver = HeuristicSolver()
+        solver.solve(problem, seed=1)
+        context = solver._create_context(problem, problem.build_indices())
+        candidate = Assignment("req0", 0, START.replace(hour=9), START.replace(hour=10),
+                               {"classroom": ["room0"]})
+
+        for _ in range(2 * _REORDER_INTERVAL):
+            assert solver._check_constraints(candidate, [], context) is not None
+
+        assert solver._constraint_stats[0].constraint is rejecting
+        checks = {id(stats.constraint): stats.checks for stats in solver._constraint_stats}
+        assert checks[id(passing)] < checks[id(rejecting)]
+
+    def test_one_tentative_assignment_per_occurrence(self):
+        """Candidate slots reuse one tentative assignment; accepted ones are copied out."""
+        problem = _make_problem(num_requests=4, num_rooms=1, occurrences=2)
+        post_init = Assignment.__post_init__
+
+        with patch.object(Assignment, "__post_init__", autospec=True, side_effect=post_init) as created:
+            result = HeuristicSolver().solve(problem, seed=1)
+
+        assert len(result.assignments) == 8
+        assert created.call_count == 2 * len(result.assignments)
+        assert len({id(a) for a in result.assignments}) == len(result.assignments)
+        assert len({(a.start_time, a.end_time) for a in result.assignments}) == len(result.assignments)
+
+    def test_rooms_are_not_booked_during_their_blackouts(self):
+        """A room's availability calendar keeps sessions out of its blackout periods."""
+        problem = _make_problem(num_requests=3, num_rooms=2)
+        blackout = TimeWindow(START, START + timedelta(days=3))
+        problem.calendars.append(Calendar(id="room0_cal", timezone=UTC, blackout_periods=[blackout]))
+        problem.resources[0].availability_calendar_id = "room0_cal"
+
+        result = HeuristicSolver().solve(problem, seed=1)
+
+        assert result.assignments
+        for assignment in result.assignments:
+            if assignment.assigned_resources == {"classroom": ["room0"]}:
+                assert assignment.start_time >= blackout.end
+
+    def test_alternate_resources_tried_when_constraints_reject_a_resource(self):
+        """A slot whose best room is rejected is taken with the next free room instead."""
+        problem = _make_problem(num_requests=1, num_rooms=2, occurrences=1)
+        problem.resources[1].capacity = 60
+        problem.constraints.append(_RejectsResource("room0"))
+
+        result = HeuristicSolver().solve(problem, seed=1)
+        unconstrained = HeuristicSolver().solve(
+            _make_problem(num_requests=1, num_rooms=2, occurrences=1), seed=1
+        )
+
+        assert unconstrained.assignments[0].assigned_resources == {"classroom": ["room0"]}
+        assert result.assignments[0].assigned_resources == {"classroom": ["room1"]}
+        assert result.assignments[0].start_time == unconstrained.assignments[0].start_time
+
+    def test_saturation_ordering_places_constrained_requests_first(self):
+        """The request that fits only one room is scheduled before flexible ones take it."""
+        results = {}
+        for ordering in ("priority", "saturation"):
+            problem = _make_problem(num_requests=10, num_rooms=2, occurrences=1)
+            problem.resources[1].capacity = 60
+            problem.requests[-1].enrollment_count = 50
+            for request in problem.requests:
+                request.latest_date = START + timedelta(hours=23)
+
+            results[ordering] = HeuristicSolver(ordering=ordering).solve(problem, seed=1)
+
+        assert "req9" in results["priority"].unscheduled_requests
+        assert "req9" not in results["saturation"].unscheduled_requests
+        assert len(results["saturation"].assignments) == len(results["priority"].assignments)
+
+    def test_requests_no_resource_fits_skip_slot_search(self):
+        """A request that no resource can host is left unscheduled without trying slots."""
+        problem = _make_problem(num_requests=2, num_rooms=2)
+        problem.requests[1].enrollment_count = 500
+        solver = HeuristicSolver()
+        slots_for = HeuristicSolver._slots_for
+
+        with patch.object(HeuristicSolver, "_slots_for", autospec=True, side_effect=slots_for) as slots:
+            result = solver.solve(problem, seed=1)
+
+        assert result.unscheduled_requests == ["req1"]
+        assert {call.args[2].id for call in slots.call_args_list} == {"req0"}
+        assert solver._candidates["req1"] == {}
+
+    def test_overlap_constraints_left_to_bookings(self):
+        """NoOverlap is not re-checked per candidate unless a buffer is negative."""
+        problem = _make_problem(num_requests=6, num_rooms=2)
+        solver = HeuristicSolver()
+        solver.solve(problem, seed=1)
+
+        checked = [stats.constraint for stats in solver._slot_stats + solver._constraint_stats]
+        assert not any(isinstance(constraint, NoOverlap) for constraint in checked)
+        assert len(checked) == len(problem.requests)
+
+        buffers = {"req0": (-60_000_000, 0)}
+        assert solver._constraints_to_check(problem.constraints, buffers) == problem.constraints
+
+    def test_time_independent_constraints_checked_once_per_resources(self):
+        """Constraints on the request and resources alone run once per room, not per slot."""
+        problem = _make_problem(num_requests=3, num_rooms=2, occurrences=3)
+        rejecting = _RejectsResource("room0")
+        rejecting.depends_on_time = False
+        problem.constraints = [rejecting] + problem.constraints
+        problem.constraints += [AttributeMatch(request.id) for request in problem.requests]
+        check = _RejectsResource.check
+
+        with patch.object(_RejectsResource, "check", autospec=True, side_effect=check) as rejects:
+            result = HeuristicSolver().solve(problem, seed=1)
+
+        assert len(result.assignments) == 9
+        assert all(a.assigned_resources == {"classroom": ["room1"]} for a in result.assignments)
+        assert rejects.call_count == 2 * len(problem.requests)
+
+    def test_passed_time_only_checks_are_reused(self):
+        """A slot that passed a blackout check is not checked again for later requests."""
+        problem = _make_problem(num_requests=4, num_rooms=4, occurrences=2)
+        blackout = TimeWindow(START, START + timedelta(days=2))
+        problem.calendars[0].blackout_periods = [blackout]
+        problem.constraints.append(BlackoutDates("cal1"))
+        checked = []
+        is_available = Calendar.is_available
+
+        def record(calendar, start, end):
+            available = is_available(calendar, start, end)
+            checked.append(((start, end), available))
+            return available
+
+        with patch.object(Calendar, "is_available", autospec=True, side_effect=record):
+            result = HeuristicSolver().solve(problem, seed=1)
+
+        assert len(result.assignments) == 8
+        assert all(a.start_time >= blackout.end for a in result.assignments)
+        passed = [span for span, available in checked if available]
+        assert len(passed) == len(set(passed)) < len(result.assignments)
+
+    def test_slots_ruled_out_by_their_times_skip_the_resource_search(self):
+        """Resources are only looked up for slots that pass the time-only constraints."""
+        problem = _make_problem(num_requests=3, num_rooms=2)
+        problem.constraints.append(_RejectsEarlyStarts())
+        available_resources = HeuristicSolver._available_resources
+        looked_up = []
+
+        def lookup(self, assignment, *args):
+            # The solver reuses one scratch assignment, so record its time now
+            looked_up.append(assignment.start_time.hour)
+            return available_resources(self, assignment, *args)
+
+        with patch.object(HeuristicSolver, "_available_resources", lookup):
+            result = HeuristicSolver().solve(problem, seed=1)
+
+        assert len(result.assignments) == 6
+        assert all(a.start_time.hour >= 15 for a in result.assignments)
+        assert looked_up and min(looked_up) >= 15
+
+    def test_constraints_of_other_requests_are_skipped(self):
+        """Each request only checks the constraints that apply to it."""
+        problem = _make_problem(num_requests=3, num_rooms=2)
+        solver = HeuristicSolver()
+        solver.solve(problem, seed=1)
+
+        for request in problem.requests:
+            slot_stats, candidate_stats = solver._stats_for(request.id)
+            assert [stats.constraint for stats in slot_stats] == [
+                c for c in problem.constraints if isinstance(c, WithinDateRange) and c.request_id == request.id
+            ]
+            assert candidate_stats == []
+
+    def test_limited_resource_lookup_keeps_the_best_few(self):
+        """A limit keeps the first free resources of each type in their full-ranking order."""
+        problem = _make_problem(num_requests=1, num_rooms=6)
+        for i, room in enumerate(problem.resources):
+            room.capacity = 60 - 5 * i
+        problem.resources += [Resource(id=f"proj{i}", resource_type="projector") for i in range(5)]
+        solver = HeuristicSolver()
+        solver.solve(problem, seed=1)
+        indices = problem.build_indices()
+        context = solver._create_context(problem, indices)
+        solver._bookings = ResourceBookings({})
+        candidate = Assignment("req0", 0, START.replace(hour=9), START.replace(hour=10))
+
+        full = solver._available_resources(candidate, context, indices, solver._bookings)
+        limited = solver._available_resources(candidate, context, indices, solver._bookings, 2)
+
+        assert full["classroom"] != sorted(full["classroom"])
+        assert limited == {resource_type: ids[:2] for resource_type, ids in full.items()}
+
+    def test_unknown_ordering_is_rejected(self):
+        """Only the documented request orderings are accepted."""
+        with pytest.raises(ValueError, match="Unknown ordering"):
+            HeuristicSolver(ordering="random")
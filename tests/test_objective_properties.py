@@ -4,14 +4,17 @@ from datetime import datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
 import hypothesis.strategies as st
+import pytest
 from hypothesis import given
 
 from edusched.domain.assignment import Assignment
+from edusched.objectives.base import ColumnarAssignments, weighted_score
 from edusched.objectives.objectives import (
     SpreadEvenlyAcrossTerm,
     MinimizeEveningSessions,
     BalanceInstructorLoad,
 )
+from edusched.objectives.multi_objective import EnhancedObjectiveScorer, ObjectiveComparisonTool
 
 
 # Strategies for generating test data
@@ -93,6 +96,40 @@ class TestObjectiveProperties:
             score = objective.score([])
             assert 0 <= score <= 1, f"{objective.objective_type} returned score {score} outside [0, 1] range for empty solution"
 
+    @given(st.lists(valid_assignments(), max_size=15))
+    def test_score_columns_matches_score(self, assignments):
+        """Scoring from the columnar view gives the same result as score()."""
+        columns = ColumnarAssignments.from_assignments(assignments)
+        assert len(columns) == len(assignments)
+
+        for objective in [
+            SpreadEvenlyAcrossTerm(),
+            MinimizeEveningSessions(),
+            BalanceInstructorLoad(),
+        ]:
+            assert objective.score_columns(columns) == objective.score(assignments)
+
+    @given(
+        st.lists(valid_assignments(), max_size=15),
+        st.lists(st.floats(min_value=0, max_value=5), min_size=3, max_size=3),
+    )
+    def test_weighted_score_is_weighted_mean(self, assignments, weights):
+        """weighted_score() averages the objectives' scores by weight."""
+        objectives = [
+            SpreadEvenlyAcrossTerm(weight=weights[0]),
+            MinimizeEveningSessions(weight=weights[1]),
+            BalanceInstructorLoad(weight=weights[2]),
+        ]
+
+        combined = weighted_score(objectives, assignments)
+
+        if sum(weights) <= 0:
+            assert combined is None
+        else:
+            expected = sum(o.score(assignments) * o.weight for o in objectives) / sum(weights)
+            assert combined == pytest.approx(expected)
+        assert weighted_score([], assignments) is None
+
 
 class TestSpreadEvenlyAcrossTermProperties:
     """Property-based tests for SpreadEvenlyAcrossTerm objective."""
@@ -306,4 +343,90 @@ class TestBalanceInstructorLoadProperties:
         score = objective.score([assignment_no_instructor])
 
         # No instructors to balance should score 1.0
-        assert score == 1.0, f"No instructors should score 1.0, got {score}"
\ No newline at end of file
+        assert score == 1.0, f"No instructors should score 1.0, got {score}"
+
+class _CountingObjective:
+    """Objective stub that scores a solution by its length and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def score(self, solution):
+        self.calls += 1
+        return float(len(solution))
+
+
+class TestMultiObjectiveTools:
+    """Tests for the multi-objective comparison helpers."""
+
+    @given(st.integers(min_value=0, max_value=10), st.integers(min_value=0, max_value=10))
+    def test_compare_solutions_score_cache(self, len1, len2):
+        """Cached comparisons match uncached ones and skip repeated scoring."""
+        objective = _CountingObjective()
+        solution1 = [object()] * len1
+        solution2 = [object()] * len2
+        objectives = [(objective, 2.0)]
+
+        expected = ObjectiveComparisonTool.compare_solutions(solution1, solution2, objectives)
+        objective.calls = 0
+
+        cache = {}
+        first = ObjectiveComparisonTool.compare_solutions(solution1, solution2, objectives, cache)
+        second = ObjectiveComparisonTool.compare_solutions(solution1, solution2, objectives, cache)
+
+        assert first == expected
+        assert second == expected
+        assert objective.calls == 2
+
+    def test_compare_solutions_cache_uses_solution_keys(self):
+        """Caller-supplied keys let a long-lived cache see solutions changed in place."""
+        objective = _CountingObjective()
+        solution1, solution2 = [object()], [object()]
+        objectives = [(objective, 1.0)]
+        cache = {}
+
+        before = ObjectiveComparisonTool.compare_solutions(
+            solution1, solution2, objectives, cache, solution_keys=("s1", "s2")
+        )
+        solution1.append(object())
+        stale = ObjectiveComparisonTool.compare_solutions(
+            solution1, solution2, objectives, cache, solution_keys=("s1", "s2")
+        )
+        fresh = ObjectiveComparisonTool.compare_solutions(
+            solution1, solution2, objectives, cache, solution_keys=("s1 v2", "s2")
+        )
+
+        assert before == stale == {"objective_0_diff": 0.0}
+        assert fresh == {"objective_0_diff": 1.0}
+        assert objective.calls == 3
+
+    @given(
+        st.lists(st.integers(min_value=0, max_value=5), min_size=1, max_size=30),
+        st.integers(min_value=0, max_value=30),
+    )
+    def test_solution_rankings_top_k(self, lengths, top_k):
+        """top_k rankings are the prefix of the full ranking."""
+        objectives = [(_CountingObjective(), 1.0)]
+        solutions = [[object()] * length for length in lengths]
+
+        full = ObjectiveComparisonTool.calculate_solution_rankings(solutions, objectives)
+        top = ObjectiveComparisonTool.calculate_solution_rankings(solutions, objectives, top_k)
+
+        assert top == full[:top_k]
+
+    def test_find_best_solution_pareto_prefers_balanced(self):
+        """The Pareto method returns the frontier member closest to the ideal point."""
+
+        class _Component:
+            def __init__(self, index):
+                self.index = index
+
+            def score(self, solution):
+                return solution[self.index]
+
+        scorer = EnhancedObjectiveScorer()
+        scorer.add_objective(_Component(0))
+        scorer.add_objective(_Component(1))
+
+        solutions = [[1.0, 0.0], [0.0, 1.0], [0.6, 0.6], [0.5, 0.5]]
+        assert scorer.find_best_solution(solutions, method="pareto") == [0.6, 0.6]
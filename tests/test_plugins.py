@@ -0,0 +1,182 @@
+"""Tests for the plugin registry, loader and manager."""
+
+import json
+import sys
+import textwrap
+
+import pytest
+
+from edusched.plugins.base import (
+    ConstraintPlugin,
+    PluginLoader,
+    PluginManager,
+    PluginMetadata,
+    PluginRegistry,
+    SolverPlugin,
+)
+
+PLUGIN_SOURCE = textwrap.dedent(
+    """
+    from edusched.plugins.base import ConstraintPlugin, PluginMetadata
+
+    {prelude}
+
+    class _Plugin(ConstraintPlugin):
+        def get_metadata(self):
+            return PluginMetadata(
+                name={name!r},
+                version="1.0.0",
+                author="Tests",
+                description="Test plugin",
+                plugin_type="constraint",
+                compatibility=">=0.1.0",
+            )
+
+        def validate(self):
+            return True
+
+        def get_constraint_class(self):
+            return {constraint_class}
+
+    def get_plugin():
+        return _Plugin()
+    """
+)
+
+
+def _write_plugin(directory, filename, name, prelude="", constraint_class="object"):
+    path = directory / filename
+    path.write_text(PLUGIN_SOURCE.format(prelude=prelude, name=name, constraint_class=constraint_class))
+    return path
+
+
+def _make_plugin(name, plugin_type="constraint"):
+    base = ConstraintPlugin if plugin_type == "constraint" else SolverPlugin
+
+    class _Plugin(base):
+        def get_metadata(self):
+            return PluginMetadata(name, "1.0.0", "Tests", "Test plugin", plugin_type, ">=0.1.0")
+
+        def validate(self):
+            return True
+
+        def get_constraint_class(self):
+            return object
+
+        def get_solver_class(self):
+            return object
+
+    return _Plugin()
+
+
+@pytest.fixture
+def clean_plugin_modules():
+    """Drop plugin modules loaded by a test so names can be reused."""
+    before = set(sys.modules)
+    yield
+    for name in set(sys.modules) - before:
+        if name.startswith("edusched_plugins.") or name == "helpers":
+            del sys.modules[name]
+
+
+@pytest.mark.usefixtures("clean_plugin_modules")
+class TestPluginLoader:
+    """Tests for loading plugins from a directory."""
+
+    def test_loads_plugins_in_filename_order(self, tmp_path):
+        """Every plugin file is registered under its namespaced module name."""
+        _write_plugin(tmp_path, "b_plugin.py", "second")
+        _write_plugin(tmp_path, "a_plugin.py", "first")
+        (tmp_path / "__init__.py").write_text("")
+        registry = PluginRegistry()
+
+        assert PluginLoader(registry).load_from_directory(str(tmp_path)) == 2
+        assert list(registry.get_all_plugins()) == ["first", "second"]
+        assert "edusched_plugins.a_plugin" in sys.modules
+        assert str(tmp_path) not in sys.path
+
+    def test_plugin_does_not_shadow_installed_modules(self, tmp_path):
+        """A plugin file named like a stdlib module leaves that module in place."""
+        _write_plugin(tmp_path, "json.py", "json_plugin")
+        registry = PluginRegistry()
+
+        assert PluginLoader(registry).load_from_directory(str(tmp_path)) == 1
+        assert sys.modules["json"] is json
+        assert "json_plugin" in registry.get_all_plugins()
+
+    def test_plugin_can_import_sibling_module(self, tmp_path):
+        """Plugin files can import helper modules from their own directory."""
+        (tmp_path / "helpers.py").write_text("class HelperConstraint:\n    pass\n")
+        _write_plugin(
+            tmp_path,
+            "uses_helper.py",
+            "uses_helper",
+            prelude="from helpers import HelperConstraint",
+            constraint_class="HelperConstraint",
+        )
+        manager = PluginManager()
+
+        manager.load_plugins_from_directory(str(tmp_path))
+        manager.enable_plugin("uses_helper")
+
+        assert manager.get_available_constraints()["uses_helper"].__name__ == "HelperConstraint"
+
+    def test_failing_plugin_keeps_existing_modules(self, tmp_path, monkeypatch):
+        """A plugin that raises neither registers nor removes a module it did not create."""
+        (tmp_path / "broken.py").write_text("raise RuntimeError('boom')\n")
+        sentinel = object()
+        monkeypatch.setitem(sys.modules, "edusched_plugins.other", sentinel)
+        registry = PluginRegistry()
+
+        assert PluginLoader(registry).load_from_directory(str(tmp_path)) == 0
+        assert "edusched_plugins.broken" not in sys.modules
+        assert sys.modules["edusched_plugins.other"] is sentinel
+
+    def test_name_taken_by_another_file_is_skipped(self, tmp_path, monkeypatch):
+        """An existing module under the plugin's name is never overwritten."""
+        _write_plugin(tmp_path, "taken.py", "taken")
+        sentinel = object()
+        monkeypatch.setitem(sys.modules, "edusched_plugins.taken", sentinel)
+        registry = PluginRegistry()
+
+        assert PluginLoader(registry).load_from_directory(str(tmp_path)) == 0
+        assert sys.modules["edusched_plugins.taken"] is sentinel
+
+
+class TestPluginRegistry:
+    """Tests for the registry's read-only views."""
+
+    def test_views_are_read_only_and_live(self):
+        """Getter views reject writes and reflect later registrations."""
+        registry = PluginRegistry()
+        everything = registry.get_all_plugins()
+        constraints = registry.get_plugins_by_type("constraint")
+
+        registry.register_plugin(_make_plugin("room"))
+
+        assert list(everything) == ["room"]
+        assert list(constraints) == ["room"]
+        assert registry.get_plugins_by_type("unknown") == {}
+        with pytest.raises(TypeError):
+            everything["other"] = _make_plugin("other")
+
+
+class TestPluginManager:
+    """Tests for enabling and disabling plugins."""
+
+    def test_available_classes_follow_enabled_plugins(self):
+        """Only enabled plugins of the requested type are offered."""
+        manager = PluginManager()
+        manager.register_plugin(_make_plugin("room"))
+        manager.register_plugin(_make_plugin("greedy", "solver"))
+
+        assert list(manager.get_available_constraints()) == ["room"]
+        assert list(manager.get_available_solvers()) == ["greedy"]
+
+        assert manager.disable_plugin("room")
+        assert manager.get_available_constraints() == {}
+        assert not manager.disable_plugin("room")
+
+        assert manager.enable_plugin("room")
+        assert list(manager.get_available_constraints()) == ["room"]
+        assert manager.get_available_objectives() == {}
@@ -276,6 +276,7 @@ class TestProblemProperties:
         for request in requests:
             assert request.id in indices.request_lookup, f"Request {request.id} should be in lookup"
             assert request.id in indices.qualified_resources, f"Request {request.id} should have qualified resources"
+            assert request.id in indices.request_index, f"Request {request.id} should be indexed"
 
         for resource in resources:
             assert resource.id in indices.resource_lookup, f"Resource {resource.id} should be in lookup"
@@ -290,4 +291,33 @@ class TestProblemProperties:
             assert resource.resource_type in indices.resources_by_type, \
                 f"Resource type {resource.resource_type} should be grouped"
             assert resource in indices.resources_by_type[resource.resource_type], \
-                f"Resource {resource.id} should be in its type group"
\ No newline at end of file
+                f"Resource {resource.id} should be in its type group"
+
+    @given(st.lists(valid_session_requests(), min_size=1, max_size=5), st.data())
+    def test_scheduled_mask_marks_assigned_requests(self, requests, data):
+        """
+        scheduled_mask() should flag exactly the requests that have assignments.
+        """
+        from edusched.domain.assignment import Assignment
+
+        problem = Problem(requests=requests, resources=[], calendars=[], constraints=[])
+        indices = problem.build_indices()
+        chosen = data.draw(st.lists(st.sampled_from(requests), max_size=5))
+        assignments = [
+            Assignment(
+                request_id=request.id,
+                occurrence_index=0,
+                start_time=request.earliest_date,
+                end_time=request.earliest_date + request.duration,
+            )
+            for request in chosen
+        ]
+        # Assignments of requests outside the problem are ignored
+        outside = Assignment("not_a_request", 0, requests[0].earliest_date, requests[0].latest_date)
+
+        mask = indices.scheduled_mask(assignments + [outside])
+
+        scheduled_ids = {request.id for request in chosen}
+        assert sorted(indices.request_index.values()) == list(range(len(mask)))
+        for request in problem.requests:
+            assert mask[indices.request_index[request.id]] == (request.id in scheduled_ids)
@@ -0,0 +1,91 @@
+"""Tests for report generation and export."""
+
+import json
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from edusched.domain.assignment import Assignment
+from edusched.domain.problem import Problem
+from edusched.domain.resource import Resource
+from edusched.domain.result import Result
+from edusched.reports.report_generator import ReportExporter, ReportGenerator
+
+
+def _make_assignment(request_id, start, hours, resources):
+    return Assignment(
+        request_id=request_id,
+        occurrence_index=0,
+        start_time=start,
+        end_time=start + timedelta(hours=hours),
+        assigned_resources=resources,
+    )
+
+
+def _make_problem_and_result():
+    utc = ZoneInfo("UTC")
+    base = datetime(2024, 1, 8, 9, 0, tzinfo=utc)
+    resources = [
+        Resource(id="Room1", resource_type="classroom", capacity=30),
+        Resource(id="Room2", resource_type="classroom", capacity=30),
+    ]
+    assignments = [
+        _make_assignment("CS101", base, 1, {"classroom": ["Room1"]}),
+        _make_assignment("CS102", base + timedelta(minutes=30), 1, {"classroom": ["Room1"]}),
+        _make_assignment("CS103", base + timedelta(days=1), 2, {"classroom": ["Room2"]}),
+    ]
+    problem = Problem(requests=[], resources=resources, calendars=[], constraints=[])
+    result = Result(status="feasible", assignments=assignments, unscheduled_requests=[])
+    return problem, result
+
+
+class TestReportGenerator:
+    """Tests for ReportGenerator."""
+
+    def test_comprehensive_report_contents(self):
+        """Utilization and conflicts reflect the assignments."""
+        problem, result = _make_problem_and_result()
+        report = ReportGenerator().generate_comprehensive_report(problem, result)
+
+        utilization = {r.resource_id: r for r in report.resource_utilization}
+        assert utilization["Room1"].total_time_allocated == 2.0
+        assert utilization["Room2"].total_time_allocated == 2.0
+        assert utilization["Room1"].usage_by_day == {"2024-01-08": 2.0}
+        assert utilization["Room2"].usage_by_day == {"2024-01-09": 2.0}
+
+        assert len(report.conflict_report) == 1
+        assert report.conflict_report[0].affected_requests == ["CS101", "CS102"]
+        assert report.summary.conflict_count == 1
+        assert report.summary.report_date == report.generation_time
+
+    def test_repeated_conflicts_are_folded(self):
+        """Recurring overlaps between the same requests produce one report."""
+        problem, result = _make_problem_and_result()
+        week = timedelta(days=7)
+        result.assignments.extend(
+            _make_assignment(a.request_id, a.start_time + week, 1, a.assigned_resources)
+            for a in result.assignments[:2]
+        )
+        report = ReportGenerator().generate_comprehensive_report(problem, result)
+
+        assert len(report.conflict_report) == 1
+        assert report.conflict_report[0].count == 2
+        assert report.summary.conflict_count == 2
+
+
+class TestReportExporter:
+    """Tests for ReportExporter."""
+
+    def test_export_json_round_trip(self, tmp_path):
+        """Exported JSON is valid and keeps datetimes as ISO strings."""
+        problem, result = _make_problem_and_result()
+        report = ReportGenerator().generate_comprehensive_report(problem, result)
+
+        path = tmp_path / "report.json"
+        ReportExporter().export_json(report, str(path))
+        data = json.loads(path.read_text())
+
+        assert data["report_id"] == report.report_id
+        assert data["generation_time"] == report.generation_time.isoformat()
+        assert data["summary"]["report_date"] == report.summary.report_date.isoformat()
+        assert len(data["resource_utilization"]) == 2
+        assert json.loads(report.to_json()) == data
@@ -0,0 +1,201 @@
+"""Tests for scheduling utilities shared by the solver backends."""
+
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import hypothesis.strategies as st
+from hypothesis import given
+
+from edusched.domain.assignment import Assignment
+from edusched.domain.calendar import Calendar, TimeWindow
+from edusched.domain.holiday_calendar import HolidayCalendar
+from edusched.domain.resource import Resource
+from edusched.domain.session_request import SessionRequest
+from edusched.utils.scheduling_utils import (
+    CalendarAvailability,
+    OccurrenceSpreader,
+    ResourceBookings,
+    suitable_resources,
+    to_microseconds,
+)
+
+
+class TestResourceBookings:
+    """Tests for the per-resource booking table."""
+
+    @given(
+        st.lists(
+            st.tuples(st.integers(min_value=0, max_value=600), st.integers(min_value=0, max_value=240)),
+            max_size=20,
+        ),
+        st.integers(min_value=0, max_value=600),
+        st.integers(min_value=0, max_value=240),
+        st.integers(min_value=0, max_value=20),
+    )
+    def test_is_free_matches_linear_scan(self, booked, start, duration, bulk):
+        """Sorted lookups agree with checking every booking of the resource."""
+        base = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+        bookings = ResourceBookings({})
+        assignments = [
+            Assignment("r", 0, begin, begin + timedelta(minutes=minutes), {"classroom": ["room0"]})
+            for begin, minutes in ((base + timedelta(minutes=offset), minutes) for offset, minutes in booked)
+        ]
+        # Bulk-load some bookings, then add the rest one at a time
+        bookings.extend(assignments[:bulk])
+        for assignment in assignments[bulk:]:
+            bookings.add(assignment)
+        spans = [bookings.span(assignment) for assignment in assignments]
+        assert spans == [
+            bookings.buffered_span("r", to_microseconds(a.start_time), to_microseconds(a.end_time))
+            for a in assignments
+        ]
+
+        query_start = to_microseconds(base + timedelta(minutes=start))
+        query_end = query_start + duration * 60_000_000
+        expected = not any(query_start < end and query_end > begin for begin, end in spans)
+
+        assert bookings.is_free("room0", query_start, query_end) == expected
+
+    def test_extend_matches_repeated_add(self):
+        """Bulk loading agrees with booking one assignment at a time and honours the filter."""
+        base = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+        assignments = [
+            Assignment("r", i, base + timedelta(minutes=40 * i), base + timedelta(minutes=40 * i + 30),
+                       {"classroom": [f"room{i % 2}"]})
+            for i in range(6)
+        ]
+        added, extended, filtered = (ResourceBookings({}) for _ in range(3))
+        for assignment in reversed(assignments):
+            added.add(assignment)
+        extended.extend(assignments)
+        filtered.extend(assignments, {"room1"})
+
+        for minutes in range(0, 260, 10):
+            start = to_microseconds(base + timedelta(minutes=minutes))
+            end = start + 20 * 60_000_000
+            for room in ("room0", "room1"):
+                assert extended.is_free(room, start, end) == added.is_free(room, start, end)
+            assert filtered.is_free("room0", start, end)
+            assert filtered.is_free("room1", start, end) == added.is_free("room1", start, end)
+
+
+_periods = st.lists(
+    st.tuples(st.integers(min_value=0, max_value=600), st.integers(min_value=0, max_value=240)),
+    max_size=8,
+)
+
+
+class TestSuitableResources:
+    """Tests for the attribute and capacity filter shared by the solvers."""
+
+    def _request(self, **extra):
+        start = datetime(2024, 1, 8, tzinfo=ZoneInfo("UTC"))
+        return SessionRequest(
+            id="req0",
+            duration=timedelta(hours=1),
+            number_of_occurrences=1,
+            earliest_date=start,
+            latest_date=start + timedelta(days=7),
+            enrollment_count=20,
+            **extra,
+        )
+
+    def test_filters_by_attributes_and_capacity(self):
+        """Classrooms need room for the enrollment; empty types are left out."""
+        resources_by_type = {
+            "classroom": [
+                Resource(id="tiny", resource_type="classroom", capacity=10),
+                Resource(id="unknown", resource_type="classroom"),
+                Resource(id="fits", resource_type="classroom", capacity=30),
+                Resource(id="lab", resource_type="classroom", capacity=30, attributes={"lab": True}),
+            ],
+            "projector": [Resource(id="proj", resource_type="projector")],
+        }
+
+        found = suitable_resources(self._request(), resources_by_type)
+        assert {t: [r.id for r in rs] for t, rs in found.items()} == {
+            "classroom": ["fits", "lab"],
+            "projector": ["proj"],
+        }
+
+        found = suitable_resources(self._request(required_attributes={"lab": True}), resources_by_type)
+        assert {t: [r.id for r in rs] for t, rs in found.items()} == {"classroom": ["lab"]}
+
+    def test_online_requests_skip_capacity_checks(self):
+        """Online requests take classrooms of any capacity."""
+        rooms = [Resource(id="tiny", resource_type="classroom", capacity=10)]
+
+        found = suitable_resources(self._request(modality="online"), {"classroom": rooms})
+        assert found == {"classroom": rooms}
+
+
+class TestCalendarAvailability:
+    """Tests for the sorted calendar availability index."""
+
+    @given(_periods, _periods, st.integers(min_value=0, max_value=600), st.integers(min_value=0, max_value=240))
+    def test_matches_calendar(self, windows, blackouts, start, duration):
+        """Bisected lookups agree with Calendar.is_available, overlapping periods included."""
+        base = datetime(2024, 1, 8, 9, 0, tzinfo=ZoneInfo("UTC"))
+
+        def window(offset, minutes):
+            begin = base + timedelta(minutes=offset)
+            return TimeWindow(begin, begin + timedelta(minutes=minutes))
+
+        calendar = Calendar(
+            id="cal",
+            availability_windows=[window(*period) for period in windows],
+            blackout_periods=[window(*period) for period in blackouts],
+        )
+        query = window(start, duration)
+
+        assert CalendarAvailability(calendar).is_available(
+            to_microseconds(query.start), to_microseconds(query.end)
+        ) == calendar.is_available(query.start, query.end)
+
+
+class TestOccurrenceSpreader:
+    """Tests for OccurrenceSpreader request ordering."""
+
+    def test_priority_ties_broken_by_latest_instant(self):
+        """Equal priorities put the latest deadline first, comparing instants across time zones."""
+        spreader = OccurrenceSpreader(HolidayCalendar(id="hc", name="Term", year=2024))
+        start = datetime(2024, 1, 8, tzinfo=ZoneInfo("UTC"))
+
+        def request(request_id, latest):
+            return SessionRequest(
+                id=request_id,
+                duration=timedelta(hours=1),
+                number_of_occurrences=1,
+                earliest_date=start,
+                latest_date=latest,
+            )
+
+        requests = [
+            request("utc", datetime(2024, 3, 1, 12, tzinfo=ZoneInfo("UTC"))),
+            request("tokyo", datetime(2024, 3, 1, 20, tzinfo=ZoneInfo("Asia/Tokyo"))),
+            request("same", datetime(2024, 3, 1, 7, tzinfo=ZoneInfo("America/New_York"))),
+        ]
+
+        assert [r.id for r in spreader.sort_requests_by_priority(requests)] == ["utc", "same", "tokyo"]
+
+    def test_time_slots_keep_wall_clock_times_across_dst(self):
+        """Slots start at the same local times, within the preferred window, on both sides of DST."""
+        spreader = OccurrenceSpreader(HolidayCalendar(id="hc", name="Term", year=2024))
+        eastern = ZoneInfo("America/New_York")
+        request = SessionRequest(
+            id="r",
+            duration=timedelta(hours=1, minutes=30),
+            number_of_occurrences=1,
+            earliest_date=datetime(2024, 3, 1, tzinfo=eastern),
+            latest_date=datetime(2024, 3, 31, tzinfo=eastern),
+            preferred_time_slots=[{"start": "10:00", "end": "16:00"}],
+        )
+
+        for day in (date(2024, 3, 8), date(2024, 3, 11)):
+            slots = spreader.generate_time_slots(day, request, timedelta(minutes=15), eastern)
+
+            assert [(start.strftime("%H:%M"), end.strftime("%H:%M")) for start, end in slots] == [
+                ("11:00", "12:30"),
+                ("13:00", "14:30"),
+            ]
+            assert all(start.date() == day and start.tzinfo is eastern for start, _ in slots)